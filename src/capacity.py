@@ -0,0 +1,246 @@
+# capacity.py
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from config import ConfigManager
+from database import DONE_TASK_STATUS, split_assignees
+from work_calendar import WorkCalendar, calendar_for
+
+OFFSHORE_TEAM_SUFFIXES = ("(offshore team)", "(offshore devs)")
+_ONE_DAY = np.timedelta64(1, "D")
+_ONE_WEEK = np.timedelta64(7, "D")
+
+
+@dataclass(frozen=True)
+class TeamMember:
+    """A row of the capacity matrix: one person, or a pool of interchangeable people (headcount > 1)."""
+
+    name: str
+    region: Optional[str]  # None for names outside [TEAM_MEMBERS]; they use the shared US + India calendar
+    headcount: int = 1
+    aliases: FrozenSet[str] = frozenset()  # lower-case spellings that refer to this member in assigned_to
+
+
+@dataclass(frozen=True)
+class _TaskSpan:
+    members: Tuple[int, ...]
+    start: np.datetime64
+    end: np.datetime64  # inclusive
+
+
+def team_from_config(config_manager: ConfigManager) -> List[TeamMember]:
+    """
+    Builds the team from [TEAM_MEMBERS]: the two US architects, the offshore PM and the offshore
+    developer pool, whose headcount is offshore_devs_count. Members are matched by their configured
+    name or their role (e.g. "SSA1"); "<PM name> (Offshore Team)" refers to the developer pool.
+
+    Args:
+        config_manager: Supplies the team member names.
+
+    Returns:
+        The members in display order.
+    """
+    ssa1 = config_manager.get_property("TEAM_MEMBERS", "SSA1_Name") or "SSA1"
+    sa2 = config_manager.get_property("TEAM_MEMBERS", "SA2_Name") or "SA2"
+    offshore_pm = config_manager.get_property("TEAM_MEMBERS", "Offshore_PM_Name") or "Offshore PM"
+    offshore_team = f"{offshore_pm} (Offshore Team)"
+    return [
+        TeamMember(ssa1, "US", aliases=frozenset({"ssa1", ssa1.lower()})),
+        TeamMember(sa2, "US", aliases=frozenset({"sa2", sa2.lower()})),
+        TeamMember(offshore_pm, "India", aliases=frozenset({"offshore pm", offshore_pm.lower()})),
+        TeamMember(
+            offshore_team,
+            "India",
+            headcount=max(config_manager.get_int("TEAM_MEMBERS", "Offshore_Devs_Count", 1), 1),
+            aliases=frozenset(
+                {"offshore team", "offshore devs"} | {f"{offshore_pm.lower()} {suffix}" for suffix in OFFSHORE_TEAM_SUFFIXES}
+            ),
+        ),
+    ]
+
+
+class CapacityMatrix:
+    """
+    Person x week load and capacity, both in person-days. A task loads each of its assignees with
+    one person-day per working day between its start and end (inclusive); capacity is a member's
+    working days per week, after weekends and their region's holidays, times their headcount.
+
+    load_tasks() builds the whole matrix with array operations. set_task()/update_tasks() then
+    adjust it incrementally: only the changed task's old span is subtracted and its new one added.
+    Weeks (columns) are Mondays and the range grows as tasks need it.
+    """
+
+    def __init__(self, config_manager: ConfigManager, members: Optional[List[TeamMember]] = None) -> None:
+        self._config_manager = config_manager
+        self.members: List[TeamMember] = list(members if members is not None else team_from_config(config_manager))
+        self._aliases: Dict[str, int] = {alias: index for index, member in enumerate(self.members) for alias in member.aliases}
+        self._first_week: Optional[np.datetime64] = None
+        self.load: np.ndarray = np.zeros((len(self.members), 0))
+        self.capacity: np.ndarray = np.zeros((len(self.members), 0))
+        self._tasks: Dict[int, _TaskSpan] = {}
+
+    @property
+    def week_count(self) -> int:
+        return int(self.load.shape[1])
+
+    def week_starts(self) -> List[date]:
+        """The Monday of each column."""
+        if self._first_week is None:
+            return []
+        return list((self._first_week + np.arange(self.week_count) * _ONE_WEEK).astype(object))
+
+    def utilization(self) -> np.ndarray:
+        """Load divided by capacity per member and week; NaN where a member has no working day that week."""
+        return np.divide(self.load, self.capacity, out=np.full(self.load.shape, np.nan), where=self.capacity > 0)
+
+    def holidays_in_week(self, member: int, week_start: date) -> List[date]:
+        """The holidays of a member's region that fall on weekdays of the week starting at week_start."""
+        days = (np.datetime64(week_start, "D") + np.arange(5) * _ONE_DAY).astype(object)
+        holidays = self._calendar(self.members[member]).holidays
+        return [day for day in days if day in holidays]
+
+    def member_indexes(self, assigned_to: Optional[str]) -> Tuple[int, ...]:
+        """
+        Resolves a free-text assignee list such as "SSA1, SA2" to member rows, splitting it like
+        the task_assignments table does. Names that match no team member get a row of their own.
+        """
+        indexes: List[int] = []
+        for name in split_assignees(assigned_to):
+            index = self._aliases.get(name.lower())
+            if index is None:
+                index = self._add_member(TeamMember(name, None, aliases=frozenset({name.lower()})))
+            if index not in indexes:
+                indexes.append(index)
+        return tuple(indexes)
+
+    def load_tasks(self, rows: Iterable[Any]) -> None:
+        """
+        Rebuilds the matrix from task rows (id, assigned_to, status, start_date, end_date), e.g. from
+        ProjectManagerDB.get_task_loads(). Done tasks and tasks without dates are left out.
+        """
+        self._tasks = {}
+        for row in rows:
+            span = self._span(row)
+            if span is not None:
+                self._tasks[row.id] = span
+        self._first_week = None
+        self.load = np.zeros((len(self.members), 0))
+        self.capacity = np.zeros((len(self.members), 0))
+        if not self._tasks:
+            return
+        spans = list(self._tasks.values())
+        self._ensure_weeks(min(span.start for span in spans), max(span.end for span in spans))
+        assert self._first_week is not None
+        members = np.array([member for span in spans for member in span.members], dtype=np.intp)
+        starts = np.array([span.start for span in spans for _ in span.members], dtype="datetime64[D]")
+        ends = np.array([span.end for span in spans for _ in span.members], dtype="datetime64[D]")
+        day_count = self.week_count * 7
+        # Difference array: +1 on each assignment's first day, -1 after its last; a running sum gives the daily load
+        active = np.zeros((len(self.members), day_count + 1))
+        np.add.at(active, (members, (starts - self._first_week).astype(np.intp)), 1)
+        np.add.at(active, (members, (ends - self._first_week).astype(np.intp) + 1), -1)
+        daily = np.cumsum(active[:, :day_count], axis=1) * self._working_day_masks(self._first_week, day_count)
+        self.load = daily.reshape(len(self.members), self.week_count, 7).sum(axis=2)
+
+    def set_task(self, task_id: int, assigned_to: Optional[str], status: Optional[str], start: Optional[date], end: Optional[date]) -> None:
+        """Replaces one task's contribution; a Done task or one without dates is removed."""
+        self.remove_task(task_id)
+        span = self._span_of(assigned_to, status, start, end)
+        if span is None:
+            return
+        self._tasks[task_id] = span
+        self._ensure_weeks(span.start, span.end)
+        self._apply(span, 1)
+
+    def remove_task(self, task_id: int) -> None:
+        """Takes a task's load out of the matrix, if it was counted."""
+        span = self._tasks.pop(task_id, None)
+        if span is not None:
+            self._apply(span, -1)
+
+    def update_tasks(self, rows: Iterable[Any]) -> None:
+        """Applies changed task rows (id, assigned_to, status, start_date, end_date) incrementally."""
+        for row in rows:
+            self.set_task(row.id, row.assigned_to, row.status, row.start_date, row.end_date)
+
+    def _span(self, row: Any) -> Optional[_TaskSpan]:
+        return self._span_of(row.assigned_to, row.status, row.start_date, row.end_date)
+
+    def _span_of(
+        self, assigned_to: Optional[str], status: Optional[str], start: Optional[date], end: Optional[date]
+    ) -> Optional[_TaskSpan]:
+        if status == DONE_TASK_STATUS or (start is None and end is None):
+            return None
+        members = self.member_indexes(assigned_to)
+        if not members:
+            return None
+        first = np.datetime64(start if start is not None else end, "D")
+        last = np.datetime64(end if end is not None else start, "D")
+        return _TaskSpan(members, min(first, last), max(first, last))
+
+    def _apply(self, span: _TaskSpan, sign: int) -> None:
+        """Adds (sign=1) or subtracts (sign=-1) one task's working days to its assignees' weeks."""
+        assert self._first_week is not None
+        days = np.arange(span.start, span.end + _ONE_DAY, dtype="datetime64[D]")
+        weeks = (days - self._first_week).astype(np.intp) // 7
+        for member in span.members:
+            working = self._calendar(self.members[member]).working_day_mask(days)
+            np.add.at(self.load[member], weeks, sign * working)
+
+    def _add_member(self, member: TeamMember) -> int:
+        self.members.append(member)
+        index = len(self.members) - 1
+        for alias in member.aliases:
+            self._aliases[alias] = index
+        self.load = np.vstack([self.load, np.zeros((1, self.week_count))])
+        capacity_row = np.zeros((1, self.week_count))
+        if self._first_week is not None:
+            capacity_row = self._capacity_rows([member], self._first_week, self.week_count)
+        self.capacity = np.vstack([self.capacity, capacity_row])
+        return index
+
+    def _ensure_weeks(self, start: np.datetime64, end: np.datetime64) -> None:
+        """Grows the week range (zero load in new weeks) so it covers start..end."""
+        first = self._monday(start)
+        last = self._monday(end)
+        if self._first_week is None:
+            self._first_week = first
+            self.load = np.zeros((len(self.members), int((last - first) // _ONE_WEEK) + 1))
+        else:
+            prepend = max(int((self._first_week - first) // _ONE_WEEK), 0)
+            current_last = self._first_week + (self.week_count - 1) * _ONE_WEEK
+            append = max(int((last - current_last) // _ONE_WEEK), 0)
+            if not prepend and not append:
+                return
+            self.load = np.pad(self.load, ((0, 0), (prepend, append)))
+            self._first_week = self._first_week - prepend * _ONE_WEEK
+        self.capacity = self._capacity_rows(self.members, self._first_week, self.week_count)
+
+    def _capacity_rows(self, members: List[TeamMember], first_week: np.datetime64, week_count: int) -> np.ndarray:
+        masks = self._working_day_masks(first_week, week_count * 7, members)
+        headcounts = np.array([member.headcount for member in members], dtype=float)[:, np.newaxis]
+        return masks.reshape(len(members), week_count, 7).sum(axis=2) * headcounts
+
+    def _working_day_masks(self, first_day: np.datetime64, day_count: int, members: Optional[List[TeamMember]] = None) -> np.ndarray:
+        """A (members x days) 0/1 array of working days, computed once per region."""
+        members = self.members if members is None else members
+        days = first_day + np.arange(day_count) * _ONE_DAY
+        by_region: Dict[Optional[str], np.ndarray] = {}
+        rows = []
+        for member in members:
+            if member.region not in by_region:
+                by_region[member.region] = self._calendar(member).working_day_mask(days).astype(float)
+            rows.append(by_region[member.region])
+        return np.array(rows).reshape(len(members), day_count)
+
+    def _calendar(self, member: TeamMember) -> WorkCalendar:
+        return calendar_for(self._config_manager, member.region) if member.region else calendar_for(self._config_manager)
+
+    @staticmethod
+    def _monday(day: np.datetime64) -> np.datetime64:
+        # 1970-01-01 was a Thursday, so days since epoch + 3 counts from a Monday
+        day = np.datetime64(day, "D")
+        return day - np.timedelta64((day.astype(np.int64) + 3) % 7, "D")
@@ -1,7 +1,62 @@
 # config.py
 import configparser
+import logging
 import os
-from typing import Optional, List, Tuple, Any
+from contextlib import contextmanager
+from datetime import date, datetime, time
+from typing import Optional, List, Tuple, Any, Dict, Iterator, Callable, FrozenSet, TypeVar
+
+from PySide6.QtCore import QFileSystemWatcher, QTimer
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_TIME_FORMATS = ("%I:%M %p", "%I %p", "%H:%M")
+# How often and how long to wait for a watched config file that another writer has replaced or removed
+_REWATCH_INTERVAL_MS = 200
+_REWATCH_ATTEMPTS = 50
+
+ReloadListener = Callable[[List[Tuple[str, str]]], None]
+
+
+def _parse_list(raw: Optional[str]) -> Tuple[str, ...]:
+    """Splits a comma-separated value into its non-empty, stripped items."""
+    return tuple(item.strip() for item in (raw or "").split(",") if item.strip())
+
+
+def _parse_int(raw: Optional[str]) -> Optional[int]:
+    if raw is None or not raw.strip():
+        return None
+    try:
+        return int(raw.strip())
+    except ValueError:
+        logger.warning("Ignoring non-integer config value %r", raw)
+        return None
+
+
+def _parse_date_set(raw: Optional[str]) -> FrozenSet[date]:
+    """Parses comma-separated YYYY-MM-DD dates, skipping (and logging) malformed ones."""
+    dates = set()
+    for item in _parse_list(raw):
+        try:
+            dates.add(date.fromisoformat(item))
+        except ValueError:
+            logger.warning("Ignoring malformed config date %r", item)
+    return frozenset(dates)
+
+
+def _parse_time(raw: Optional[str]) -> Optional[time]:
+    """Parses a clock time such as "9:00 AM", "9 AM" or "14:30"."""
+    if raw is None or not raw.strip():
+        return None
+    for time_format in _TIME_FORMATS:
+        try:
+            return datetime.strptime(raw.strip().upper(), time_format).time()
+        except ValueError:
+            continue
+    logger.warning("Ignoring malformed config time %r", raw)
+    return None
 
 
 class ConfigManager:
@@ -9,18 +64,32 @@ class ConfigManager:
     Manages reading from and writing to the project_config.ini file.
     This file stores dynamic data points like team member names, holidays,
     and default naming conventions for epics/tasks.
+
+    Typed accessors (get_list, get_int, get_date_set, get_time) parse a value once and serve
+    it from a cache until the value changes, either through set_property or, when the file is
+    watched, through an edit of the file on disk (e.g. by another open instance). Reload
+    listeners are told which properties such an edit changed, so views can show the new values.
     """
 
-    def __init__(self, config_file: str = "project_config.ini") -> None:
+    def __init__(self, config_file: str = "project_config.ini", watch: bool = False) -> None:
         """
         Initializes the ConfigManager.
 
         Args:
             config_file: The path to the configuration .ini file.
+            watch: Reload changed values when the file changes on disk. Needs a running Qt event loop.
         """
         self.config_file: str = config_file
         self.config: configparser.ConfigParser = configparser.ConfigParser()
+        self._batch_depth: int = 0
+        self._batch_changed: bool = False
+        self._parsed: Dict[Tuple[str, str, str], Any] = {}  # (section, key, kind) -> parsed value
+        self._reload_listeners: List[ReloadListener] = []
         self._load_config()
+        self._watcher: Optional[QFileSystemWatcher] = None
+        if watch:
+            self._watcher = QFileSystemWatcher([self.config_file])
+            self._watcher.fileChanged.connect(self._on_file_changed)
 
     def _load_config(self) -> None:
         """
@@ -69,8 +138,19 @@ class ConfigManager:
             "SSA1_Responsibilities": "Client feedback, design consensus, weekly reporting",
             "SA2_Responsibilities": "Hands-on, technical guidance",
         }
-        with open(self.config_file, "w") as f:
-            self.config.write(f)
+        self.config["DATABASE"] = {
+            "Profile": "safe",  # SQLite PRAGMA profile: safe (network shares), or for a local database balanced (WAL) or fast (no fsync)
+        }
+        self.config["SIMULATION"] = {
+            "Iterations": "10000",  # Monte Carlo runs per schedule risk simulation
+            "Workers": "0",  # Worker processes; 0 uses one per CPU core
+            "Optimistic_Percent": "80",  # Best-case task duration, as a percentage of the planned one
+            "Pessimistic_Percent": "150",  # Worst-case task duration, before the scope-change allowance
+        }
+        self.config["APPEARANCE"] = {
+            "Theme": "light",  # light or dark; switched from the Application Properties tab
+        }
+        self._save_config()
 
     def get_property(self, section: str, key: str) -> Optional[str]:
         """
@@ -85,20 +165,210 @@ class ConfigManager:
         """
         return self.config.get(section, key, fallback=None)
 
-    def set_property(self, section: str, key: str, value: Any) -> None:
+    def set_property(self, section: str, key: str, value: Any) -> bool:
         """
         Sets a property in the specified section and key.
-        Creates the section if it doesn't exist.
+        Creates the section if it doesn't exist. The file is only rewritten when the value
+        actually changes, and inside batch() only once, when the batch ends.
 
         Args:
             section: The section name in the .ini file.
             key: The key within the section.
             value: The value to set for the property. Will be converted to string.
+
+        Returns:
+            True if the stored value changed.
         """
+        text = str(value)
+        if self.config.get(section, key, fallback=None) == text:
+            return False
         if section not in self.config:
             self.config[section] = {}
-        self.config[section][key] = str(value)
-        self._save_config()
+        self.config[section][key] = text
+        self._invalidate(section, key)
+        if self._batch_depth:
+            self._batch_changed = True
+        else:
+            self._save_config()
+        return True
+
+    def set_properties(self, values: Dict[Tuple[str, str], Any]) -> bool:
+        """
+        Sets several properties with a single write of the .ini file.
+
+        Args:
+            values: Maps (section, key) to the value to set; values are converted to strings.
+
+        Returns:
+            True if any stored value changed (and the file was written).
+        """
+        changed = False
+        with self.batch():
+            for (section, key), value in values.items():
+                changed = self.set_property(section, key, value) or changed
+        return changed
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Groups property changes into one write of the .ini file, made when the outermost batch
+        ends and skipped if nothing changed. If the block raises, its changes are discarded
+        and the file is left untouched.
+
+        Example:
+            with config_manager.batch():
+                config_manager.set_property("TEAM_MEMBERS", "SSA1_Name", "Alice")
+                config_manager.set_property("TEAM_MEMBERS", "SA2_Name", "Bob")
+        """
+        outermost = self._batch_depth == 0
+        snapshot = {section: dict(self.config[section]) for section in self.config.sections()} if outermost else {}
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            if outermost:
+                self.config.clear()
+                self.config.read_dict(snapshot)
+                self._parsed.clear()
+                self._batch_changed = False
+            raise
+        finally:
+            self._batch_depth -= 1
+        if outermost and self._batch_changed:
+            self._batch_changed = False
+            self._save_config()
+
+    def get_list(self, section: str, key: str) -> Tuple[str, ...]:
+        """
+        Returns a comma-separated property as a tuple of stripped, non-empty items.
+
+        Args:
+            section: The section name in the .ini file.
+            key: The key within the section.
+
+        Returns:
+            The items, or an empty tuple if the property is missing.
+        """
+        return self._cached(section, key, "list", _parse_list)
+
+    def get_int(self, section: str, key: str, default: int = 0) -> int:
+        """
+        Returns a property as an integer.
+
+        Args:
+            section: The section name in the .ini file.
+            key: The key within the section.
+            default: Returned if the property is missing or not an integer.
+
+        Returns:
+            The parsed integer or the default.
+        """
+        value: Optional[int] = self._cached(section, key, "int", _parse_int)
+        return default if value is None else value
+
+    def get_date_set(self, section: str, key: str) -> FrozenSet[date]:
+        """
+        Returns a comma-separated list of YYYY-MM-DD dates (e.g. holidays) as a set of dates.
+        Malformed entries are skipped.
+
+        Args:
+            section: The section name in the .ini file.
+            key: The key within the section.
+
+        Returns:
+            The dates, or an empty set if the property is missing.
+        """
+        return self._cached(section, key, "date_set", _parse_date_set)
+
+    def get_time(self, section: str, key: str) -> Optional[time]:
+        """
+        Returns a property holding a clock time such as "9:00 AM" or "14:30".
+
+        Args:
+            section: The section name in the .ini file.
+            key: The key within the section.
+
+        Returns:
+            The time, or None if the property is missing or malformed.
+        """
+        return self._cached(section, key, "time", _parse_time)
+
+    def add_reload_listener(self, listener: ReloadListener) -> None:
+        """
+        Registers a callback for reload(), including the ones a watched file triggers.
+
+        Args:
+            listener: Called with the (section, key) pairs a reload changed; not called if nothing changed.
+        """
+        self._reload_listeners.append(listener)
+
+    def reload(self) -> List[Tuple[str, str]]:
+        """
+        Re-reads the .ini file, drops cached parsed values of the properties that changed and
+        notifies the reload listeners.
+
+        Returns:
+            The (section, key) pairs whose values were added, changed or removed.
+        """
+        fresh = configparser.ConfigParser()
+        try:
+            if not fresh.read(self.config_file):
+                return []  # Missing for a moment while another writer replaces the file
+        except configparser.Error as exc:
+            logger.warning("Ignoring unreadable config file %s: %s", self.config_file, exc)
+            return []
+        old_values = self._flat_items(self.config)
+        new_values = self._flat_items(fresh)
+        changed = [
+            section_key
+            for section_key in old_values.keys() | new_values.keys()
+            if old_values.get(section_key) != new_values.get(section_key)
+        ]
+        if changed:
+            self.config.clear()
+            self.config.read_dict(fresh)
+            for section, key in changed:
+                self._invalidate(section, key)
+            for listener in self._reload_listeners:
+                listener(changed)
+        return changed
+
+    def _on_file_changed(self, path: str) -> None:
+        self._rewatch(path, _REWATCH_ATTEMPTS)
+
+    def _rewatch(self, path: str, attempts_left: int) -> None:
+        """
+        Reloads a changed file, first putting it back on the watch list if it dropped off. Saving
+        through os.replace swaps the file's inode, which drops it from the list, and another
+        writer may leave it missing for a moment; then this retries until it is back.
+        """
+        if self._watcher is None:
+            return
+        if path not in self._watcher.files() and not (os.path.exists(path) and self._watcher.addPath(path)):
+            if attempts_left > 0:
+                QTimer.singleShot(_REWATCH_INTERVAL_MS, lambda: self._rewatch(path, attempts_left - 1))
+            else:
+                logger.warning("Stopped watching %s; it was not recreated", path)
+            return
+        changed = self.reload()
+        if changed:
+            logger.info("Reloaded %d changed config value(s) from %s", len(changed), path)
+
+    def _cached(self, section: str, key: str, kind: str, parse: Callable[[Optional[str]], T]) -> T:
+        """Returns the parsed value of a property, parsing it only on the first request after it changed."""
+        cache_key = (section, self.config.optionxform(key), kind)
+        if cache_key not in self._parsed:
+            self._parsed[cache_key] = parse(self.get_property(section, key))
+        return self._parsed[cache_key]  # type: ignore[no-any-return]
+
+    def _invalidate(self, section: str, key: str) -> None:
+        key = self.config.optionxform(key)
+        for cache_key in [cache_key for cache_key in self._parsed if cache_key[0] == section and cache_key[1] == key]:
+            del self._parsed[cache_key]
+
+    @staticmethod
+    def _flat_items(config: configparser.ConfigParser) -> Dict[Tuple[str, str], str]:
+        return {(section, key): value for section in config.sections() for key, value in config.items(section, raw=True)}
 
     def get_section_items(self, section: str) -> List[Tuple[str, str]]:
         """
@@ -118,6 +388,12 @@ class ConfigManager:
     def _save_config(self) -> None:
         """
         Saves the current configuration back to the .ini file.
+        The file is written to a temporary file first and then renamed over the original,
+        so a crash mid-write never leaves a truncated config behind.
         """
-        with open(self.config_file, "w") as f:
+        temp_file = f"{self.config_file}.tmp"
+        with open(temp_file, "w") as f:
             self.config.write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.config_file)
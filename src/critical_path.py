@@ -0,0 +1,347 @@
+# critical_path.py
+import heapq
+from collections import deque
+from datetime import date
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from database import DEPENDENCY_TYPES
+from work_calendar import WorkCalendar
+
+# Working-day numbers count from this Monday, so they stay comparable across loads and updates
+_ORIGIN_DATE = date(2000, 1, 3)
+_ORIGIN = np.datetime64(_ORIGIN_DATE, "D")
+_ONE_DAY = np.timedelta64(1, "D")
+
+Link = Tuple[int, str, int]  # (node, dependency type, lag in working days)
+
+
+class TaskNetwork(NamedTuple):
+    """A plain, picklable copy of a CriticalPath's graph in working days, e.g. for simulations in worker processes."""
+
+    ids: List[int]  # node -> task id
+    start_bounds: List[int]
+    durations: List[int]
+    order: List[int]  # nodes in topological order
+    predecessors: List[List[Link]]
+    successors: List[List[Link]]
+
+
+class CriticalPath:
+    """
+    Critical path of one project's task graph, in working days of a WorkCalendar.
+
+    A task may not start before its own start date (or its phase's), lasts the working days from
+    start to due date inclusive, and is further pushed out by its dependencies: FS (starts after
+    the predecessor finishes), SS (starts after it starts) and FF (finishes after it finishes),
+    each plus a lag, which may be negative. The forward pass gives every task its earliest
+    start/finish; the project finish is the latest of those; the backward pass gives the latest
+    start/finish that still meets it. Tasks without slack (float) are critical.
+
+    load() computes the whole graph with a topological sort and one pass each way. update_tasks()
+    then re-runs the passes only over the tasks downstream (forward) and upstream (backward) of the
+    changed ones, stopping wherever a value comes out unchanged.
+    """
+
+    def __init__(self, calendar: WorkCalendar) -> None:
+        self.calendar = calendar
+        self._ids: List[int] = []
+        self._nodes: Dict[int, int] = {}  # task id -> node
+        self._start_bound: List[int] = []
+        self._duration: List[int] = []
+        self._successors: List[List[Link]] = []
+        self._predecessors: List[List[Link]] = []
+        self._position: List[int] = []  # node -> position in topological order
+        self._early_start: List[int] = []
+        self._early_finish: List[int] = []
+        self._late_start: List[int] = []
+        self._late_finish: List[int] = []
+        self._critical: Set[int] = set()  # nodes
+        self._finish = 0
+
+    def load(self, tasks: Iterable[Any], dependencies: Iterable[Any]) -> None:
+        """
+        Builds and computes the graph from task rows (id, start_date, end_date) and dependency rows
+        (predecessor_id, successor_id, kind, lag_days), e.g. from ProjectManagerDB.get_schedule().
+        Dependencies on tasks that are not in tasks are ignored.
+
+        Raises:
+            ValueError: If the dependencies form a cycle.
+        """
+        rows = [(row.id, row.start_date, row.end_date) for row in tasks]
+        self._ids = [task_id for task_id, _, _ in rows]
+        self._nodes = {task_id: node for node, task_id in enumerate(self._ids)}
+        self._start_bound, self._duration = self._spans([start for _, start, _ in rows], [end for _, _, end in rows])
+        self._successors = [[] for _ in self._ids]
+        self._predecessors = [[] for _ in self._ids]
+        nodes = self._nodes
+        kinds: Set[str] = set()
+        for predecessor_id, successor_id, kind, lag_days in dependencies:
+            predecessor = nodes.get(predecessor_id)
+            successor = nodes.get(successor_id)
+            if predecessor is None or successor is None:
+                continue
+            kinds.add(kind)
+            self._successors[predecessor].append((successor, kind, lag_days))
+            self._predecessors[successor].append((predecessor, kind, lag_days))
+        for kind in kinds:
+            self._check_kind(kind)
+        self._recompute()
+
+    @property
+    def finish_date(self) -> Optional[date]:
+        """The last working day of the project as scheduled, or None without tasks."""
+        if not self._ids:
+            return None
+        return self.to_date(self._finish - 1)
+
+    def critical_task_ids(self) -> Set[int]:
+        """Tasks with no float: any slip of theirs moves the project finish."""
+        return {self._ids[node] for node in self._critical}
+
+    def is_critical(self, task_id: int) -> bool:
+        node = self._nodes.get(task_id)
+        return node is not None and node in self._critical
+
+    def total_float(self, task_id: int) -> Optional[int]:
+        """Working days the task can slip without moving the project finish, or None for unknown tasks."""
+        node = self._nodes.get(task_id)
+        return None if node is None else self._late_start[node] - self._early_start[node]
+
+    def early_dates(self, task_id: int) -> Optional[Tuple[date, date]]:
+        """The earliest (start, finish) working days of a task given its dependencies."""
+        node = self._nodes.get(task_id)
+        if node is None:
+            return None
+        return self.to_date(self._early_start[node]), self.to_date(max(self._early_finish[node] - 1, self._early_start[node]))
+
+    def network(self) -> TaskNetwork:
+        """Copies the graph, with the planned durations, for processing outside this object."""
+        return TaskNetwork(
+            ids=list(self._ids),
+            start_bounds=list(self._start_bound),
+            durations=list(self._duration),
+            order=sorted(range(len(self._ids)), key=self._position.__getitem__),
+            predecessors=[list(links) for links in self._predecessors],
+            successors=[list(links) for links in self._successors],
+        )
+
+    def to_working_day(self, day: date) -> int:
+        """The working-day number of a day (of the next working day if it is not one), as used by network()."""
+        return int(self.calendar.count(np.datetime64(_ORIGIN_DATE, "D"), np.datetime64(day, "D")))
+
+    def to_date(self, working_day: int) -> date:
+        """The date of a working-day number, as used by network() and early_dates()."""
+        result: date = self.calendar.offset(_ORIGIN, working_day).astype(object)
+        return result
+
+    def update_tasks(self, rows: Iterable[Any]) -> Set[int]:
+        """
+        Applies changed task rows (id, start_date, end_date); tasks not in the graph yet are added
+        without dependencies. Only the affected part of the graph is recomputed.
+
+        Returns:
+            The ids of the tasks that became or stopped being critical.
+        """
+        rows = list(rows)
+        if not rows:
+            return set()
+        bounds, durations = self._spans([row.start_date for row in rows], [row.end_date for row in rows])
+        changed: List[int] = []
+        for row, bound, duration in zip(rows, bounds, durations):
+            node = self._nodes.get(row.id)
+            if node is None:
+                node = self._add_node(row.id, bound, duration)
+            elif (self._start_bound[node], self._duration[node]) == (bound, duration):
+                continue
+            self._start_bound[node] = bound
+            self._duration[node] = duration
+            changed.append(node)
+        if not changed:
+            return set()
+        previous_critical = self._critical
+        touched = self._forward(changed)
+        finish = max(self._early_finish)
+        if finish != self._finish:
+            # Every task's latest finish is measured from the project finish, so all of them move
+            self._finish = finish
+            self._backward(None)
+            self._critical = {node for node in range(len(self._ids)) if self._is_critical(node)}
+        else:
+            touched |= self._backward(changed)
+            self._critical = (previous_critical - touched) | {node for node in touched if self._is_critical(node)}
+        return {self._ids[node] for node in previous_critical ^ self._critical}
+
+    def add_dependency(self, predecessor_id: int, successor_id: int, kind: str, lag_days: int) -> Set[int]:
+        """
+        Adds (or replaces) a dependency between two tasks of the graph and recomputes it.
+
+        Returns:
+            The ids of the tasks that became or stopped being critical.
+
+        Raises:
+            ValueError: If a task is unknown, kind is not a dependency type, or the dependency would close a cycle.
+        """
+        predecessor = self._nodes.get(predecessor_id)
+        successor = self._nodes.get(successor_id)
+        if predecessor is None or successor is None:
+            raise ValueError("Both tasks must belong to the scheduled project")
+        self._check_kind(kind)
+        self._successors[predecessor] = [link for link in self._successors[predecessor] if link[0] != successor]
+        self._predecessors[successor] = [link for link in self._predecessors[successor] if link[0] != predecessor]
+        self._successors[predecessor].append((successor, kind, lag_days))
+        self._predecessors[successor].append((predecessor, kind, lag_days))
+        previous_critical = self._critical
+        try:
+            self._recompute()
+        except ValueError:
+            self._successors[predecessor].pop()
+            self._predecessors[successor].pop()
+            raise
+        return {self._ids[node] for node in previous_critical ^ self._critical}
+
+    def _recompute(self) -> None:
+        """Sorts the graph topologically and runs both passes over all of it."""
+        order = self._topological_order()
+        self._position = [0] * len(order)
+        for position, node in enumerate(order):
+            self._position[node] = position
+        count = len(self._ids)
+        self._early_start = [0] * count
+        self._early_finish = [0] * count
+        self._late_start = [0] * count
+        self._late_finish = [0] * count
+        self._forward(None)
+        self._finish = max(self._early_finish, default=0)
+        self._backward(None)
+        self._critical = {node for node in range(count) if self._is_critical(node)}
+
+    def _topological_order(self) -> List[int]:
+        """Kahn's algorithm over the dependency graph."""
+        remaining = [len(predecessors) for predecessors in self._predecessors]
+        ready = deque(node for node, count in enumerate(remaining) if count == 0)
+        order: List[int] = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for successor, _, _ in self._successors[node]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    ready.append(successor)
+        if len(order) != len(self._ids):
+            cycle = sorted(self._ids[node] for node, count in enumerate(remaining) if count > 0)
+            raise ValueError(f"Task dependencies form a cycle through task(s) {', '.join(map(str, cycle[:10]))}")
+        return order
+
+    def _forward(self, changed: Optional[List[int]]) -> Set[int]:
+        """
+        Computes earliest start/finish, for all nodes (changed=None) or only downstream of the
+        changed nodes. Returns the nodes whose values changed.
+        """
+        touched: Set[int] = set()
+        for node in self._in_order(changed, self._successors, reverse=False):
+            start = self._start_bound[node]
+            duration = self._duration[node]
+            for predecessor, kind, lag in self._predecessors[node]:
+                if kind == "FS":
+                    start = max(start, self._early_finish[predecessor] + lag)
+                elif kind == "SS":
+                    start = max(start, self._early_start[predecessor] + lag)
+                else:  # FF
+                    start = max(start, self._early_finish[predecessor] + lag - duration)
+            if changed is not None and node not in changed and start == self._early_start[node]:
+                continue
+            self._early_start[node] = start
+            self._early_finish[node] = start + duration
+            touched.add(node)
+        return touched
+
+    def _backward(self, changed: Optional[List[int]]) -> Set[int]:
+        """The backward-pass counterpart of _forward, for latest start/finish."""
+        touched: Set[int] = set()
+        for node in self._in_order(changed, self._predecessors, reverse=True):
+            finish = self._finish
+            for successor, kind, lag in self._successors[node]:
+                if kind == "FS":
+                    finish = min(finish, self._late_start[successor] - lag)
+                elif kind == "SS":
+                    finish = min(finish, self._late_start[successor] - lag + self._duration[node])
+                else:  # FF
+                    finish = min(finish, self._late_finish[successor] - lag)
+            start = finish - self._duration[node]
+            if changed is not None and node not in changed and start == self._late_start[node]:
+                continue
+            self._late_finish[node] = finish
+            self._late_start[node] = start
+            touched.add(node)
+        return touched
+
+    def _in_order(self, changed: Optional[List[int]], links: List[List[Link]], reverse: bool) -> Iterable[int]:
+        """
+        Yields nodes in topological order (reversed for the backward pass): every node when changed
+        is None, otherwise the changed nodes and then neighbours of nodes the caller did not skip.
+        """
+        if changed is None:
+            yield from sorted(range(len(self._ids)), key=self._position.__getitem__, reverse=reverse)
+            return
+        sign = -1 if reverse else 1
+        seeds = set(changed)
+        heap = [(sign * self._position[node], node) for node in seeds]
+        heapq.heapify(heap)
+        queued = set(seeds)
+        while heap:
+            _, node = heapq.heappop(heap)
+            queued.discard(node)
+            before = self._state(node, reverse)
+            yield node
+            if self._state(node, reverse) == before and node not in seeds:
+                continue
+            for neighbour, _, _ in links[node]:
+                if neighbour not in queued:
+                    queued.add(neighbour)
+                    heapq.heappush(heap, (sign * self._position[neighbour], neighbour))
+
+    def _state(self, node: int, reverse: bool) -> Tuple[int, int]:
+        if reverse:
+            return self._late_start[node], self._late_finish[node]
+        return self._early_start[node], self._early_finish[node]
+
+    def _is_critical(self, node: int) -> bool:
+        return self._late_start[node] - self._early_start[node] <= 0
+
+    def _add_node(self, task_id: int, bound: int, duration: int) -> int:
+        """Appends an unconnected task; the end of the topological order is a valid place for it."""
+        node = len(self._ids)
+        self._ids.append(task_id)
+        self._nodes[task_id] = node
+        self._start_bound.append(bound)
+        self._duration.append(duration)
+        self._successors.append([])
+        self._predecessors.append([])
+        self._position.append(node)
+        for values in (self._early_start, self._early_finish, self._late_start, self._late_finish):
+            values.append(0)
+        return node
+
+    def _spans(self, starts: Sequence[Optional[date]], ends: Sequence[Optional[date]]) -> Tuple[List[int], List[int]]:
+        """
+        Converts task dates to (earliest start, duration) in working days. A task with only one
+        date lasts that day; one without dates is an unconstrained zero-length milestone.
+        """
+        # Ordinals convert to datetime64 much faster than date objects do
+        first = np.array([(start or end or _ORIGIN_DATE).toordinal() for start, end in zip(starts, ends)], dtype=np.int64)
+        last = np.array([(end or start or _ORIGIN_DATE).toordinal() for start, end in zip(starts, ends)], dtype=np.int64)
+        undated = np.array([start is None and end is None for start, end in zip(starts, ends)], dtype=bool)
+        first, last = np.minimum(first, last), np.maximum(first, last)
+        first = (first - _ORIGIN_DATE.toordinal()).astype("timedelta64[D]") + _ORIGIN
+        last = (last - _ORIGIN_DATE.toordinal()).astype("timedelta64[D]") + _ORIGIN
+        origin = np.full(first.shape, _ORIGIN)
+        bounds = self.calendar.count(origin, first)
+        durations = np.where(undated, 0, self.calendar.count(first, last + _ONE_DAY))
+        return bounds.tolist(), durations.tolist()
+
+    @staticmethod
+    def _check_kind(kind: str) -> None:
+        if kind not in DEPENDENCY_TYPES:
+            raise ValueError(f"Unknown dependency type {kind!r}; expected one of {', '.join(DEPENDENCY_TYPES)}")
@@ -1,5 +1,8 @@
 # database.py
-from sqlalchemy import create_engine, String, Text, Date, DateTime, ForeignKey
+from sqlalchemy import CompoundSelect, column, create_engine, delete, event, exists, func, insert, inspect, select, table, text, tuple_, union, update, Index, Row, Select, String, Text, Date, DateTime, ForeignKey, Integer, Float
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import (
     sessionmaker,
     declarative_base,
@@ -9,12 +12,86 @@ from sqlalchemy.orm import (
     mapped_column,
     selectinload,
 )
+import html
+import logging
+import re
+from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Callable, Optional, List, Dict, Any, NamedTuple, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
 
 # Base class for declarative models
 Base = declarative_base()
 
+# Label sets of the integer-coded columns; a label's code is its position, so code order is sort order
+TASK_STATUSES = ("To Do", "In Progress", "Done", "Blocked")  # tasks and subtasks
+TASK_PRIORITIES = ("Low", "Medium", "High")  # ORDER BY priority DESC puts High first
+WORK_STATUSES = ("Planned", "In Progress", "Completed", "On Hold")  # projects and epics
+DONE_TASK_STATUS = "Done"  # counts as finished in progress rollups
+DEPENDENCY_TYPES = ("FS", "SS", "FF")  # finish-to-start, start-to-start, finish-to-finish
+
+
+class CodedLabel(TypeDecorator[str]):
+    """
+    Stores one of a fixed set of labels as its small-integer code, so the column sorts,
+    filters and indexes as an integer while the ORM and Core rows still expose the label.
+    """
+
+    impl = Integer
+    cache_ok = True
+
+    def __init__(self, labels: Tuple[str, ...]) -> None:
+        super().__init__()
+        self.labels = labels
+        self._codes: Dict[str, int] = {label: code for code, label in enumerate(labels)}
+
+    def code(self, label: str) -> int:
+        """Returns the stored code of a label, raising ValueError for unknown labels."""
+        try:
+            return self._codes[label]
+        except KeyError:
+            raise ValueError(f"'{label}' is not one of: {', '.join(self.labels)}") from None
+
+    def process_bind_param(self, value: Optional[str], dialect: Dialect) -> Optional[int]:
+        return None if value is None else self.code(value)
+
+    def process_result_value(self, value: Optional[int], dialect: Dialect) -> Optional[str]:
+        return None if value is None else self.labels[value]
+
+
+# Named PRAGMA profiles applied to every new SQLite connection, selected by [DATABASE] Profile in project_config.ini
+SQLITE_PRAGMA_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Rollback journal with a full fsync per commit; the only profile that is safe on a network share
+    "safe": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -16000,
+        "temp_store": "DEFAULT",
+        "foreign_keys": "ON",
+    },
+    # WAL with fsync only at checkpoints; a crash may lose the last commits but never corrupts the file
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,
+        "cache_size": -64000,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+    # No fsync at all; fastest writes, but recent commits can be lost on power failure
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "mmap_size": 1073741824,
+        "cache_size": -256000,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+}
+# The shared project_plan.db may live on a network share; local, single-user setups can opt into balanced or fast
+DEFAULT_PRAGMA_PROFILE = "safe"
+
 
 class Project(Base):
     """Represents a main project."""
@@ -24,9 +101,7 @@ class Project(Base):
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     start_date: Mapped[date] = mapped_column(Date, default=date.today)
     end_date_target: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
-    status: Mapped[str] = mapped_column(
-        String, default="Planned"
-    )  # Planned, In Progress, Completed, On Hold
+    status: Mapped[str] = mapped_column(CodedLabel(WORK_STATUSES), default="Planned")
 
     # Relationships
     phases: Mapped[List["Phase"]] = relationship(
@@ -45,7 +120,7 @@ class Phase(Base):
 
     __tablename__ = "phases"
     id: Mapped[int] = mapped_column(primary_key=True)
-    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
+    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), index=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     start_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     end_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
@@ -66,12 +141,10 @@ class Epic(Base):
 
     __tablename__ = "epics"
     id: Mapped[int] = mapped_column(primary_key=True)
-    phase_id: Mapped[int] = mapped_column(ForeignKey("phases.id"))
+    phase_id: Mapped[int] = mapped_column(ForeignKey("phases.id"), index=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
-    status: Mapped[str] = mapped_column(
-        String, default="Planned"
-    )  # Planned, In Progress, Completed, On Hold
+    status: Mapped[str] = mapped_column(CodedLabel(WORK_STATUSES), default="Planned")
 
     # Relationships
     phase: Mapped["Phase"] = relationship("Phase", back_populates="epics")
@@ -87,15 +160,14 @@ class Task(Base):
     """Represents a specific task within an epic."""
 
     __tablename__ = "tasks"
+    __table_args__ = (Index("ix_tasks_status_due_date", "status", "due_date"),)
     id: Mapped[int] = mapped_column(primary_key=True)
-    epic_id: Mapped[int] = mapped_column(ForeignKey("epics.id"))
+    epic_id: Mapped[int] = mapped_column(ForeignKey("epics.id"), index=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
     assigned_to: Mapped[Optional[str]] = mapped_column(String)
-    priority: Mapped[str] = mapped_column(String, default="Medium")  # High, Medium, Low
-    status: Mapped[str] = mapped_column(
-        String, default="To Do"
-    )  # To Do, In Progress, Done, Blocked
+    priority: Mapped[str] = mapped_column(CodedLabel(TASK_PRIORITIES), default="Medium")
+    status: Mapped[str] = mapped_column(CodedLabel(TASK_STATUSES), default="To Do")
     jira_link: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     start_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     due_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
@@ -116,13 +188,11 @@ class SubTask(Base):
 
     __tablename__ = "subtasks"
     id: Mapped[int] = mapped_column(primary_key=True)
-    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id"))
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id"), index=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
     assigned_to: Mapped[Optional[str]] = mapped_column(String)
-    status: Mapped[str] = mapped_column(
-        String, default="To Do"
-    )  # To Do, In Progress, Done, Blocked
+    status: Mapped[str] = mapped_column(CodedLabel(TASK_STATUSES), default="To Do")
     completed_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
 
     # Relationships
@@ -132,10 +202,58 @@ class SubTask(Base):
         return f"<SubTask(id={self.id}, name='{self.name}', status='{self.status}')>"
 
 
+class TeamMember(Base):
+    """A person (or team) that tasks are assigned to; names are unique regardless of case."""
+
+    __tablename__ = "team_members"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(collation="NOCASE"), unique=True, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<TeamMember(id={self.id}, name='{self.name}')>"
+
+
+class TaskAssignment(Base):
+    """
+    Links a task to one of its assignees. Kept in step with Task.assigned_to, which remains the
+    display text, so per-person queries use an index instead of matching the text.
+    """
+
+    __tablename__ = "task_assignments"
+    # The primary key serves a task's assignees; this index serves a member's tasks
+    __table_args__ = (Index("ix_task_assignments_member_id_task_id", "member_id", "task_id"),)
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    member_id: Mapped[int] = mapped_column(ForeignKey("team_members.id"), primary_key=True)
+
+    def __repr__(self) -> str:
+        return f"<TaskAssignment(task_id={self.task_id}, member_id={self.member_id})>"
+
+
+class TaskDependency(Base):
+    """
+    Schedules a task relative to a predecessor: FS starts it after the predecessor finishes, SS
+    after it starts, FF finishes it after the predecessor finishes; lag_days (working days, negative
+    for a lead) is added to the constraint.
+    """
+
+    __tablename__ = "task_dependencies"
+    # The primary key serves a task's successors; this index serves its predecessors
+    __table_args__ = (Index("ix_task_dependencies_successor_id", "successor_id"),)
+    predecessor_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    successor_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    kind: Mapped[str] = mapped_column(CodedLabel(DEPENDENCY_TYPES), default="FS")
+    lag_days: Mapped[int] = mapped_column(Integer, default=0)
+
+    def __repr__(self) -> str:
+        return f"<TaskDependency({self.predecessor_id} -{self.kind}-> {self.successor_id}, lag={self.lag_days})>"
+
+
 class DailyLog(Base):
     """Stores daily project status updates."""
 
     __tablename__ = "daily_logs"
+    # (project_id, log_date) also serves lookups by project_id alone
+    __table_args__ = (Index("ix_daily_logs_project_id_log_date", "project_id", "log_date"),)
     id: Mapped[int] = mapped_column(primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
     log_date: Mapped[date] = mapped_column(Date, nullable=False, default=date.today)
@@ -155,18 +273,414 @@ class DailyLog(Base):
         return f"<DailyLog(id={self.id}, date='{self.log_date}')>"
 
 
+@dataclass
+class SubTaskSpec:
+    """Unsaved description of a subtask, used by ProjectManagerDB.add_plan."""
+
+    name: str
+    description: str = ""
+    assigned_to: Optional[str] = None
+    status: str = "To Do"
+
+
+@dataclass
+class TaskSpec:
+    """Unsaved description of a task and its subtasks, used by ProjectManagerDB.add_plan."""
+
+    name: str
+    description: str = ""
+    assigned_to: Optional[str] = None
+    priority: str = "Medium"
+    status: str = "To Do"
+    jira_link: Optional[str] = None
+    start_date: Optional[date] = None
+    due_date: Optional[date] = None
+    subtasks: List[SubTaskSpec] = field(default_factory=list)
+
+
+@dataclass
+class EpicSpec:
+    """Unsaved description of an epic and its tasks, used by ProjectManagerDB.add_plan."""
+
+    name: str
+    description: str = ""
+    status: str = "Planned"
+    tasks: List[TaskSpec] = field(default_factory=list)
+
+
+@dataclass
+class PhaseSpec:
+    """Unsaved description of a phase and its epics, used by ProjectManagerDB.add_plan."""
+
+    name: str
+    description: str = ""
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    epics: List[EpicSpec] = field(default_factory=list)
+
+
+# Free-text DailyLog columns covered by the daily_logs_fts full-text index
+DAILY_LOG_TEXT_COLUMNS = (
+    "activities_us",
+    "activities_india",
+    "blockers_us",
+    "blockers_india",
+    "decisions_made",
+    "next_steps_us",
+    "next_steps_india",
+)
+# Control characters used as snippet() match markers, swapped for <b> tags after HTML-escaping
+_SNIPPET_START, _SNIPPET_END = "\x02", "\x03"
+
+
+class LogSearchHit(NamedTuple):
+    """One ranked full-text match over a project's daily logs."""
+
+    log_id: int
+    log_date: date
+    snippet_html: str  # HTML-escaped excerpt with the matched terms wrapped in <b>
+    rank: float  # bm25 score; lower is more relevant
+
+
+class ProjectDirectoryEntry(NamedTuple):
+    """Compact, childless view of a project for pickers and existence checks."""
+
+    id: int
+    name: str
+    status: str
+    start_date: date
+    end_date_target: Optional[date]
+
+
+def split_assignees(assigned_to: Optional[str]) -> List[str]:
+    """
+    Splits an assigned_to text such as "Alice, Bob" into member names, with surrounding and
+    repeated whitespace removed and case-insensitive duplicates dropped.
+    """
+    names: Dict[str, str] = {}
+    for token in (assigned_to or "").split(","):
+        name = " ".join(token.split())
+        if name:
+            names.setdefault(name.lower(), name)
+    return list(names.values())
+
+
+# Task fields that bulk_update_tasks may set
+BULK_TASK_FIELDS = ("status", "assigned_to", "start_date", "due_date")
+
+# Trigger-maintained by ProjectManagerDB._ensure_task_rollups; declared here only for querying
+epic_task_rollups = table(
+    "epic_task_rollups", column("epic_id", Integer), column("status", CodedLabel(TASK_STATUSES)), column("task_count", Integer)
+)
+
+
+@dataclass
+class PlanRollups:
+    """Task counts by status for every epic and phase of a project."""
+
+    epics: Dict[int, Dict[str, int]]  # epic_id -> {status: task count}
+    phases: Dict[int, Dict[str, int]]  # phase_id -> {status: task count}
+
+    def project_counts(self) -> Dict[str, int]:
+        """Sums the phase counts into task counts by status for the whole project."""
+        totals: Dict[str, int] = {}
+        for counts in self.phases.values():
+            for status, task_count in counts.items():
+                totals[status] = totals.get(status, 0) + task_count
+        return totals
+
+
+# Plan items whose dates shift_dates can move, together with everything below them
+SHIFTABLE_KINDS = ("phase", "epic", "task")
+# Maps dates to their shifted dates, position by position (e.g. by a number of working days)
+DateShift = Callable[[List[date]], List[date]]
+
+
+# Per-connection temporary old -> new date mapping used by ProjectManagerDB.shift_dates
+date_shifts = table("date_shifts", column("old_date", Date), column("new_date", Date))
+
+
+class DateShiftResult(NamedTuple):
+    """What ProjectManagerDB.shift_dates moved."""
+
+    phase_count: int
+    task_ids: List[int]
+
+
+@dataclass
+class ProjectSchedule:
+    """One project's tasks and their dependencies, as input for the critical path and the schedule risk simulation."""
+
+    tasks: List[Row[Any]]  # as in get_task_loads, plus name and phase_name
+    dependencies: List[Row[Any]]  # (predecessor_id, successor_id, kind, lag_days)
+
+
+@dataclass
+class PlanSnapshot:
+    """
+    Session-free rows for one project's Phase -> Epic -> Task -> SubTask hierarchy.
+    Every row carries its parent key, so the tree can be rebuilt without touching the ORM.
+    """
+
+    phases: List[Row[Any]]
+    epics: List[Row[Any]]
+    tasks: List[Row[Any]]
+    subtasks: List[Row[Any]]
+
+    def epics_by_phase(self) -> Dict[int, List[Row[Any]]]:
+        """Groups the epic rows by their phase_id."""
+        return _group_rows(self.epics, "phase_id")
+
+    def tasks_by_epic(self) -> Dict[int, List[Row[Any]]]:
+        """Groups the task rows by their epic_id."""
+        return _group_rows(self.tasks, "epic_id")
+
+    def subtasks_by_task(self) -> Dict[int, List[Row[Any]]]:
+        """Groups the subtask rows by their task_id."""
+        return _group_rows(self.subtasks, "task_id")
+
+
+def _group_rows(rows: List[Row[Any]], parent_key: str) -> Dict[int, List[Row[Any]]]:
+    """Groups rows by the value of their parent key column, preserving row order."""
+    grouped: Dict[int, List[Row[Any]]] = {}
+    for row in rows:
+        grouped.setdefault(getattr(row, parent_key), []).append(row)
+    return grouped
+
+
 class ProjectManagerDB:
     """
     Handles all database operations for the project planning application.
     Uses SQLAlchemy for ORM capabilities.
     """
 
-    def __init__(self, db_url: str = "sqlite:///project_plan.db") -> None:
+    def __init__(
+        self,
+        db_url: str = "sqlite:///project_plan.db",
+        pragma_profile: str = DEFAULT_PRAGMA_PROFILE,
+        maintain_rollups: bool = True,
+    ) -> None:
+        if pragma_profile not in SQLITE_PRAGMA_PROFILES:
+            raise ValueError(
+                f"Unknown database profile '{pragma_profile}'. Expected one of: {', '.join(SQLITE_PRAGMA_PROFILES)}"
+            )
+        self.pragma_profile: str = pragma_profile
         self.engine = create_engine(db_url)
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", self._apply_pragmas)
+        had_assignments: bool = inspect(self.engine).has_table(TaskAssignment.__tablename__)
         # Create all tables defined in Base.metadata if they don't exist
         Base.metadata.create_all(self.engine)
+        self._migrate_coded_columns()
+        self._ensure_indexes()
+        if not had_assignments:
+            self._migrate_task_assignments()
+        self.log_search_available: bool = self._ensure_log_search_index()
+        self.rollups_maintained: bool = self._ensure_task_rollups(maintain_rollups)
         self.Session = sessionmaker(bind=self.engine)
 
+    def _ensure_log_search_index(self) -> bool:
+        """
+        Creates the daily_logs_fts FTS5 index and the triggers that keep it in sync with daily_logs.
+        The index is an external-content table, so it stores only the token index, not a second
+        copy of the log text. It is rebuilt from existing rows the first time it is created.
+
+        Returns:
+            False if this SQLite build has no FTS5 support, in which case log search is disabled.
+        """
+        if self.engine.dialect.name != "sqlite":
+            return False
+        columns = ", ".join(DAILY_LOG_TEXT_COLUMNS)
+        new_values = ", ".join(f"new.{column}" for column in DAILY_LOG_TEXT_COLUMNS)
+        old_values = ", ".join(f"old.{column}" for column in DAILY_LOG_TEXT_COLUMNS)
+        try:
+            with self.engine.begin() as connection:
+                created = not connection.scalar(
+                    text("SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name = 'daily_logs_fts'")
+                )
+                connection.exec_driver_sql(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS daily_logs_fts USING fts5({columns}, content='daily_logs', content_rowid='id')"
+                )
+                connection.exec_driver_sql(
+                    f"""CREATE TRIGGER IF NOT EXISTS daily_logs_fts_ai AFTER INSERT ON daily_logs BEGIN
+                        INSERT INTO daily_logs_fts(rowid, {columns}) VALUES (new.id, {new_values});
+                    END"""
+                )
+                connection.exec_driver_sql(
+                    f"""CREATE TRIGGER IF NOT EXISTS daily_logs_fts_ad AFTER DELETE ON daily_logs BEGIN
+                        INSERT INTO daily_logs_fts(daily_logs_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                    END"""
+                )
+                connection.exec_driver_sql(
+                    f"""CREATE TRIGGER IF NOT EXISTS daily_logs_fts_au AFTER UPDATE ON daily_logs BEGIN
+                        INSERT INTO daily_logs_fts(daily_logs_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                        INSERT INTO daily_logs_fts(rowid, {columns}) VALUES (new.id, {new_values});
+                    END"""
+                )
+                if created:
+                    connection.exec_driver_sql("INSERT INTO daily_logs_fts(daily_logs_fts) VALUES ('rebuild')")
+        except OperationalError:
+            return False
+        return True
+
+    def _ensure_task_rollups(self, maintain: bool) -> bool:
+        """
+        Creates the epic_task_rollups table (task count per epic and status) and the triggers on
+        tasks that keep it current, so add_task, add_plan and update_task_status maintain
+        it incrementally. The table is rebuilt from tasks whenever the triggers are (re)created.
+        With maintain=False the triggers are dropped and rollups are computed by grouped queries.
+
+        Returns:
+            True if the rollup table is maintained and can be read by get_status_rollups.
+        """
+        if self.engine.dialect.name != "sqlite":
+            return False
+        triggers = ("tasks_rollup_ai", "tasks_rollup_ad", "tasks_rollup_au")
+        with self.engine.begin() as connection:
+            if not maintain:
+                for trigger in triggers:
+                    connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+                connection.exec_driver_sql("DROP TABLE IF EXISTS epic_task_rollups")
+                return False
+            existing = connection.scalar(
+                text("SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name IN ('tasks_rollup_ai', 'tasks_rollup_ad', 'tasks_rollup_au')")
+            )
+            if existing == len(triggers):
+                return True
+            increment = """INSERT INTO epic_task_rollups(epic_id, status, task_count) VALUES (new.epic_id, new.status, 1)
+                           ON CONFLICT(epic_id, status) DO UPDATE SET task_count = task_count + 1;"""
+            decrement = """UPDATE epic_task_rollups SET task_count = task_count - 1 WHERE epic_id = old.epic_id AND status = old.status;
+                           DELETE FROM epic_task_rollups WHERE epic_id = old.epic_id AND status = old.status AND task_count <= 0;"""
+            connection.exec_driver_sql("DROP TABLE IF EXISTS epic_task_rollups")
+            connection.exec_driver_sql(
+                """CREATE TABLE epic_task_rollups (
+                       epic_id INTEGER NOT NULL, status INTEGER NOT NULL, task_count INTEGER NOT NULL,
+                       PRIMARY KEY (epic_id, status)
+                   ) WITHOUT ROWID"""
+            )
+            connection.exec_driver_sql(f"CREATE TRIGGER IF NOT EXISTS tasks_rollup_ai AFTER INSERT ON tasks BEGIN {increment} END")
+            connection.exec_driver_sql(f"CREATE TRIGGER IF NOT EXISTS tasks_rollup_ad AFTER DELETE ON tasks BEGIN {decrement} END")
+            connection.exec_driver_sql(
+                f"""CREATE TRIGGER IF NOT EXISTS tasks_rollup_au AFTER UPDATE OF epic_id, status ON tasks
+                    WHEN old.epic_id IS NOT new.epic_id OR old.status IS NOT new.status
+                    BEGIN {decrement} {increment} END"""
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO epic_task_rollups(epic_id, status, task_count) SELECT epic_id, status, count(*) FROM tasks GROUP BY epic_id, status"
+            )
+        return True
+
+    def rebuild_log_search_index(self) -> None:
+        """Rebuilds the daily log full-text index from the daily_logs table."""
+        if not self.log_search_available:
+            raise RuntimeError("Daily log search requires SQLite with FTS5 support.")
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql("INSERT INTO daily_logs_fts(daily_logs_fts) VALUES ('rebuild')")
+
+    def _apply_pragmas(self, dbapi_connection: Any, connection_record: Any) -> None:
+        """Applies the selected PRAGMA profile to a freshly opened SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        for pragma, value in SQLITE_PRAGMA_PROFILES[self.pragma_profile].items():
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+        cursor.close()
+
+    def _migrate_coded_columns(self) -> None:
+        """
+        Converts CodedLabel columns that an older database still stores as text. Each label is
+        matched case- and whitespace-insensitively into a new INTEGER column, which then replaces
+        the text one. Unrecognised values fall back to the column default and are logged.
+        Indexes and triggers over a migrated table are dropped; _ensure_indexes and the
+        _ensure_* trigger helpers recreate them.
+        """
+        if self.engine.dialect.name != "sqlite":
+            return
+        with self.engine.begin() as connection:
+            for mapped_table in Base.metadata.sorted_tables:
+                declared = {info.name: info.type.upper() for info in connection.exec_driver_sql(f"PRAGMA table_info({mapped_table.name})")}
+                stale = [
+                    coded
+                    for coded in mapped_table.columns
+                    if isinstance(coded.type, CodedLabel) and declared.get(coded.name, "INTEGER") != "INTEGER"
+                ]
+                if not stale:
+                    continue
+                self._drop_table_dependents(connection, mapped_table.name)
+                for coded in stale:
+                    self._migrate_coded_column(connection, mapped_table.name, coded.name, coded.type, coded.default.arg)
+
+    @staticmethod
+    def _drop_table_dependents(connection: Connection, table_name: str) -> None:
+        """Drops the named indexes and all triggers on a table so its columns can be altered."""
+        dependents = connection.execute(
+            text("SELECT type, name FROM sqlite_master WHERE tbl_name = :table_name AND type IN ('index', 'trigger') AND sql IS NOT NULL"),
+            {"table_name": table_name},
+        )
+        for kind, name in list(dependents):
+            connection.exec_driver_sql(f'DROP {kind.upper()} IF EXISTS "{name}"')
+
+    @staticmethod
+    def _migrate_coded_column(connection: Connection, table_name: str, column_name: str, coded: CodedLabel, default: str) -> None:
+        """Replaces a text label column with an INTEGER column holding the labels' codes."""
+        default_code = coded.code(default)
+        matches = " ".join(f"WHEN '{label.lower()}' THEN {code}" for code, label in enumerate(coded.labels))
+        known = ", ".join(f"'{label.lower()}'" for label in coded.labels)
+        unmatched = connection.scalar(
+            text(f"SELECT count(*) FROM {table_name} WHERE {column_name} IS NOT NULL AND lower(trim({column_name})) NOT IN ({known})")
+        )
+        if unmatched:
+            logger.warning("%d %s.%s value(s) are not one of %s; storing them as '%s'", unmatched, table_name, column_name, coded.labels, default)
+        staging = f"{column_name}_code"
+        connection.exec_driver_sql(f"ALTER TABLE {table_name} ADD COLUMN {staging} INTEGER NOT NULL DEFAULT {default_code}")
+        connection.exec_driver_sql(f"UPDATE {table_name} SET {staging} = CASE lower(trim({column_name})) {matches} ELSE {default_code} END")
+        connection.exec_driver_sql(f"ALTER TABLE {table_name} DROP COLUMN {column_name}")
+        connection.exec_driver_sql(f"ALTER TABLE {table_name} RENAME COLUMN {staging} TO {column_name}")
+
+    def _migrate_task_assignments(self) -> None:
+        """Fills the newly created task_assignments table from the assigned_to text of existing tasks."""
+        with self.engine.begin() as connection:
+            rows = connection.execute(select(Task.id, Task.assigned_to).where(Task.assigned_to.is_not(None)))
+            assignments = {task_id: assigned_to for task_id, assigned_to in rows}
+            if assignments:
+                self._sync_task_assignments(connection, assignments)
+                logger.info("Migrated the assignees of %d task(s) to task_assignments", len(assignments))
+
+    @staticmethod
+    def _sync_task_assignments(connection: Connection, assignments: Dict[int, Optional[str]]) -> None:
+        """
+        Replaces the task_assignments rows of the given tasks with the members named in their
+        assigned_to text, creating team members on first mention. Runs in the caller's transaction.
+        """
+        if not assignments:
+            return
+        names_by_task = {task_id: split_assignees(assigned_to) for task_id, assigned_to in assignments.items()}
+        names = {name.lower(): name for task_names in names_by_task.values() for name in task_names}
+        member_ids: Dict[str, int] = {}
+        if names:
+            rows = connection.execute(select(TeamMember.id, TeamMember.name).where(TeamMember.name.in_(list(names.values()))))
+            member_ids = {name.lower(): member_id for member_id, name in rows}
+            new_names = [name for key, name in names.items() if key not in member_ids]
+            if new_names:
+                new_ids = connection.scalars(insert(TeamMember).returning(TeamMember.id, sort_by_parameter_order=True), [{"name": name} for name in new_names])
+                member_ids.update(zip((name.lower() for name in new_names), new_ids))
+        connection.execute(delete(TaskAssignment).where(TaskAssignment.task_id.in_(list(assignments))))
+        links = [
+            {"task_id": task_id, "member_id": member_ids[name.lower()]}
+            for task_id, task_names in names_by_task.items()
+            for name in task_names
+        ]
+        if links:
+            connection.execute(insert(TaskAssignment), links)
+
+    def _ensure_indexes(self) -> None:
+        """
+        Creates any declared index that is missing. create_all only builds indexes
+        together with new tables, so databases created before an index was declared
+        would otherwise never get it.
+        """
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
     def get_session(self) -> Session:
         """Returns a new SQLAlchemy session."""
         return self.Session()
@@ -186,29 +700,85 @@ class ProjectManagerDB:
     def get_project_by_name(self, name: str) -> Optional[Project]:
         """Retrieves a project by its name, eagerly loading phases and epics."""
         session: Session = self.get_session()
-        project: Optional[Project] = (
-            session.query(Project)
-            .options(
-                selectinload(Project.phases).selectinload(Phase.epics)
-            )
-            .filter_by(name=name)
-            .first()
-        )
+        project: Optional[Project] = session.scalars(
+            self._project_by_name_stmt(name).options(selectinload(Project.phases).selectinload(Phase.epics))
+        ).first()
         session.close()
         return project
 
-    def get_all_projects(self) -> List[Project]:
-        """Retrieves all projects from the database, eagerly loading phases and epics."""
-        session: Session = self.get_session()
-        projects: List[Project] = (
-            session.query(Project)
-            .options(
-                selectinload(Project.phases).selectinload(Phase.epics)
+    def _project_by_name_stmt(self, name: str) -> Select[Tuple[Project]]:
+        """Builds the statement behind get_project_by_name."""
+        return select(Project).where(Project.name == name)
+
+    def project_exists(self, name: str) -> bool:
+        """Checks whether a project with this name exists without loading it or its children."""
+        with self.engine.connect() as connection:
+            return bool(connection.scalar(select(exists().where(Project.name == name))))
+
+    def get_project_directory(self) -> List[ProjectDirectoryEntry]:
+        """Lists every project as a compact (id, name, status, start_date, end_date_target) tuple."""
+        with self.engine.connect() as connection:
+            return [ProjectDirectoryEntry(*row) for row in connection.execute(self._project_directory_stmt())]
+
+    def _project_directory_stmt(self) -> Select[Tuple[int, str, str, date, Optional[date]]]:
+        """Builds the statement behind get_project_directory."""
+        return select(Project.id, Project.name, Project.status, Project.start_date, Project.end_date_target).order_by(
+            Project.id
+        )
+
+    def get_plan_snapshot(self, project_id: int) -> PlanSnapshot:
+        """
+        Loads a project's whole plan hierarchy with one query per level (four in total),
+        regardless of how many phases, epics, tasks or subtasks it has.
+        """
+        phases_stmt, epics_stmt, tasks_stmt, subtasks_stmt = self._plan_snapshot_stmts(project_id)
+        with self.engine.connect() as connection:
+            return PlanSnapshot(
+                phases=list(connection.execute(phases_stmt)),
+                epics=list(connection.execute(epics_stmt)),
+                tasks=list(connection.execute(tasks_stmt)),
+                subtasks=list(connection.execute(subtasks_stmt)),
             )
-            .all()
+
+    def _plan_snapshot_stmts(self, project_id: int) -> Tuple[Select[Any], Select[Any], Select[Any], Select[Any]]:
+        """Builds the phase, epic, task and subtask statements behind get_plan_snapshot."""
+        phases_stmt = (
+            select(Phase.id, Phase.name, Phase.description, Phase.start_date, Phase.end_date)
+            .where(Phase.project_id == project_id)
+            .order_by(Phase.id)
         )
-        session.close()
-        return projects
+        epics_stmt = (
+            select(Epic.id, Epic.phase_id, Epic.name, Epic.description, Epic.status)
+            .join(Phase, Epic.phase_id == Phase.id)
+            .where(Phase.project_id == project_id)
+            .order_by(Epic.id)
+        )
+        tasks_stmt = (
+            select(
+                Task.id,
+                Task.epic_id,
+                Task.name,
+                Task.description,
+                Task.assigned_to,
+                Task.priority,
+                Task.status,
+                Task.start_date,
+                Task.due_date,
+            )
+            .join(Epic, Task.epic_id == Epic.id)
+            .join(Phase, Epic.phase_id == Phase.id)
+            .where(Phase.project_id == project_id)
+            .order_by(Task.id)
+        )
+        subtasks_stmt = (
+            select(SubTask.id, SubTask.task_id, SubTask.name, SubTask.description, SubTask.assigned_to, SubTask.status)
+            .join(Task, SubTask.task_id == Task.id)
+            .join(Epic, Task.epic_id == Epic.id)
+            .join(Phase, Epic.phase_id == Phase.id)
+            .where(Phase.project_id == project_id)
+            .order_by(SubTask.id)
+        )
+        return phases_stmt, epics_stmt, tasks_stmt, subtasks_stmt
 
     def add_phase(
         self,
@@ -269,38 +839,383 @@ class ProjectManagerDB:
             due_date=due_date,
         )
         session.add(task)
+        session.flush()
+        self._sync_task_assignments(session.connection(), {task.id: assigned_to})
         session.commit()
         session.refresh(task)
         session.close()
         return task
 
+    def add_plan(self, project_id: int, phases: List[PhaseSpec]) -> List[int]:
+        """
+        Writes a whole Phase -> Epic -> Task -> SubTask tree to a project in a single transaction.
+
+        Each level of the hierarchy is written with one batched INSERT ... RETURNING, so the
+        plan costs a single commit and is rolled back completely if any row fails.
+
+        Returns:
+            The ids of the inserted phases, in the order they were given.
+        """
+        with self.Session.begin() as session:
+            phase_ids: List[int] = self._insert_returning_ids(
+                session,
+                Phase,
+                [
+                    {
+                        "project_id": project_id,
+                        "name": phase.name,
+                        "description": phase.description,
+                        "start_date": phase.start_date,
+                        "end_date": phase.end_date,
+                    }
+                    for phase in phases
+                ],
+            )
+
+            epics: List[EpicSpec] = [epic for phase in phases for epic in phase.epics]
+            epic_ids: List[int] = self._insert_returning_ids(
+                session,
+                Epic,
+                [
+                    {"phase_id": phase_id, "name": epic.name, "description": epic.description, "status": epic.status}
+                    for phase_id, phase in zip(phase_ids, phases)
+                    for epic in phase.epics
+                ],
+            )
+
+            tasks: List[TaskSpec] = [task for epic in epics for task in epic.tasks]
+            task_ids: List[int] = self._insert_returning_ids(
+                session,
+                Task,
+                [
+                    {
+                        "epic_id": epic_id,
+                        "name": task.name,
+                        "description": task.description,
+                        "assigned_to": task.assigned_to,
+                        "priority": task.priority,
+                        "status": task.status,
+                        "jira_link": task.jira_link,
+                        "start_date": task.start_date,
+                        "due_date": task.due_date,
+                    }
+                    for epic_id, epic in zip(epic_ids, epics)
+                    for task in epic.tasks
+                ],
+            )
+            self._sync_task_assignments(session.connection(), {task_id: task.assigned_to for task_id, task in zip(task_ids, tasks)})
+
+            self._insert_returning_ids(
+                session,
+                SubTask,
+                [
+                    {
+                        "task_id": task_id,
+                        "name": subtask.name,
+                        "description": subtask.description,
+                        "assigned_to": subtask.assigned_to,
+                        "status": subtask.status,
+                    }
+                    for task_id, task in zip(task_ids, tasks)
+                    for subtask in task.subtasks
+                ],
+            )
+        return phase_ids
+
+    @staticmethod
+    def _insert_returning_ids(session: Session, model: Any, rows: List[Dict[str, Any]]) -> List[int]:
+        """Inserts rows with one batched INSERT and returns their new ids in parameter order."""
+        if not rows:
+            return []
+        return list(session.scalars(insert(model).returning(model.id, sort_by_parameter_order=True), rows))
+
     def update_task_status(self, task_id: int, new_status: str) -> Optional[Task]:
         """Updates the status of a task."""
         session: Session = self.get_session()
         task: Optional[Task] = session.get(Task, task_id)
         if task:
             task.status = new_status
-            if new_status == "Done":
+            if new_status == DONE_TASK_STATUS:
                 task.completed_date = date.today()
             session.commit()
             session.refresh(task)
         session.close()
         return task
 
+    def bulk_update_tasks(self, task_ids: List[int], **fields: Any) -> List[Row]:
+        """
+        Sets the same field values on many tasks in a single UPDATE and returns the changed rows
+        as (id, epic_id, assigned_to, status, start_date, due_date). Setting status to "Done" stamps
+        completed_date (keeping an earlier one) in the same statement; any other status clears it.
+
+        Raises:
+            ValueError: If a field is not one of BULK_TASK_FIELDS or a status is not a known label.
+        """
+        unknown = sorted(set(fields) - set(BULK_TASK_FIELDS))
+        if unknown:
+            raise ValueError(f"Unsupported bulk task field(s): {', '.join(unknown)}")
+        for name, value in fields.items():
+            column_type = Task.__table__.c[name].type
+            if isinstance(column_type, CodedLabel):
+                column_type.code(value)  # Reject unknown labels before building the statement
+        if not task_ids or not fields:
+            return []
+        values: Dict[str, Any] = dict(fields)
+        if "status" in fields:
+            values["completed_date"] = func.coalesce(Task.completed_date, date.today()) if fields["status"] == DONE_TASK_STATUS else None
+        stmt = (
+            update(Task)
+            .where(Task.id.in_(task_ids))
+            .values(values)
+            .returning(Task.id, Task.epic_id, Task.assigned_to, Task.status, Task.start_date, Task.due_date)
+        )
+        with self.engine.begin() as connection:
+            rows = list(connection.execute(stmt))
+            if "assigned_to" in fields:
+                self._sync_task_assignments(connection, {row.id: row.assigned_to for row in rows})
+            return rows
+
+    def get_task_loads(self, task_ids: Optional[Sequence[int]] = None) -> List[Row]:
+        """
+        Returns (id, assigned_to, status, start_date, end_date) for every task across all projects,
+        or only for the given tasks, as input for the capacity matrix. A task without its own start
+        or due date spans from its phase's start or to its phase's end.
+        """
+        with self.engine.connect() as connection:
+            return list(connection.execute(self._task_loads_stmt(task_ids)))
+
+    def _task_loads_stmt(self, task_ids: Optional[Sequence[int]], project_id: Optional[int] = None) -> Select[Any]:
+        """Builds the statement behind get_task_loads and the task rows of get_schedule."""
+        stmt = (
+            select(
+                Task.id,
+                Task.assigned_to,
+                Task.status,
+                func.coalesce(Task.start_date, Phase.start_date).label("start_date"),
+                func.coalesce(Task.due_date, Phase.end_date).label("end_date"),
+            )
+            .join(Epic, Task.epic_id == Epic.id)
+            .join(Phase, Epic.phase_id == Phase.id)
+        )
+        if task_ids is not None:
+            stmt = stmt.where(Task.id.in_(task_ids))
+        if project_id is not None:
+            stmt = stmt.where(Phase.project_id == project_id)
+        return stmt
+
+    def get_schedule(self, project_id: int) -> ProjectSchedule:
+        """
+        Loads what the critical path of a project needs: its tasks' effective dates (as in
+        get_task_loads) and the dependencies between them, with one query each.
+        """
+        tasks_stmt, dependencies_stmt = self._schedule_stmts(project_id)
+        with self.engine.connect() as connection:
+            return ProjectSchedule(tasks=list(connection.execute(tasks_stmt)), dependencies=list(connection.execute(dependencies_stmt)))
+
+    def _schedule_stmts(self, project_id: int) -> Tuple[Select[Any], Select[Any]]:
+        """Builds the task and dependency statements behind get_schedule."""
+        dependencies_stmt = (
+            select(TaskDependency.predecessor_id, TaskDependency.successor_id, TaskDependency.kind, TaskDependency.lag_days)
+            .join(Task, TaskDependency.successor_id == Task.id)
+            .join(Epic, Task.epic_id == Epic.id)
+            .join(Phase, Epic.phase_id == Phase.id)
+            .where(Phase.project_id == project_id)
+        )
+        tasks_stmt = self._task_loads_stmt(None, project_id).add_columns(Task.name, Phase.name.label("phase_name"))
+        return tasks_stmt, dependencies_stmt
+
+    def add_dependency(self, predecessor_id: int, successor_id: int, kind: str = "FS", lag_days: int = 0) -> Row:
+        """
+        Makes one task depend on another, replacing the type and lag of an existing dependency
+        between them. Returns the stored (predecessor_id, successor_id, kind, lag_days).
+
+        Raises:
+            ValueError: If the tasks are the same, belong to different projects, kind is not one of
+                DEPENDENCY_TYPES, or the predecessor already depends (directly or not) on the successor.
+        """
+        TaskDependency.__table__.c.kind.type.code(kind)
+        if predecessor_id == successor_id:
+            raise ValueError("A task cannot depend on itself.")
+        with self.engine.begin() as connection:
+            projects = dict(
+                connection.execute(
+                    select(Task.id, Phase.project_id)
+                    .join(Epic, Task.epic_id == Epic.id)
+                    .join(Phase, Epic.phase_id == Phase.id)
+                    .where(Task.id.in_([predecessor_id, successor_id]))
+                ).all()
+            )
+            if len(projects) != 2:
+                raise ValueError("Both tasks must exist.")
+            if projects[predecessor_id] != projects[successor_id]:
+                raise ValueError("Dependencies must link tasks of the same project.")
+            # Everything downstream of the successor, walked over the primary key; reaching the predecessor means a cycle
+            cycle = connection.scalar(
+                text(
+                    """WITH RECURSIVE downstream(task_id) AS (
+                           SELECT :successor_id
+                           UNION
+                           SELECT d.successor_id FROM task_dependencies d JOIN downstream ON d.predecessor_id = downstream.task_id
+                       )
+                       SELECT 1 FROM downstream WHERE task_id = :predecessor_id"""
+                ),
+                {"predecessor_id": predecessor_id, "successor_id": successor_id},
+            )
+            if cycle:
+                raise ValueError("The predecessor already depends on this task; the dependency would create a cycle.")
+            values = {"predecessor_id": predecessor_id, "successor_id": successor_id, "kind": kind, "lag_days": lag_days}
+            updated = connection.execute(
+                update(TaskDependency)
+                .where(TaskDependency.predecessor_id == predecessor_id, TaskDependency.successor_id == successor_id)
+                .values(kind=kind, lag_days=lag_days)
+            )
+            if not updated.rowcount:
+                connection.execute(insert(TaskDependency).values(values))
+            return connection.execute(
+                select(TaskDependency.predecessor_id, TaskDependency.successor_id, TaskDependency.kind, TaskDependency.lag_days).where(
+                    TaskDependency.predecessor_id == predecessor_id, TaskDependency.successor_id == successor_id
+                )
+            ).one()
+
+    def get_team_members(self) -> List[Row]:
+        """Lists every team member that has ever been assigned a task as (id, name), by name."""
+        with self.engine.connect() as connection:
+            return list(connection.execute(select(TeamMember.id, TeamMember.name).order_by(TeamMember.name)))
+
+    def get_member_tasks(self, member_id: int, include_done: bool = False) -> List[Row]:
+        """
+        Returns every task assigned to a team member across all projects, soonest due first, as
+        (id, name, status, priority, start_date, due_date, assigned_to, epic_name, phase_name,
+        project_id, project_name). Served by the task_assignments member index, so its cost
+        depends on the member's tasks rather than on the number of projects.
+        """
+        with self.engine.connect() as connection:
+            return list(connection.execute(self._member_tasks_stmt(member_id, include_done)))
+
+    def _member_tasks_stmt(self, member_id: int, include_done: bool) -> Select[Any]:
+        """Builds the statement behind get_member_tasks."""
+        stmt = (
+            select(
+                Task.id,
+                Task.name,
+                Task.status,
+                Task.priority,
+                Task.start_date,
+                Task.due_date,
+                Task.assigned_to,
+                Epic.name.label("epic_name"),
+                Phase.name.label("phase_name"),
+                Project.id.label("project_id"),
+                Project.name.label("project_name"),
+            )
+            .select_from(TaskAssignment)
+            .join(Task, TaskAssignment.task_id == Task.id)
+            .join(Epic, Task.epic_id == Epic.id)
+            .join(Phase, Epic.phase_id == Phase.id)
+            .join(Project, Phase.project_id == Project.id)
+            .where(TaskAssignment.member_id == member_id)
+            .order_by(Task.due_date.is_(None), Task.due_date, Task.priority.desc(), Task.id)
+        )
+        if not include_done:
+            stmt = stmt.where(Task.status != DONE_TASK_STATUS)
+        return stmt
+
+    def shift_dates(self, kind: str, item_id: int, shift: DateShift, include_successors: bool = False) -> DateShiftResult:
+        """
+        Moves the dates of a phase, epic or task and of everything below it: a phase's start and
+        end date and the start and due dates of all tasks underneath. With include_successors,
+        tasks that depend on those tasks (directly or not, in any project) move with them.
+
+        The distinct dates involved are read with one query and mapped through shift in a single
+        call into a temporary date_shifts table; each table then gets one UPDATE that looks its new
+        dates up in that table's primary key, so no ORM objects are loaded and the statements stay
+        cacheable. Everything happens in one transaction.
+
+        Raises:
+            ValueError: If kind is not one of SHIFTABLE_KINDS.
+        """
+        phase_ids, task_ids = self._shift_scope_stmts(kind, item_id, include_successors)
+        with self.engine.begin() as connection:
+            old_dates = [day for day in connection.scalars(self._shift_dates_stmt(phase_ids, task_ids)) if day is not None]
+            if not old_dates:
+                return DateShiftResult(0, [])
+            moved = {old: new for old, new in zip(old_dates, shift(old_dates)) if new != old}
+            if not moved:
+                return DateShiftResult(0, [])
+            connection.exec_driver_sql(
+                "CREATE TEMP TABLE IF NOT EXISTS date_shifts (old_date DATE PRIMARY KEY, new_date DATE NOT NULL) WITHOUT ROWID"
+            )
+            connection.execute(delete(date_shifts))
+            connection.execute(insert(date_shifts), [{"old_date": old, "new_date": new} for old, new in moved.items()])
+
+            def shifted(day: Any) -> Any:
+                return func.coalesce(select(date_shifts.c.new_date).where(date_shifts.c.old_date == day).scalar_subquery(), day)
+
+            phase_count = connection.execute(
+                update(Phase).where(Phase.id.in_(phase_ids)).values(start_date=shifted(Phase.start_date), end_date=shifted(Phase.end_date))
+            ).rowcount
+            shifted_task_ids = list(
+                connection.scalars(
+                    update(Task)
+                    .where(Task.id.in_(task_ids))
+                    .values(start_date=shifted(Task.start_date), due_date=shifted(Task.due_date))
+                    .returning(Task.id)
+                )
+            )
+            connection.execute(delete(date_shifts))
+        return DateShiftResult(phase_count, shifted_task_ids)
+
+    def _shift_scope_stmts(self, kind: str, item_id: int, include_successors: bool) -> Tuple[Select[Any], Select[Any]]:
+        """
+        Builds the phase-id and task-id selects of what shift_dates moves.
+
+        Raises:
+            ValueError: If kind is not one of SHIFTABLE_KINDS.
+        """
+        if kind not in SHIFTABLE_KINDS:
+            raise ValueError(f"Cannot shift a {kind}; expected one of {', '.join(SHIFTABLE_KINDS)}")
+        phase_ids = select(Phase.id).where(Phase.id == item_id) if kind == "phase" else select(Phase.id).where(False)
+        if kind == "phase":
+            task_ids: Select[Any] = select(Task.id).join(Epic, Task.epic_id == Epic.id).where(Epic.phase_id == item_id)
+        elif kind == "epic":
+            task_ids = select(Task.id).where(Task.epic_id == item_id)
+        else:
+            task_ids = select(Task.id).where(Task.id == item_id)
+        if include_successors:
+            # Follows task_dependencies downstream from the subtree's tasks over its primary key
+            downstream = task_ids.cte("downstream", recursive=True)
+            downstream = downstream.union(
+                select(TaskDependency.successor_id).join(downstream, TaskDependency.predecessor_id == downstream.c.id)
+            )
+            task_ids = select(downstream.c.id)
+        return phase_ids, task_ids
+
+    def _shift_dates_stmt(self, phase_ids: Select[Any], task_ids: Select[Any]) -> CompoundSelect:
+        """Builds the statement that reads the distinct dates shift_dates moves."""
+        return union(
+            select(Phase.start_date).where(Phase.id.in_(phase_ids)),
+            select(Phase.end_date).where(Phase.id.in_(phase_ids)),
+            select(Task.start_date).where(Task.id.in_(task_ids)),
+            select(Task.due_date).where(Task.id.in_(task_ids)),
+        )
+
     def get_tasks_for_project(self, project_id: int) -> List[Task]:
         """Retrieves all tasks for a given project, including their epic and phase."""
         session: Session = self.get_session()
-        tasks: List[Task] = (
-            session.query(Task)
-            .join(Epic)
-            .join(Phase)
-            .filter(Phase.project_id == project_id)
-            .order_by(Task.due_date.asc(), Task.priority.desc())
-            .all()
-        )
+        tasks: List[Task] = list(session.scalars(self._tasks_for_project_stmt(project_id)))
         session.close()
         return tasks
 
+    def _tasks_for_project_stmt(self, project_id: int) -> Select[Tuple[Task]]:
+        """Builds the statement behind get_tasks_for_project."""
+        return (
+            select(Task)
+            .join(Epic, Task.epic_id == Epic.id)
+            .join(Phase, Epic.phase_id == Phase.id)
+            .where(Phase.project_id == project_id)
+            .order_by(Task.due_date.asc(), Task.priority.desc())
+        )
+
     def add_daily_log(
         self,
         project_id: int,
@@ -335,11 +1250,185 @@ class ProjectManagerDB:
     def get_daily_logs_for_project(self, project_id: int) -> List[DailyLog]:
         """Retrieves all daily logs for a given project, ordered by date."""
         session: Session = self.get_session()
-        logs: List[DailyLog] = (
-            session.query(DailyLog)
-            .filter_by(project_id=project_id)
-            .order_by(DailyLog.log_date.desc())
-            .all()
+        logs: List[DailyLog] = list(session.scalars(self._daily_logs_for_project_stmt(project_id)))
+        session.close()
+        return logs
+
+    def _daily_logs_for_project_stmt(self, project_id: int) -> Select[Tuple[DailyLog]]:
+        """Builds the statement behind get_daily_logs_for_project."""
+        return select(DailyLog).where(DailyLog.project_id == project_id).order_by(DailyLog.log_date.desc())
+
+    def get_status_rollups(self, project_id: int) -> PlanRollups:
+        """
+        Counts a project's tasks by status per epic and per phase without loading the tasks.
+        Reads the incrementally maintained epic_task_rollups table when it is enabled,
+        otherwise groups the tasks table directly.
+        """
+        with self.engine.connect() as connection:
+            rows = connection.execute(self._status_rollups_stmt(project_id))
+            rollups = PlanRollups(epics={}, phases={})
+            for phase_id, epic_id, status, task_count in rows:
+                epic_counts = rollups.epics.setdefault(epic_id, {})
+                epic_counts[status] = epic_counts.get(status, 0) + task_count
+                phase_counts = rollups.phases.setdefault(phase_id, {})
+                phase_counts[status] = phase_counts.get(status, 0) + task_count
+        return rollups
+
+    def _status_rollups_stmt(self, project_id: int) -> Select[Any]:
+        """Builds the (phase_id, epic_id, status, count) statement behind get_status_rollups."""
+        if self.rollups_maintained:
+            return (
+                select(Epic.phase_id, epic_task_rollups.c.epic_id, epic_task_rollups.c.status, epic_task_rollups.c.task_count)
+                .join(Epic, Epic.id == epic_task_rollups.c.epic_id)
+                .join(Phase, Epic.phase_id == Phase.id)
+                .where(Phase.project_id == project_id)
+            )
+        return (
+            select(Epic.phase_id, Task.epic_id, Task.status, func.count())
+            .join(Epic, Task.epic_id == Epic.id)
+            .join(Phase, Epic.phase_id == Phase.id)
+            .where(Phase.project_id == project_id)
+            .group_by(Epic.phase_id, Task.epic_id, Task.status)
         )
+
+    def get_daily_logs_page(
+        self, project_id: int, before: Optional[Tuple[date, int]] = None, limit: int = 50
+    ) -> List[DailyLog]:
+        """
+        Retrieves one page of a project's daily logs, newest first, using keyset pagination.
+
+        Args:
+            project_id: The project whose logs to read.
+            before: The (log_date, id) of the last log on the previous page, or None for the first page.
+            limit: The maximum number of logs to return.
+
+        Returns:
+            Up to limit logs ordered by (log_date, id) descending. Fewer than limit means no more pages.
+        """
+        session: Session = self.get_session()
+        logs: List[DailyLog] = list(session.scalars(self._daily_logs_page_stmt(project_id, before, limit)))
         session.close()
         return logs
+
+    def _daily_logs_page_stmt(
+        self, project_id: int, before: Optional[Tuple[date, int]], limit: int
+    ) -> Select[Tuple[DailyLog]]:
+        """Builds the statement behind get_daily_logs_page."""
+        stmt = select(DailyLog).where(DailyLog.project_id == project_id)
+        if before is not None:
+            stmt = stmt.where(tuple_(DailyLog.log_date, DailyLog.id) < tuple_(*before))
+        return stmt.order_by(DailyLog.log_date.desc(), DailyLog.id.desc()).limit(limit)
+
+    def search_daily_logs(self, project_id: int, query: str, limit: int = 50) -> List[LogSearchHit]:
+        """
+        Full-text searches a project's daily logs, best matches first.
+
+        Args:
+            project_id: The project whose logs to search.
+            query: Free text; every word must match, and the last word also matches as a prefix.
+            limit: The maximum number of hits to return.
+
+        Returns:
+            Ranked hits with highlighted snippets, or an empty list if the query has no words.
+        """
+        if not self.log_search_available:
+            raise RuntimeError("Daily log search requires SQLite with FTS5 support.")
+        match = self._fts_match_expression(query)
+        if match is None:
+            return []
+        stmt = text(
+            f"""SELECT daily_logs.id AS log_id, daily_logs.log_date AS log_date,
+                       snippet(daily_logs_fts, -1, '{_SNIPPET_START}', '{_SNIPPET_END}', '...', 16) AS snippet,
+                       bm25(daily_logs_fts) AS rank
+                FROM daily_logs_fts JOIN daily_logs ON daily_logs.id = daily_logs_fts.rowid
+                WHERE daily_logs_fts MATCH :match AND daily_logs.project_id = :project_id
+                ORDER BY rank
+                LIMIT :limit"""
+        ).columns(log_id=Integer, log_date=Date, snippet=Text, rank=Float)
+        with self.engine.connect() as connection:
+            rows = connection.execute(stmt, {"match": match, "project_id": project_id, "limit": limit})
+            return [
+                LogSearchHit(
+                    row.log_id,
+                    row.log_date,
+                    html.escape(row.snippet).replace(_SNIPPET_START, "<b>").replace(_SNIPPET_END, "</b>"),
+                    row.rank,
+                )
+                for row in rows
+            ]
+
+    @staticmethod
+    def _fts_match_expression(query: str) -> Optional[str]:
+        """Turns free text into a safe FTS5 MATCH expression: quoted words, the last one as a prefix."""
+        words = re.findall(r"\w+", query)
+        if not words:
+            return None
+        return " ".join(f'"{word}"' for word in words) + "*"
+
+    def _query_plan_statements(self) -> Dict[str, List[Select[Any] | CompoundSelect]]:
+        """
+        The statements behind each keyed query method, for EXPLAIN QUERY PLAN checks.
+        Methods that intentionally read a whole table (get_project_directory, get_team_members) are not listed;
+        get_task_loads is only listed in its per-task form.
+        """
+        return {
+            "get_project_by_name": [self._project_by_name_stmt("")],
+            "project_exists": [select(exists().where(Project.name == ""))],
+            "get_plan_snapshot": list(self._plan_snapshot_stmts(0)),
+            "get_tasks_for_project": [self._tasks_for_project_stmt(0)],
+            "get_task_loads": [self._task_loads_stmt([0])],
+            "get_schedule": list(self._schedule_stmts(0)),
+            "get_member_tasks": [self._member_tasks_stmt(0, False), self._member_tasks_stmt(0, True)],
+            "shift_dates": [
+                self._shift_dates_stmt(*self._shift_scope_stmts(kind, 0, include_successors))
+                for kind in SHIFTABLE_KINDS
+                for include_successors in (False, True)
+            ],
+            "get_daily_logs_for_project": [self._daily_logs_for_project_stmt(0)],
+            "get_status_rollups": [self._status_rollups_stmt(0)],
+            "get_daily_logs_page": [
+                self._daily_logs_page_stmt(0, None, 50),
+                self._daily_logs_page_stmt(0, (date.today(), 0), 50),
+            ],
+        }
+
+    def explain_query_plans(self) -> Dict[str, List[str]]:
+        """
+        Runs EXPLAIN QUERY PLAN for every statement in _query_plan_statements.
+
+        Returns:
+            A mapping of query method name to the plan detail lines SQLite reports for it.
+        """
+        plans: Dict[str, List[str]] = {}
+        with self.engine.connect() as connection:
+            for method_name, statements in self._query_plan_statements().items():
+                details: List[str] = []
+                for statement in statements:
+                    compiled = statement.compile(dialect=self.engine.dialect, compile_kwargs={"render_postcompile": True})
+                    parameters = tuple(compiled.params[name] for name in compiled.positiontup or [])
+                    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", parameters)
+                    details.extend(row[-1] for row in rows)
+                plans[method_name] = details
+        return plans
+
+    def find_table_scans(self) -> Dict[str, List[str]]:
+        """
+        Returns the query methods whose plan falls back to a full table scan
+        (a SCAN step that uses no index), with the offending plan lines.
+        Scans of CTEs (e.g. the work queue of a recursive one) are not table scans.
+        An empty result means every keyed query is served by an index.
+        """
+        scans: Dict[str, List[str]] = {}
+        for method_name, details in self.explain_query_plans().items():
+            ctes = {detail.split()[1] for detail in details if detail.startswith(("MATERIALIZE ", "CO-ROUTINE "))}
+            offending = [
+                detail
+                for detail in details
+                if detail.startswith("SCAN ")
+                and " USING " not in detail
+                and detail != "SCAN CONSTANT ROW"
+                and detail.split()[1] not in ctes
+            ]
+            if offending:
+                scans[method_name] = offending
+        return scans
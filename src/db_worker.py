@@ -0,0 +1,180 @@
+# db_worker.py
+from dataclasses import dataclass
+from itertools import count
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+if TYPE_CHECKING:
+    # database pulls in SQLAlchemy; the worker only needs it once a database is opened
+    from database import ProjectManagerDB
+
+DbJob = Callable[["ProjectManagerDB"], Any]
+ResultCallback = Callable[[Any], None]
+ErrorCallback = Callable[[Exception], None]
+
+
+class _JobSignals(QObject):
+    """Carries job outcomes from the pool thread back to the GUI thread (queued connections)."""
+
+    finished = Signal(int, object)  # job id, result
+    failed = Signal(int, object)  # job id, exception
+
+
+class _DbJobRunnable(QRunnable):
+    """Runs one job on a pool thread. DbJobs open and close their own sessions on that thread."""
+
+    def __init__(self, job_id: int, call: Callable[[], Any], signals: _JobSignals) -> None:
+        super().__init__()
+        self.setAutoDelete(False)  # DbWorker owns the runnable so it can tryTake() superseded jobs
+        self._job_id = job_id
+        self._call = call
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            result = self._call()
+        except Exception as exc:
+            self._signals.failed.emit(self._job_id, exc)
+        else:
+            self._signals.finished.emit(self._job_id, result)
+
+
+@dataclass
+class _PendingJob:
+    key: Optional[str]
+    runnable: _DbJobRunnable
+    on_result: Optional[ResultCallback]
+    on_error: Optional[ErrorCallback]
+
+
+class DbWorker(QObject):
+    """
+    Async facade over ProjectManagerDB that keeps database work off the Qt event loop.
+
+    Jobs run on a private single-thread QThreadPool, so SQLite access stays serialized and
+    jobs complete in submission order (a write followed by a reload sees the write). Results
+    and errors are delivered to the callbacks on the GUI thread through Qt signals.
+
+    Loads are submitted with a key: a newer job with the same key supersedes older ones.
+    Superseded jobs that have not started are removed from the queue, and results of ones
+    already running are dropped. Writes are submitted without a key and are never dropped.
+
+    The database can be handed in ready-made or opened later on the pool thread with open(),
+    which keeps schema setup and migrations off the event loop at startup.
+    """
+
+    busy_changed = Signal(bool)
+    error_occurred = Signal(object)  # exceptions from jobs submitted without an on_error callback
+
+    def __init__(self, db: Optional["ProjectManagerDB"] = None, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._db = db
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._signals = _JobSignals(self)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+        self._job_ids = count(1)
+        self._pending: Dict[int, _PendingJob] = {}
+        self._latest_by_key: Dict[str, int] = {}
+        self._busy = False
+
+    def submit(
+        self,
+        job: DbJob,
+        on_result: Optional[ResultCallback] = None,
+        on_error: Optional[ErrorCallback] = None,
+        key: Optional[str] = None,
+    ) -> None:
+        """
+        Queues a database job.
+
+        Args:
+            job: Called with the ProjectManagerDB on a pool thread.
+            on_result: Called on the GUI thread with the job's return value.
+            on_error: Called on the GUI thread if the job raises. Defaults to emitting error_occurred.
+            key: Supersession key for loads; None for writes that must always complete.
+        """
+        self._enqueue(lambda: job(self._database()), on_result, on_error, key)
+
+    def open(
+        self,
+        open_db: Callable[[], "ProjectManagerDB"],
+        on_result: Optional[ResultCallback] = None,
+        on_error: Optional[ErrorCallback] = None,
+    ) -> None:
+        """
+        Opens the database on the pool thread; jobs submitted after this call run against it.
+
+        Args:
+            open_db: Creates the ProjectManagerDB (schema setup, migrations) on a pool thread.
+            on_result: Called on the GUI thread with the opened database.
+            on_error: Called on the GUI thread if opening fails. Defaults to emitting error_occurred.
+        """
+
+        def open_job() -> "ProjectManagerDB":
+            self._db = open_db()
+            return self._db
+
+        self._enqueue(open_job, on_result, on_error, None)
+
+    def is_busy(self) -> bool:
+        """True while any job is queued or running."""
+        return bool(self._pending)
+
+    def wait_for_done(self) -> None:
+        """Blocks until every queued job has finished; used on shutdown."""
+        self._pool.waitForDone()
+
+    def _enqueue(
+        self, call: Callable[[], Any], on_result: Optional[ResultCallback], on_error: Optional[ErrorCallback], key: Optional[str]
+    ) -> None:
+        job_id = next(self._job_ids)
+        if key is not None:
+            self._cancel_pending(key)
+            self._latest_by_key[key] = job_id
+        runnable = _DbJobRunnable(job_id, call, self._signals)
+        self._pending[job_id] = _PendingJob(key, runnable, on_result, on_error)
+        self._pool.start(runnable)
+        self._update_busy()
+
+    def _database(self) -> "ProjectManagerDB":
+        """Returns the database on the pool thread; jobs queued ahead of open() or after a failed open() fail here."""
+        if self._db is None:
+            raise RuntimeError("The database is not open")
+        return self._db
+
+    def _cancel_pending(self, key: str) -> None:
+        """Removes not-yet-started jobs with this key from the queue."""
+        for job_id, pending in list(self._pending.items()):
+            if pending.key == key and self._pool.tryTake(pending.runnable):
+                del self._pending[job_id]
+
+    def _take_current(self, job_id: int) -> Optional[_PendingJob]:
+        """Pops a finished job, returning None if a newer job with the same key superseded it."""
+        pending = self._pending.pop(job_id, None)
+        self._update_busy()
+        if pending is None or (pending.key is not None and self._latest_by_key.get(pending.key) != job_id):
+            return None
+        return pending
+
+    def _on_finished(self, job_id: int, result: Any) -> None:
+        pending = self._take_current(job_id)
+        if pending is not None and pending.on_result is not None:
+            pending.on_result(result)
+
+    def _on_failed(self, job_id: int, exc: Exception) -> None:
+        pending = self._take_current(job_id)
+        if pending is None:
+            return
+        if pending.on_error is not None:
+            pending.on_error(exc)
+        else:
+            self.error_occurred.emit(exc)
+
+    def _update_busy(self) -> None:
+        busy = self.is_busy()
+        if busy != self._busy:
+            self._busy = busy
+            self.busy_changed.emit(busy)
@@ -1,5 +1,11 @@
 # main_app.py
+from __future__ import annotations
+
 import sys
+from startup_timing import StartupTimer
+
+startup_timer = StartupTimer()  # Created before the heavy imports below so they count towards the measured start
+
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -17,35 +23,53 @@ from PySide6.QtWidgets import (
     QComboBox,
     QPlainTextEdit,
     QMessageBox,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QHeaderView,
     QSizePolicy,
     QDialog,
     QDialogButtonBox,
+    QProgressBar,
+    QListView,
+    QCheckBox,
+    QSpinBox,
 )
-from PySide6.QtCore import QDate, Qt # type: ignore
-from PySide6.QtGui import QIcon, QFont # type: ignore
+from PySide6.QtCore import QDate, QSignalBlocker, Qt, QTimer # type: ignore
+from PySide6.QtGui import QIcon, QFont, QCloseEvent # type: ignore
 from PySide6.QtCore import QCoreApplication  # type: ignore # Explicitly import for QApplication
 
-from datetime import date, timedelta
-from typing import Optional, Dict, Tuple, List, Any
+from datetime import date
+from typing import TYPE_CHECKING, Callable, Optional, Dict, Set, Tuple, List, Any
 
-from database import ProjectManagerDB, Project, Phase, Epic,  DailyLog #Task, SubTask,
+from db_worker import DbWorker
+from refresh_scheduler import RefreshScheduler
 from config import ConfigManager
-import qdarktheme # type: ignore 
+from theme import THEME_SETTING, apply_theme, configured_theme
 from PySide6.QtGui import QKeySequence, QShortcut
 
+from tabs.lazy_tab import LazyTab # type: ignore
 from tabs.tab_project_selection import ProjectSelectionTab # type: ignore
-from tabs.tab_project_setup import ProjectSetupTab # type: ignore
-from tabs.tab_daily_runner import DailyRunnerTab # type: ignore
-from tabs.tab_properties import PropertiesTab # type: ignore
-from tabs.tab_view_logs import ViewLogsTab # type: ignore
+
+if TYPE_CHECKING:
+    # database (SQLAlchemy), work_calendar (NumPy) and the other tabs are imported where first used, after the window has painted
+    from database import ProjectManagerDB, Project, ProjectDirectoryEntry, Phase, Epic, Task, DailyLog, LogSearchHit, PhaseSpec, PlanSnapshot, PlanRollups, DateShiftResult #SubTask,
+    from tabs.tab_project_setup import ProjectSetupTab # type: ignore
+    from tabs.tab_daily_runner import DailyRunnerTab # type: ignore
+    from tabs.tab_properties import PropertiesTab # type: ignore
+    from tabs.tab_view_logs import ViewLogsTab # type: ignore
+    from tabs.tab_capacity import CapacityTab # type: ignore
+    from tabs.tab_my_work import MyWorkTab # type: ignore
+    from tabs.tab_schedule_risk import ScheduleRiskTab # type: ignore
+    from work_calendar import WorkCalendar
+    from capacity import CapacityMatrix
+    from critical_path import CriticalPath
+    from schedule_risk import RiskModel, RiskSettings, ScheduleRiskResult, ScheduleRiskRunner
+
+startup_timer.mark("imports")
 
 class ProjectPlannerApp(QMainWindow):
     """
     Main application window for the Project Planning & Daily Runner.
-    Provides tabs for Project Setup, Daily Runner, Properties, and Log Viewer.
+    Provides tabs for Project Setup, Daily Runner, Properties, Log Viewer, Team Capacity, My Work and Schedule Risk.
     """
 
     def __init__(self) -> None:
@@ -54,21 +78,46 @@ class ProjectPlannerApp(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
         self.showMaximized()  # Start in full screen
 
-        # Initialize database and config managers
-        self.db_manager: ProjectManagerDB = ProjectManagerDB()
-        self.config_manager: ConfigManager = ConfigManager()
+        # Initialize the config manager; the database is opened by the worker once the window has painted
+        self.config_manager: ConfigManager = ConfigManager(watch=True)  # Picks up edits made by other instances
+        # Styled before any tab is built, from the stylesheet cache when it has the configured theme
+        apply_theme(configured_theme(self.config_manager))
+        startup_timer.mark("stylesheet")
+        self.db_manager: Optional[ProjectManagerDB] = None
+        # All database calls go through the worker so they never block the event loop
+        self.db_worker: DbWorker = DbWorker(parent=self)
+        self.db_worker.error_occurred.connect(self._on_db_error)
+        # Views are reloaded by marking them dirty; one flush per event-loop turn does the loading
+        self.refresh_scheduler: RefreshScheduler = RefreshScheduler(self)
+        self.config_manager.add_reload_listener(self._on_config_reloaded)
 
         # State variables
         self._current_project_id: Optional[int] = None
+        self._projects: Dict[int, ProjectDirectoryEntry] = {}  # Directory entries from the last combo refresh
         self._current_log_date: QDate = QDate.currentDate()  # For the daily runner tab
-
-        # UI Widgets (declared with type hints for clarity)
+        self._pending_project_selection: Optional[int] = None  # Project to select when the directory reload lands
+
+        # UI Widgets (declared with type hints for clarity); widgets of lazily built tabs exist once their tab is shown
+        self.project_setup_tab: ProjectSetupTab
+        self.daily_runner_tab: DailyRunnerTab
+        self.properties_tab: PropertiesTab
+        self.view_logs_tab: ViewLogsTab
+        self.capacity_tab: CapacityTab
+        self.my_work_tab: MyWorkTab
+        self.schedule_risk_tab: ScheduleRiskTab
+        self.capacity_matrix: Optional[CapacityMatrix] = None  # Built on the first capacity load, then updated per task
+        self.critical_path: Optional[CriticalPath] = None  # Of the project in _critical_path_project_id, updated per task
+        self._critical_path_project_id: Optional[int] = None
+        self.schedule_risk_runner: Optional[ScheduleRiskRunner] = None  # Starts its worker processes on the first simulation
+        self._schedule_risk_run: int = 0  # Bumped per run and on cancel, so a cancelled run's schedule load is dropped
+        # Project name, task rows and target note of the running simulation
+        self._schedule_risk_shown: Tuple[str, List[Any], str] = ("", [], "")
         self.project_combo: QComboBox
         self.project_name_input: QLineEdit
         self.project_start_date_input: QDateEdit
         self.project_end_date_target_input: QDateEdit
         self.create_project_btn: QPushButton
-        self.project_plan_tree: QTreeWidget
+        self.project_plan_tree: QTreeView
         self.add_phase_btn: QPushButton
         self.add_epic_btn: QPushButton
         self.add_task_btn: QPushButton
@@ -87,14 +136,17 @@ class ProjectPlannerApp(QMainWindow):
         self.property_inputs: Dict[Tuple[str, str], QLineEdit] = {}
         self.save_properties_btn: QPushButton
         self.log_project_combo: QComboBox
-        self.daily_logs_display: QPlainTextEdit
+        self.daily_logs_view: QListView
 
         self._setup_ui()
-        # Populate project dropdowns after widgets are wired up
-        self._populate_project_combos()
+        self._setup_busy_indicator()
+        self._setup_refresh_scheduler()
+        # Runs on the first event-loop turn, once the window has been painted
+        QTimer.singleShot(0, self._open_database)
+        startup_timer.mark("window")
 
     def _setup_ui(self) -> None:
-        """Sets up the main window's user interface."""
+        """Sets up the main window's user interface. Only the first tab is built here; the others are built when first shown."""
         self.central_widget: QWidget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.main_layout: QVBoxLayout = QVBoxLayout(self.central_widget)
@@ -106,96 +158,154 @@ class ProjectPlannerApp(QMainWindow):
         # --- Project Selection Tab ---
         self.project_selection_tab = ProjectSelectionTab(
             parent=self,
-            on_project_selected=lambda: None,  # Placeholder, will wire up after instantiation
-            create_project_callback=lambda: None,
+            on_project_selected=self._on_project_selected,
+            create_project_callback=self._create_new_project,
         )
         self.tab_widget.addTab(self.project_selection_tab, "0. Project Selection")
+        self.project_combo = self.project_selection_tab.project_combo
+        self.project_name_input = self.project_selection_tab.project_name_input
+        self.project_start_date_input = self.project_selection_tab.project_start_date_input
+        self.project_end_date_target_input = self.project_selection_tab.project_end_date_target_input
+        self.create_project_btn = self.project_selection_tab.create_project_btn
+        with QSignalBlocker(self.project_combo):
+            self.project_combo.addItem("Loading projects...")
+        self.project_combo.setEnabled(False)
+
+        # --- Remaining tabs, built on first activation ---
+        self.project_setup_page = LazyTab(self._build_project_setup_tab)
+        self.tab_widget.addTab(self.project_setup_page, "1. Project Setup & Plan")
+        self.daily_runner_page = LazyTab(self._build_daily_runner_tab)
+        self.tab_widget.addTab(self.daily_runner_page, "2. Daily Runner")
+        self.properties_page = LazyTab(self._build_properties_tab)
+        self.tab_widget.addTab(self.properties_page, "3. Application Properties")
+        self.view_logs_page = LazyTab(self._build_view_logs_tab)
+        self.tab_widget.addTab(self.view_logs_page, "4. View Daily Logs")
+        self.capacity_page = LazyTab(self._build_capacity_tab)
+        self.tab_widget.addTab(self.capacity_page, "5. Team Capacity")
+        self.my_work_page = LazyTab(self._build_my_work_tab)
+        self.tab_widget.addTab(self.my_work_page, "6. My Work")
+        self.schedule_risk_page = LazyTab(self._build_schedule_risk_tab)
+        self.tab_widget.addTab(self.schedule_risk_page, "7. Schedule Risk")
+        # Bring freshly built tabs up to date with the state gathered while they did not exist
+        self.daily_runner_page.built.connect(self._update_current_project_label)
+        self.view_logs_page.built.connect(self._fill_log_project_combo)
+        self.view_logs_page.built.connect(self._update_log_search_availability)
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
-        # --- Project Setup Tab ---
-        self.project_setup_tab = ProjectSetupTab(
-            parent=self,
-            show_add_phase=lambda: None,
-            show_add_epic=lambda: None,
-            show_add_task=lambda: None,
-            add_initial_plan=lambda: None,
+        # Keyboard shortcuts for Add Phase, Add Epic, Add Task
+        self.add_phase_shortcut = QShortcut(QKeySequence("Ctrl+h"), self)
+        self.add_phase_shortcut.activated.connect(lambda: self._run_on_setup_tab(self._show_add_phase_dialog))
+        self.add_epic_shortcut = QShortcut(QKeySequence("Ctrl+j"), self)
+        self.add_epic_shortcut.activated.connect(lambda: self._run_on_setup_tab(self._show_add_epic_dialog))
+        self.add_task_shortcut = QShortcut(QKeySequence("Ctrl+l"), self)
+        self.add_task_shortcut.activated.connect(lambda: self._run_on_setup_tab(self._show_add_task_dialog))
+
+    def _setup_refresh_scheduler(self) -> None:
+        """Registers the reloadable views; the plan and log views only load while their tab is showing."""
+        scheduler = self.refresh_scheduler
+        plan_visible = lambda: self.tab_widget.currentWidget() is self.project_setup_page
+        scheduler.register("projects", self._reload_project_directory)
+        scheduler.register("plan_tree", self._load_project_plan_tree, plan_visible)
+        scheduler.register("plan_rollups", self._load_plan_rollups, plan_visible)
+        scheduler.register("critical_path", self._load_critical_path, plan_visible)
+        scheduler.register("daily_logs", self._load_daily_logs_display, lambda: self.tab_widget.currentWidget() is self.view_logs_page)
+        scheduler.register("capacity", self._load_capacity, lambda: self.tab_widget.currentWidget() is self.capacity_page)
+        scheduler.register("my_work", self._load_my_work, lambda: self.tab_widget.currentWidget() is self.my_work_page)
+
+    def _run_on_setup_tab(self, action: Callable[[], None]) -> None:
+        """Brings the Project Setup tab forward before a plan shortcut runs, so a deferred plan load starts."""
+        self.tab_widget.setCurrentWidget(self.project_setup_page)
+        action()
+
+    def _plan_is_loaded(self) -> bool:
+        """True when the plan tree shows the current project, warning the user otherwise."""
+        if self.project_setup_tab.shown_project_id() == self._current_project_id:
+            return True
+        QMessageBox.information(self, "Plan Loading", "The project plan is still loading. Please try again in a moment.")
+        return False
+
+    def _setup_busy_indicator(self) -> None:
+        """Shows an indeterminate progress bar in the status bar while database jobs are running."""
+        self.busy_label: QLabel = QLabel("Working...")
+        self.busy_bar: QProgressBar = QProgressBar()
+        self.busy_bar.setRange(0, 0)
+        self.busy_bar.setMaximumWidth(150)
+        self.statusBar().addPermanentWidget(self.busy_label)
+        self.statusBar().addPermanentWidget(self.busy_bar)
+        self._on_busy_changed(False)
+        self.db_worker.busy_changed.connect(self._on_busy_changed)
+
+    def _on_busy_changed(self, busy: bool) -> None:
+        self.busy_label.setVisible(busy)
+        self.busy_bar.setVisible(busy)
+
+    def _on_db_error(self, error: Exception) -> None:
+        """Reports a failed background database job that has no dedicated error handler."""
+        QMessageBox.critical(self, "Database Error", f"Database operation failed: {error}")
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Lets queued database writes finish before the window closes, and stops the simulation workers."""
+        self.db_worker.wait_for_done()
+        if self.schedule_risk_runner is not None:
+            self.schedule_risk_runner.shutdown()
+        super().closeEvent(event)
+
+    def _open_database(self) -> None:
+        """Opens the database on the worker thread (schema setup and migrations included), then lists the projects."""
+        startup_timer.mark("first paint")
+        pragma_profile: Optional[str] = self.config_manager.get_property("DATABASE", "Profile")
+
+        def open_db() -> ProjectManagerDB:
+            from database import DEFAULT_PRAGMA_PROFILE, ProjectManagerDB
+            return ProjectManagerDB(pragma_profile=pragma_profile or DEFAULT_PRAGMA_PROFILE)
+
+        self.db_worker.open(
+            open_db,
+            on_result=self._on_database_opened,
+            on_error=lambda e: QMessageBox.critical(self, "Database Error", f"Failed to open the database: {e}"),
         )
-        self.tab_widget.addTab(self.project_setup_tab, "1. Project Setup & Plan")
+        # Queued behind the open, so it runs against the opened database
+        self._populate_project_combos()
 
-        # --- Daily Runner Tab ---
-        self.daily_runner_tab = DailyRunnerTab(
-            parent=self,
-            on_log_date_changed=lambda: None,
-            simulate_next_day=lambda: None,
-            submit_daily_log=lambda: None,
-        )
-        self.tab_widget.addTab(self.daily_runner_tab, "2. Daily Runner")
+    def _on_database_opened(self, db_manager: ProjectManagerDB) -> None:
+        startup_timer.mark("database open")
+        self.db_manager = db_manager
+        self._update_log_search_availability()
 
-        # --- Properties Tab ---
-        self.properties_tab = PropertiesTab(
-            parent=self,
-            config_manager=self.config_manager,
-            save_properties_callback=lambda: None,
-        )
-        self.tab_widget.addTab(self.properties_tab, "3. Application Properties")
+    def _on_tab_changed(self, index: int) -> None:
+        """Builds a tab the first time it is shown, then lets deferred refreshes for it run."""
+        page = self.tab_widget.widget(index)
+        if isinstance(page, LazyTab):
+            page.widget()
+        self.refresh_scheduler.visibility_changed()
 
-        # --- View Logs Tab ---
-        self.view_logs_tab = ViewLogsTab(
+    def _build_project_setup_tab(self) -> QWidget:
+        from tabs.tab_project_setup import ProjectSetupTab # type: ignore
+        self.project_setup_tab = ProjectSetupTab(
             parent=self,
-            load_daily_logs_display_callback=lambda: None,
+            show_add_phase=self._show_add_phase_dialog,
+            show_add_epic=self._show_add_epic_dialog,
+            show_add_task=self._show_add_task_dialog,
+            add_initial_plan=self._add_initial_project_plan,
+            show_bulk_edit=self._show_bulk_edit_dialog,
+            show_add_dependency=self._show_add_dependency_dialog,
+            show_shift_dates=self._show_shift_dates_dialog,
         )
-        self.tab_widget.addTab(self.view_logs_tab, "4. View Daily Logs")
-
-        # Now wire up the real callbacks and cross-tab references
-        self._wire_up_tabs()
-
-        # Keyboard shortcuts for Add Phase, Add Epic, Add Task
-        self.add_phase_shortcut = QShortcut(QKeySequence("Ctrl+h"), self)
-        self.add_phase_shortcut.activated.connect(self._show_add_phase_dialog)
-        self.add_epic_shortcut = QShortcut(QKeySequence("Ctrl+j"), self)
-        self.add_epic_shortcut.activated.connect(self._show_add_epic_dialog)
-        self.add_task_shortcut = QShortcut(QKeySequence("Ctrl+l"), self)
-        self.add_task_shortcut.activated.connect(self._show_add_task_dialog)
-
-    def _wire_up_tabs(self) -> None:
-        # Project Selection Tab
-        self.project_selection_tab.project_combo.currentIndexChanged.disconnect()
-        self.project_selection_tab.project_combo.currentIndexChanged.connect(self._on_project_selected)
-        self.project_selection_tab.create_project_btn.clicked.disconnect()
-        self.project_selection_tab.create_project_btn.clicked.connect(self._create_new_project)
-        # Project Setup Tab
-        self.project_setup_tab.add_phase_btn.clicked.disconnect()
-        self.project_setup_tab.add_phase_btn.clicked.connect(self._show_add_phase_dialog)
-        self.project_setup_tab.add_epic_btn.clicked.disconnect()
-        self.project_setup_tab.add_epic_btn.clicked.connect(self._show_add_epic_dialog)
-        self.project_setup_tab.add_task_btn.clicked.disconnect()
-        self.project_setup_tab.add_task_btn.clicked.connect(self._show_add_task_dialog)
-        self.project_setup_tab.add_initial_plan_btn.clicked.disconnect()
-        self.project_setup_tab.add_initial_plan_btn.clicked.connect(self._add_initial_project_plan)
-        # Daily Runner Tab
-        self.daily_runner_tab.current_log_date_display.dateChanged.disconnect()
-        self.daily_runner_tab.current_log_date_display.dateChanged.connect(self._on_log_date_changed)
-        self.daily_runner_tab.simulate_next_day_btn.clicked.disconnect()
-        self.daily_runner_tab.simulate_next_day_btn.clicked.connect(self._simulate_next_day)
-        self.daily_runner_tab.submit_daily_log_btn.clicked.disconnect()
-        self.daily_runner_tab.submit_daily_log_btn.clicked.connect(self._submit_daily_log)
-        # Properties Tab
-        self.properties_tab.save_properties_btn.clicked.disconnect()
-        self.properties_tab.save_properties_btn.clicked.connect(self._save_properties)
-        # View Logs Tab
-        self.view_logs_tab.log_project_combo.currentIndexChanged.disconnect()
-        self.view_logs_tab.log_project_combo.currentIndexChanged.connect(self._load_daily_logs_display)
-
-        # Set up cross-references for shared widgets if needed
-        self.project_combo = self.project_selection_tab.project_combo
-        self.project_name_input = self.project_selection_tab.project_name_input
-        self.project_start_date_input = self.project_selection_tab.project_start_date_input
-        self.project_end_date_target_input = self.project_selection_tab.project_end_date_target_input
-        self.create_project_btn = self.project_selection_tab.create_project_btn
         self.project_plan_tree = self.project_setup_tab.project_plan_tree
         self.add_phase_btn = self.project_setup_tab.add_phase_btn
         self.add_epic_btn = self.project_setup_tab.add_epic_btn
         self.add_task_btn = self.project_setup_tab.add_task_btn
         self.add_initial_plan_btn = self.project_setup_tab.add_initial_plan_btn
+        return self.project_setup_tab
+
+    def _build_daily_runner_tab(self) -> QWidget:
+        from tabs.tab_daily_runner import DailyRunnerTab # type: ignore
+        self.daily_runner_tab = DailyRunnerTab(
+            parent=self,
+            on_log_date_changed=self._on_log_date_changed,
+            simulate_next_day=self._simulate_next_day,
+            submit_daily_log=self._submit_daily_log,
+        )
         self.current_project_label = self.daily_runner_tab.current_project_label
         self.current_log_date_display = self.daily_runner_tab.current_log_date_display
         self.simulate_next_day_btn = self.daily_runner_tab.simulate_next_day_btn
@@ -207,10 +317,71 @@ class ProjectPlannerApp(QMainWindow):
         self.next_steps_us_input = self.daily_runner_tab.next_steps_us_input
         self.next_steps_india_input = self.daily_runner_tab.next_steps_india_input
         self.submit_daily_log_btn = self.daily_runner_tab.submit_daily_log_btn
+        with QSignalBlocker(self.current_log_date_display):
+            self.current_log_date_display.setDate(self._current_log_date)
+        return self.daily_runner_tab
+
+    def _build_properties_tab(self) -> QWidget:
+        from tabs.tab_properties import PropertiesTab # type: ignore
+        self.properties_tab = PropertiesTab(
+            parent=self,
+            config_manager=self.config_manager,
+            save_properties_callback=self._save_properties,
+            current_theme=configured_theme(self.config_manager),
+            on_theme_changed=self._on_theme_changed,
+        )
         self.property_inputs = self.properties_tab.property_inputs
         self.save_properties_btn = self.properties_tab.save_properties_btn
+        return self.properties_tab
+
+    def _build_view_logs_tab(self) -> QWidget:
+        from tabs.tab_view_logs import ViewLogsTab # type: ignore
+        self.view_logs_tab = ViewLogsTab(
+            parent=self,
+            load_daily_logs_display_callback=lambda: self.refresh_scheduler.mark_dirty("daily_logs"),
+            request_log_page=self._request_daily_log_page,
+            search_logs=self._search_daily_logs,
+            jump_to_log=self._jump_to_log,
+            rebuild_search_index=self._rebuild_log_search_index,
+        )
         self.log_project_combo = self.view_logs_tab.log_project_combo
-        self.daily_logs_display = self.view_logs_tab.daily_logs_display
+        self.daily_logs_view = self.view_logs_tab.daily_logs_view
+        return self.view_logs_tab
+
+    def _build_capacity_tab(self) -> QWidget:
+        from tabs.tab_capacity import CapacityTab # type: ignore
+        self.capacity_tab = CapacityTab(parent=self, refresh=lambda: self.refresh_scheduler.mark_dirty("capacity"))
+        self.refresh_scheduler.mark_dirty("capacity")
+        return self.capacity_tab
+
+    def _build_my_work_tab(self) -> QWidget:
+        from tabs.tab_my_work import MyWorkTab # type: ignore
+        self.my_work_tab = MyWorkTab(
+            parent=self,
+            load_my_work_callback=lambda: self.refresh_scheduler.mark_dirty("my_work"),
+            open_task=self._open_my_work_task,
+        )
+        self.refresh_scheduler.mark_dirty("my_work")
+        return self.my_work_tab
+
+    def _build_schedule_risk_tab(self) -> QWidget:
+        from tabs.tab_schedule_risk import ScheduleRiskTab # type: ignore
+        from schedule_risk import risk_settings
+        self.schedule_risk_tab = ScheduleRiskTab(
+            parent=self,
+            run_simulation=self._run_schedule_risk,
+            cancel_simulation=self._cancel_schedule_risk,
+            default_iterations=risk_settings(self.config_manager).iterations,
+        )
+        return self.schedule_risk_tab
+
+    def _update_log_search_availability(self) -> None:
+        """Disables log search when the opened database's SQLite lacks FTS5."""
+        if self.db_manager is None or not self.view_logs_page.is_built() or self.db_manager.log_search_available:
+            return
+        self.view_logs_tab.log_search_input.setEnabled(False)
+        self.view_logs_tab.log_search_input.setPlaceholderText("Log search needs SQLite with FTS5 support.")
+        self.view_logs_tab.rebuild_search_index_btn.setEnabled(False)
 
     def _show_add_phase_dialog(self) -> None:
         if self._current_project_id is None:
@@ -219,124 +390,119 @@ class ProjectPlannerApp(QMainWindow):
         dialog = PhaseDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
-            phase = self.db_manager.add_phase(
-                project_id=self._current_project_id,
-                name=data["name"],
-                description=data["description"],
-                start_date=data["start_date"],
-                end_date=data["end_date"]
+            project_id: int = self._current_project_id
+            self.db_worker.submit(
+                lambda db: db.add_phase(
+                    project_id=project_id,
+                    name=data["name"],
+                    description=data["description"],
+                    start_date=data["start_date"],
+                    end_date=data["end_date"]
+                ),
+                on_result=self._on_phase_added,
             )
-            # Add to UI tree
-            phase_item = QTreeWidgetItem([phase.name, phase.description or "", "", "", ""])
-            self.project_plan_tree.addTopLevelItem(phase_item)
+
+    def _on_phase_added(self, phase: Phase) -> None:
+        """Adds a newly saved phase to the UI tree."""
+        if phase.project_id == self._current_project_id:
+            from tabs.tab_project_setup import plan_row_values  # type: ignore
+            self.project_setup_tab.add_plan_item("phase", phase.id, None, plan_row_values("phase", phase))
 
     def _show_add_epic_dialog(self) -> None:
-        selected_phase_item = self.project_plan_tree.currentItem()
-        if selected_phase_item is None: # type: ignore
-            if self.project_plan_tree.topLevelItemCount() > 0:
-                temp = self.project_plan_tree.topLevelItem(0)
-                if temp is not None:
-                    selected_phase_item = temp
-                    self.project_plan_tree.setCurrentItem(selected_phase_item)
-                else:
-                    QMessageBox.warning(self, "No Phase Available", "No phases exist. Please add a phase first.")
-                    return
-            else:
+        if not self._plan_is_loaded():
+            return
+        setup_tab = self.project_setup_tab
+        phase_key = setup_tab.ancestor_key(setup_tab.current_plan_key(), "phase")
+        if phase_key is None:
+            phase_key = next(iter(setup_tab.child_keys(None)), None)
+            if phase_key is None:
                 QMessageBox.warning(self, "No Phase Available", "No phases exist. Please add a phase first.")
                 return
-        elif selected_phase_item.parent():
-            parent = selected_phase_item
-            while parent.parent():
-                parent = parent.parent()
-            selected_phase_item = parent
-            self.project_plan_tree.setCurrentItem(selected_phase_item)
-        if selected_phase_item is None: # type: ignore
-            return
-        phase_name = selected_phase_item.text(0)
-        phase_id = None
-        for project in self.db_manager.get_all_projects():
-            for phase in project.phases:
-                if phase.name == phase_name:
-                    phase_id = phase.id
-                    break
-        if phase_id is None:
-            QMessageBox.warning(self, "Phase Not Found", "Could not find the selected phase in the database.")
-            return
+        setup_tab.select_plan_item(phase_key)
         dialog = EpicDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
-            epic = self.db_manager.add_epic(
-                phase_id=phase_id,
-                name=data["name"],
-                description=data["description"],
-                status=data["status"]
+            self.db_worker.submit(
+                lambda db: db.add_epic(
+                    phase_id=phase_key[1],
+                    name=data["name"],
+                    description=data["description"],
+                    status=data["status"]
+                ),
+                on_result=self._on_epic_added,
             )
-            epic_item = QTreeWidgetItem([epic.name, epic.description or "", "", epic.status, ""])
-            selected_phase_item.addChild(epic_item)
-            selected_phase_item.setExpanded(True)
+
+    def _on_epic_added(self, epic: Epic) -> None:
+        """Adds a newly saved epic under its phase in the UI tree."""
+        from tabs.tab_project_setup import plan_row_values  # type: ignore
+        if self.project_setup_tab.add_plan_item("epic", epic.id, ("phase", epic.phase_id), plan_row_values("epic", epic)):
+            self.refresh_scheduler.mark_dirty("plan_rollups")
 
     def _show_add_task_dialog(self) -> None:
-        selected_epic_item = self.project_plan_tree.currentItem()
-        if selected_epic_item is None: # type: ignore
-            found = False
-            for i in range(self.project_plan_tree.topLevelItemCount()):
-                phase_item = self.project_plan_tree.topLevelItem(i)
-                if phase_item is not None:
-                    for j in range(phase_item.childCount()):
-                        temp = phase_item.child(j)
-                        if temp is not None: # type: ignore
-                            selected_epic_item = temp
-                            self.project_plan_tree.setCurrentItem(selected_epic_item)
-                            found = True
-                            break
-                if found:
-                    break
-            if selected_epic_item is None: # type: ignore
+        if not self._plan_is_loaded():
+            return
+        setup_tab = self.project_setup_tab
+        current_key = setup_tab.current_plan_key()
+        epic_key = setup_tab.ancestor_key(current_key, "epic")
+        if epic_key is None:
+            # Fall back to the first epic of the selected phase, or of the whole plan
+            phase_key = setup_tab.ancestor_key(current_key, "phase")
+            phase_keys = [phase_key] if phase_key is not None else setup_tab.child_keys(None)
+            epic_key = next((epic_keys[0] for epic_keys in map(setup_tab.child_keys, phase_keys) if epic_keys), None)
+            if epic_key is None:
                 QMessageBox.warning(self, "No Epic Available", "No epics exist. Please add an epic first.")
                 return
-        elif selected_epic_item.parent() and selected_epic_item.parent().parent():
-            while selected_epic_item.parent() and selected_epic_item.parent().parent():
-                selected_epic_item = selected_epic_item.parent()
-            self.project_plan_tree.setCurrentItem(selected_epic_item)
-        if selected_epic_item is None: # type: ignore
-            return
-        epic_name = selected_epic_item.text(0)
-        phase_item = selected_epic_item.parent()
-        phase_name = phase_item.text(0) if phase_item else None
-        epic_id = None
-        for project in self.db_manager.get_all_projects():
-            for phase in project.phases:
-                if phase.name == phase_name:
-                    for epic in phase.epics:
-                        if epic.name == epic_name:
-                            epic_id = epic.id
-                            break
-        if epic_id is None:
-            QMessageBox.warning(self, "Epic Not Found", "Could not find the selected epic in the database.")
-            return
+        setup_tab.select_plan_item(epic_key)
         dialog = TaskDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
-            task = self.db_manager.add_task(
-                epic_id=epic_id,
-                name=data["name"],
-                description=data["description"],
-                assigned_to=data["assigned_to"],
-                priority=data["priority"],
-                status=data["status"],
-                jira_link=data["jira_link"],
-                start_date=data["start_date"],
-                due_date=data["due_date"]
+            self.db_worker.submit(
+                lambda db: db.add_task(
+                    epic_id=epic_key[1],
+                    name=data["name"],
+                    description=data["description"],
+                    assigned_to=data["assigned_to"],
+                    priority=data["priority"],
+                    status=data["status"],
+                    jira_link=data["jira_link"],
+                    start_date=data["start_date"],
+                    due_date=data["due_date"]
+                ),
+                on_result=self._on_task_added,
             )
-            task_item = QTreeWidgetItem([
-                task.name,
-                task.description or "",
-                task.assigned_to or "",
-                task.status,
-                str(task.due_date) if task.due_date else ""
-            ])
-            selected_epic_item.addChild(task_item)
-            selected_epic_item.setExpanded(True)
+
+    def _on_task_added(self, task: Task) -> None:
+        """Adds a newly saved task under its epic in the UI tree."""
+        from tabs.tab_project_setup import plan_row_values  # type: ignore
+        # Formatted as the snapshot merge formats it, so the next plan refresh leaves the row unchanged
+        if self.project_setup_tab.add_plan_item("task", task.id, ("epic", task.epic_id), plan_row_values("task", task)):
+            self.refresh_scheduler.mark_dirty("plan_rollups")
+        self.refresh_scheduler.mark_dirty("my_work")
+        self._apply_task_changes([task.id])
+
+    def _show_bulk_edit_dialog(self) -> None:
+        """Applies status, assignee and date changes to every selected task at once."""
+        task_ids: List[int] = self.project_setup_tab.selected_plan_ids("task")
+        if not task_ids:
+            QMessageBox.warning(self, "No Tasks Selected", "Select one or more tasks in the plan (Ctrl/Shift-click) first.")
+            return
+        dialog = BulkEditDialog(len(task_ids), self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        fields: Dict[str, Any] = dialog.get_data()
+        if not fields:
+            return
+        self.db_worker.submit(
+            lambda db: db.bulk_update_tasks(task_ids, **fields),
+            on_result=self._on_tasks_bulk_updated,
+            on_error=lambda e: QMessageBox.critical(self, "Bulk Edit Failed", f"Failed to update tasks: {e}"),
+        )
+
+    def _on_tasks_bulk_updated(self, rows: List[Any]) -> None:
+        """Patches only the edited task rows in the tree, then refreshes the progress rollups."""
+        self.project_setup_tab.patch_task_items(rows)
+        self.refresh_scheduler.mark_dirty("plan_rollups", "my_work")
+        self._apply_task_changes([row.id for row in rows])
 
     def _create_new_project(self) -> None:
         """Creates a new project based on user input."""
@@ -351,103 +517,370 @@ class ProjectPlannerApp(QMainWindow):
         start_date_py: date = date(start_date_q.year(), start_date_q.month(), start_date_q.day())
         end_date_target_py: date = date(end_date_target_q.year(), end_date_target_q.month(), end_date_target_q.day())
 
-        existing_project: Optional[Project] = self.db_manager.get_project_by_name(name)
-        if existing_project:
-            QMessageBox.warning(self, "Duplicate Project", f"Project with name '{name}' already exists.")
-            return
+        def create(db: ProjectManagerDB) -> Optional[Project]:
+            # None signals a duplicate name; the check and insert run back to back on the worker
+            if db.project_exists(name):
+                return None
+            return db.create_project(name, start_date_py, end_date_target_py)
 
-        try:
-            project: Project = self.db_manager.create_project(name, start_date_py, end_date_target_py)
+        def on_created(project: Optional[Project]) -> None:
+            if project is None:
+                QMessageBox.warning(self, "Duplicate Project", f"Project with name '{name}' already exists.")
+                return
             QMessageBox.information(self, "Success", f"Project '{project.name}' created successfully!")
             self.project_name_input.clear()
-            self._populate_project_combos() # Refresh combos and select new project
-        except Exception as e:
-            QMessageBox.critical(self, "Database Error", f"Failed to create project: {e}")
-
-    def _populate_project_combos(self) -> None:
-        """Refreshes the project dropdowns in Project Setup and View Logs tabs."""
-        self.project_combo.clear()
-        self.log_project_combo.clear()
-        projects: List[Project] = self.db_manager.get_all_projects()
-        if not projects:
-            self.project_combo.addItem("No Projects Yet - Create One!")
-            self.project_combo.setEnabled(False)
-            self.log_project_combo.addItem("No Projects Yet")
-            self.log_project_combo.setEnabled(False)
-            self._current_project_id = None
-            self.current_project_label.setText("Current Project: <None Selected>")
-            self.project_plan_tree.clear() # Clear tree if no projects
-        else:
-            self.project_combo.setEnabled(True)
-            self.log_project_combo.setEnabled(True)
-            for project in projects:
-                self.project_combo.addItem(project.name, userData=project.id)
+            self._populate_project_combos(select_project_id=project.id) # Refresh combos and select new project
+
+        self.db_worker.submit(
+            create,
+            on_result=on_created,
+            on_error=lambda e: QMessageBox.critical(self, "Database Error", f"Failed to create project: {e}"),
+        )
+
+    def _populate_project_combos(self, select_project_id: Optional[int] = None) -> None:
+        """Schedules a refresh of the project dropdowns in Project Setup and View Logs tabs."""
+        if select_project_id is not None:
+            self._pending_project_selection = select_project_id
+        self.refresh_scheduler.mark_dirty("projects")
+
+    def _reload_project_directory(self) -> None:
+        """Loads the project directory in the background and refills both dropdowns."""
+        self.db_worker.submit(
+            lambda db: db.get_project_directory(),
+            on_result=self._fill_project_combos,
+            key="project_directory",
+        )
+
+    def _fill_project_combos(self, projects: List[ProjectDirectoryEntry]) -> None:
+        """Fills both project dropdowns from a loaded project directory."""
+        select_project_id: Optional[int] = self._pending_project_selection or self._current_project_id
+        self._pending_project_selection = None
+        self._projects = {project.id: project for project in projects}
+        # Refilling fires currentIndexChanged on every change; the selection is handled once below instead
+        with QSignalBlocker(self.project_combo):
+            self.project_combo.clear()
+            if not projects:
+                self.project_combo.addItem("No Projects Yet - Create One!")
+                self.project_combo.setEnabled(False)
+            else:
+                self.project_combo.setEnabled(True)
+                for project in projects:
+                    self.project_combo.addItem(project.name, userData=project.id)
+                # Keep the requested (or current) project selected, falling back to the first one
+                index: int = self.project_combo.findData(select_project_id) if select_project_id is not None else 0
+                self.project_combo.setCurrentIndex(max(index, 0))
+        self._fill_log_project_combo()
+        self._on_project_selected()
+        startup_timer.finish("projects listed")
+
+    def _fill_log_project_combo(self) -> None:
+        """Mirrors the loaded project directory into the View Logs dropdown once that tab has been built."""
+        if not self.view_logs_page.is_built():
+            return
+        with QSignalBlocker(self.log_project_combo):
+            self.log_project_combo.clear()
+            if not self._projects:
+                self.log_project_combo.addItem("No Projects Yet")
+            for project in self._projects.values():
                 self.log_project_combo.addItem(project.name, userData=project.id)
-            # Set initial selection to the first project if available
-            self.project_combo.setCurrentIndex(0) # Triggers _on_project_selected
-            # The _on_project_selected will handle setting _current_project_id and loading plan/logs
+            self.log_project_combo.setEnabled(bool(self._projects))
+        self._sync_log_project_combo()
 
-    def _on_project_selected(self) -> None:
-        """Handles project selection change in the Project Setup tab."""
-        project_id: Optional[int] = self.project_combo.currentData()
-        if project_id is not None:
-            self._current_project_id = project_id
+    def _sync_log_project_combo(self) -> None:
+        """Keeps the View Logs dropdown on the current project; its own change signal would only schedule the same refresh."""
+        if not self.view_logs_page.is_built():
+            return
+        with QSignalBlocker(self.log_project_combo):
+            self.log_project_combo.setCurrentIndex(max(self.log_project_combo.findData(self._current_project_id), 0))
+
+    def _update_current_project_label(self) -> None:
+        """Shows the current project in the Daily Runner tab once that tab has been built."""
+        if not self.daily_runner_page.is_built():
+            return
+        if self._current_project_id is not None:
             self.current_project_label.setText(f"Current Project: {self.project_combo.currentText()}")
-            self._load_project_plan_tree() # Load plan for the newly selected project
-            # Ensure the log combo also reflects the current project
-            if self.log_project_combo.currentData() != project_id:
-                index: int = self.log_project_combo.findData(project_id)
-                if index != -1:
-                    self.log_project_combo.setCurrentIndex(index)
-            else:
-                self._load_daily_logs_display() # Reload logs if it's the same project
         else:
-            self._current_project_id = None
             self.current_project_label.setText("Current Project: <None Selected>")
-            self.project_plan_tree.clear() # Clear tree if no project is selected
+
+    def _on_project_selected(self) -> None:
+        """Handles project selection change in the Project Setup tab."""
+        self._current_project_id = self.project_combo.currentData()
+        self._update_current_project_label()
+        self._sync_log_project_combo()
+        self.refresh_scheduler.mark_dirty("plan_tree", "daily_logs")
 
     def _load_project_plan_tree(self) -> None:
         """Loads and displays the project plan (phases, epics, tasks) in the tree view."""
-        self.project_plan_tree.clear()
         if self._current_project_id is None:
+            self.project_setup_tab.clear_plan_items()
             return
+        project_id: int = self._current_project_id
+        self.db_worker.submit(
+            lambda db: db.get_plan_snapshot(project_id),
+            on_result=lambda snapshot: self._show_plan_snapshot(project_id, snapshot),
+            key="plan_tree",
+        )
 
-        session = self.db_manager.get_session()
-        project: Optional[Project] = session.query(Project).get(self._current_project_id)
+    def _show_plan_snapshot(self, project_id: int, snapshot: PlanSnapshot) -> None:
+        """Shows a loaded snapshot in the plan tree, merging it in place when it refreshes the plan already shown."""
+        if project_id != self._current_project_id:
+            return
+        self.project_setup_tab.show_plan(project_id, snapshot)
+        self.refresh_scheduler.mark_dirty("plan_rollups", "critical_path")
 
-        if not project:
-            session.close()
+    def _load_plan_rollups(self) -> None:
+        """Loads task counts by status for the current project and shows them on phases, epics and the summary."""
+        if self._current_project_id is None:
             return
+        project_id: int = self._current_project_id
+        self.db_worker.submit(
+            lambda db: db.get_status_rollups(project_id),
+            on_result=lambda rollups: self._show_plan_rollups(project_id, rollups),
+            key="plan_rollups",
+        )
 
-        for phase in project.phases:
-            phase_item: QTreeWidgetItem = QTreeWidgetItem(
-                self.project_plan_tree, [phase.name, phase.description, "", "", ""]
-            )
-            for epic in phase.epics:
-                epic_item: QTreeWidgetItem = QTreeWidgetItem(
-                    phase_item, [epic.name, epic.description, "", epic.status, ""]
-                )
-                for task in epic.tasks:
-                    task_due_date: str = (
-                        task.due_date.strftime("%Y-%m-%d") if task.due_date else "N/A"
-                    )
-                    task_item: QTreeWidgetItem = QTreeWidgetItem(
-                        epic_item,
-                        [task.name, task.description, task.assigned_to, task.status, task_due_date],
-                    )
-                    for subtask in task.subtasks:
-                        subtask_item: QTreeWidgetItem = QTreeWidgetItem( # type: ignore
-                            task_item,
-                            [
-                                subtask.name,
-                                subtask.description,
-                                subtask.assigned_to,
-                                subtask.status,
-                                "",
-                            ],
-                        )
-        session.close()
-        self.project_plan_tree.expandAll() # Expand all items for better visibility
+    def _show_plan_rollups(self, project_id: int, rollups: PlanRollups) -> None:
+        if project_id == self._current_project_id:
+            self.project_setup_tab.show_rollups(rollups)
+
+    def _load_capacity(self) -> None:
+        """Loads every open task's assignees and dates and rebuilds the team capacity heatmap."""
+        self.db_worker.submit(lambda db: db.get_task_loads(), on_result=self._show_capacity, key="capacity")
+
+    def _show_capacity(self, rows: List[Any]) -> None:
+        from capacity import CapacityMatrix
+        self.capacity_matrix = CapacityMatrix(self.config_manager)
+        self.capacity_matrix.load_tasks(rows)
+        self.capacity_tab.show_matrix(self.capacity_matrix)
+
+    def _apply_task_changes(self, task_ids: List[int]) -> None:
+        """
+        Re-reads only the given tasks of the shown plan and adjusts the capacity matrix and the
+        critical path for them, instead of rebuilding either.
+        """
+        project_id: Optional[int] = self.project_setup_tab.shown_project_id()
+        if not task_ids or (self.capacity_matrix is None and self.critical_path is None):
+            return  # Nothing built yet; the first load will include these tasks
+
+        def apply(rows: List[Any]) -> None:
+            if self.capacity_matrix is not None:
+                self.capacity_matrix.update_tasks(rows)
+                self.capacity_tab.matrix_changed()
+            if self.critical_path is not None and self._critical_path_project_id == project_id:
+                self._show_critical_path_changes(self.critical_path.update_tasks(rows))
+
+        self.db_worker.submit(lambda db: db.get_task_loads(task_ids), on_result=apply)
+
+    def _load_critical_path(self) -> None:
+        """Loads the current project's task dates and dependencies and computes its critical path on the worker thread."""
+        if self._current_project_id is None:
+            return
+        from work_calendar import calendar_for
+        project_id: int = self._current_project_id
+        calendar: WorkCalendar = calendar_for(self.config_manager)  # Read here; the config is not used across threads
+
+        def compute(db: ProjectManagerDB) -> CriticalPath:
+            from critical_path import CriticalPath
+            schedule = db.get_schedule(project_id)
+            critical_path = CriticalPath(calendar)
+            critical_path.load(schedule.tasks, schedule.dependencies)
+            return critical_path
+
+        self.db_worker.submit(compute, on_result=lambda critical_path: self._show_critical_path(project_id, critical_path), key="critical_path")
+
+    def _show_critical_path(self, project_id: int, critical_path: CriticalPath) -> None:
+        if project_id != self._current_project_id:
+            return
+        self.critical_path = critical_path
+        self._critical_path_project_id = project_id
+        self._show_critical_path_changes(None)
+
+    def _show_critical_path_changes(self, changed: Optional[Set[int]]) -> None:
+        """Updates the highlighted critical tasks (only the changed ones if given) and the scheduled finish."""
+        if self.critical_path is None or self._critical_path_project_id != self.project_setup_tab.shown_project_id():
+            return
+        project: Optional[ProjectDirectoryEntry] = self._projects.get(self._critical_path_project_id)
+        target: Optional[date] = project.end_date_target if project else None
+        finish: Optional[date] = self.critical_path.finish_date
+        days_late: int = 0
+        if finish is not None and target is not None and finish > target:
+            days_late = self.critical_path.calendar.working_days_between(target, finish)
+        self.project_setup_tab.show_critical_path(self.critical_path.critical_task_ids(), finish, target, days_late, changed)
+
+    def _show_add_dependency_dialog(self) -> None:
+        """Makes one task of the plan depend on another, prefilled from the first two selected tasks."""
+        if not self._plan_is_loaded():
+            return
+        project_id: Optional[int] = self._current_project_id
+        task_names: Dict[int, str] = self.project_setup_tab.plan_model.task_names()
+        if len(task_names) < 2:
+            QMessageBox.warning(self, "Not Enough Tasks", "The plan needs at least two tasks to link.")
+            return
+        dialog = DependencyDialog(task_names, self.project_setup_tab.selected_plan_ids("task"), self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        data: Dict[str, Any] = dialog.get_data()
+        self.db_worker.submit(
+            lambda db: db.add_dependency(data["predecessor_id"], data["successor_id"], data["kind"], data["lag_days"]),
+            on_result=lambda row: self._on_dependency_added(project_id, row),
+            on_error=lambda e: QMessageBox.warning(self, "Dependency Not Added", str(e)),
+        )
+
+    def _on_dependency_added(self, project_id: Optional[int], row: Any) -> None:
+        """Adds the stored dependency to the critical path in memory, reloading it if that graph is not the project's."""
+        if self.critical_path is None or self._critical_path_project_id != project_id:
+            self.refresh_scheduler.mark_dirty("critical_path")
+            return
+        try:
+            changed: Set[int] = self.critical_path.add_dependency(row.predecessor_id, row.successor_id, row.kind, row.lag_days)
+        except ValueError:
+            self.refresh_scheduler.mark_dirty("critical_path")  # The graph here was out of date; reload it
+            return
+        self._show_critical_path_changes(changed)
+
+    def _show_shift_dates_dialog(self) -> None:
+        """Moves the current phase, epic or task (with everything below it) by a number of working days."""
+        if not self._plan_is_loaded():
+            return
+        from database import SHIFTABLE_KINDS
+        current: Optional[Tuple[str, int]] = self.project_setup_tab.current_plan_key()
+        if current is not None and current[0] == "subtask":
+            current = self.project_setup_tab.ancestor_key(current, "task")
+        if current is None or current[0] not in SHIFTABLE_KINDS:
+            QMessageBox.warning(self, "Nothing Selected", "Select the phase, epic or task to shift in the plan first.")
+            return
+        kind, item_id = current
+        dialog = ShiftDatesDialog(kind, self.project_setup_tab.item_name(current), self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        data: Dict[str, Any] = dialog.get_data()
+        if data["working_days"] == 0:
+            return
+        from work_calendar import calendar_for, to_dates, to_datetime64
+        calendar: WorkCalendar = calendar_for(self.config_manager)
+        working_days: int = data["working_days"]
+
+        def shift(days: List[date]) -> List[date]:
+            return to_dates(calendar.offset(to_datetime64(days), working_days))
+
+        self.db_worker.submit(
+            lambda db: db.shift_dates(kind, item_id, shift, include_successors=data["include_successors"]),
+            on_result=self._on_dates_shifted,
+            on_error=lambda e: QMessageBox.critical(self, "Shift Failed", f"Failed to shift dates: {e}"),
+        )
+
+    def _on_dates_shifted(self, result: DateShiftResult) -> None:
+        """Reloads the plan in place and updates capacity and the critical path for the moved tasks."""
+        self.refresh_scheduler.mark_dirty("plan_tree", "my_work")
+        self._apply_task_changes(result.task_ids)
+        self.statusBar().showMessage(f"Shifted {len(result.task_ids)} task(s) and {result.phase_count} phase(s).", 5000)
+
+    def _load_my_work(self) -> None:
+        """Loads the team member list and the selected member's tasks across all projects (the first member if none is selected)."""
+        member_id: Optional[int] = self.my_work_tab.selected_member_id()
+        include_done: bool = self.my_work_tab.include_done()
+
+        def load(db: ProjectManagerDB) -> Tuple[List[Any], Optional[int], List[Any]]:
+            members = db.get_team_members()
+            if member_id is None or all(member.id != member_id for member in members):
+                shown_id = members[0].id if members else None
+            else:
+                shown_id = member_id
+            return members, shown_id, db.get_member_tasks(shown_id, include_done) if shown_id is not None else []
+
+        self.db_worker.submit(load, on_result=lambda result: self._show_my_work(*result), key="my_work")
+
+    def _show_my_work(self, members: List[Any], member_id: Optional[int], rows: List[Any]) -> None:
+        self.my_work_tab.show_members(members, member_id)
+        self.my_work_tab.show_tasks(rows)
+
+    def _open_my_work_task(self, row: Any) -> None:
+        """Selects the task's project and shows its plan."""
+        index: int = self.project_combo.findData(row.project_id)
+        if index < 0:
+            return
+        self.project_combo.setCurrentIndex(index)
+        self.tab_widget.setCurrentWidget(self.project_setup_page)
+
+    def _run_schedule_risk(self) -> None:
+        """
+        Loads the current project's schedule and builds the simulation model on the worker thread,
+        then runs the Monte Carlo simulation on the process pool.
+        """
+        project_id: Optional[int] = self._current_project_id
+        project: Optional[ProjectDirectoryEntry] = self._projects.get(project_id) if project_id is not None else None
+        if project is None:
+            QMessageBox.warning(self, "No Project Selected", "Please select a project first.")
+            return
+        from dataclasses import replace
+        from schedule_risk import risk_settings
+        from work_calendar import calendar_for
+        # Read here; the config is not used across threads
+        settings: RiskSettings = replace(risk_settings(self.config_manager), iterations=self.schedule_risk_tab.iterations())
+        calendar: WorkCalendar = calendar_for(self.config_manager)
+        self._schedule_risk_run += 1
+        run: int = self._schedule_risk_run
+        self.schedule_risk_tab.simulation_started(project.name)
+
+        def prepare(db: ProjectManagerDB) -> Tuple[List[Any], CriticalPath, RiskModel]:
+            from critical_path import CriticalPath
+            from database import DONE_TASK_STATUS
+            from schedule_risk import build_risk_model
+            schedule = db.get_schedule(project.id)
+            critical_path = CriticalPath(calendar)
+            critical_path.load(schedule.tasks, schedule.dependencies)
+            done_task_ids = [task.id for task in schedule.tasks if task.status == DONE_TASK_STATUS]
+            return schedule.tasks, critical_path, build_risk_model(critical_path.network(), done_task_ids, settings)
+
+        self.db_worker.submit(
+            prepare,
+            on_result=lambda prepared: self._start_schedule_risk(run, project, settings, *prepared),
+            on_error=lambda e: self._on_schedule_risk_failed(run, e),
+            key="schedule_risk",
+        )
+
+    def _start_schedule_risk(
+        self,
+        run: int,
+        project: ProjectDirectoryEntry,
+        settings: RiskSettings,
+        tasks: List[Any],
+        critical_path: CriticalPath,
+        model: RiskModel,
+    ) -> None:
+        """Measures the project against its target date, or else the configured Time_Constraint from its start."""
+        if run != self._schedule_risk_run:
+            return
+        from schedule_risk import ScheduleRiskRunner, add_time_constraint
+        target: Optional[date] = project.end_date_target
+        target_note: str = ""
+        if target is None:
+            target = add_time_constraint(project.start_date, settings.time_constraint)
+            target_note = f" ({settings.time_constraint} from the project start)" if target is not None else ""
+        if self.schedule_risk_runner is None:
+            self.schedule_risk_runner = ScheduleRiskRunner(self)
+            self.schedule_risk_runner.progress.connect(self.schedule_risk_tab.show_progress)
+            self.schedule_risk_runner.finished.connect(self._show_schedule_risk)
+            self.schedule_risk_runner.failed.connect(lambda e: self._on_schedule_risk_failed(self._schedule_risk_run, e))
+        self._schedule_risk_shown = (project.name, tasks, target_note)
+        try:
+            self.schedule_risk_runner.start(critical_path, model, settings, target)
+        except ValueError as e:
+            self.schedule_risk_tab.simulation_stopped(str(e))
+
+    def _show_schedule_risk(self, result: ScheduleRiskResult) -> None:
+        project_name, tasks, target_note = self._schedule_risk_shown
+        self.schedule_risk_tab.show_result(project_name, result, tasks, target_note)
+
+    def _cancel_schedule_risk(self) -> None:
+        self._schedule_risk_run += 1
+        if self.schedule_risk_runner is not None:
+            self.schedule_risk_runner.cancel()
+        self.schedule_risk_tab.simulation_stopped("Simulation cancelled.")
+
+    def _on_schedule_risk_failed(self, run: int, error: Exception) -> None:
+        if run == self._schedule_risk_run:
+            self.schedule_risk_tab.simulation_stopped(f"Simulation failed: {error}")
 
     def _add_initial_project_plan(self) -> None:
         """
@@ -458,7 +891,7 @@ class ProjectPlannerApp(QMainWindow):
             QMessageBox.warning(self, "No Project Selected", "Please select or create a project first.")
             return
 
-        project: Optional[Project] = self.db_manager.get_project_by_name(self.project_combo.currentText())
+        project: Optional[ProjectDirectoryEntry] = self._projects.get(self._current_project_id)
         if not project:
             QMessageBox.critical(self, "Error", "Selected project not found in database.")
             return
@@ -469,119 +902,139 @@ class ProjectPlannerApp(QMainWindow):
         if reply == QMessageBox.No: # type: ignore
             return
 
-        try:
-            ssa1_name: Optional[str] = self.config_manager.get_property('TEAM_MEMBERS', 'SSA1_Name')
-            sa2_name: Optional[str] = self.config_manager.get_property('TEAM_MEMBERS', 'SA2_Name')
-            offshore_pm_name: Optional[str] = self.config_manager.get_property('TEAM_MEMBERS', 'Offshore_PM_Name')
-
-            # Provide default empty strings if names are None from config
-            ssa1_name_str: str = ssa1_name if ssa1_name is not None else "SSA1"
-            sa2_name_str: str = sa2_name if sa2_name is not None else "SA2"
-            offshore_pm_name_str: str = offshore_pm_name if offshore_pm_name is not None else "Offshore PM"
-
+        def on_added(phase_ids: List[int]) -> None:
+            QMessageBox.information(self, "Success", "Initial project plan (Phases, Epics, Tasks) added successfully!")
+            self.refresh_scheduler.mark_dirty("plan_tree", "capacity", "my_work") # Refresh the tree view and team views
+
+        # The whole plan is written in one transaction, so a failure leaves the project untouched
+        plan: List[PhaseSpec] = self._build_initial_plan(project.start_date, project.end_date_target)
+        self.db_worker.submit(
+            lambda db: db.add_plan(project.id, plan),
+            on_result=on_added,
+            on_error=lambda e: QMessageBox.critical(self, "Error Adding Plan", f"Failed to add initial plan: {e}"),
+        )
 
+    def _build_initial_plan(self, start_date: date, end_date_target: Optional[date]) -> List[PhaseSpec]:
+        """Builds the default Phase -> Epic -> Task structure used by Auto-Populate Project Plan."""
+        from database import EpicSpec, PhaseSpec, TaskSpec
+        from work_calendar import calendar_for # NumPy-backed, so only imported when a plan is built
+        ssa1_name: Optional[str] = self.config_manager.get_property('TEAM_MEMBERS', 'SSA1_Name')
+        sa2_name: Optional[str] = self.config_manager.get_property('TEAM_MEMBERS', 'SA2_Name')
+        offshore_pm_name: Optional[str] = self.config_manager.get_property('TEAM_MEMBERS', 'Offshore_PM_Name')
+
+        # Provide default empty strings if names are None from config
+        ssa1_name_str: str = ssa1_name if ssa1_name is not None else "SSA1"
+        sa2_name_str: str = sa2_name if sa2_name is not None else "SA2"
+        offshore_pm_name_str: str = offshore_pm_name if offshore_pm_name is not None else "Offshore PM"
+        offshore_team_str: str = offshore_pm_name_str + ' (Offshore Team)'
+
+        # Dates count working days on the assignees' calendars, skipping weekends and the [HOLIDAYS] of their region.
+        # The former calendar-day offsets map to working days as 3/7/14/21/28 -> 2/5/10/15/20.
+        us_calendar: WorkCalendar = calendar_for(self.config_manager, "US")
+        india_calendar: WorkCalendar = calendar_for(self.config_manager, "India")
+        shared_calendar: WorkCalendar = calendar_for(self.config_manager)
+        us_due = lambda working_days: us_calendar.add_working_days(start_date, working_days)
+        india_due = lambda working_days: india_calendar.add_working_days(start_date, working_days)
+        development_start: date = shared_calendar.add_working_days(start_date, 20) # 4 weeks
+        uat_start: date = shared_calendar.add_working_days(start_date, 20 + 5*20) # 4 weeks + 5 months
+
+        return [
             # Phase 1: Inception & Detailed Planning (Weeks 1-4)
-            phase1: Phase = self.db_manager.add_phase(
-                project.id,
+            PhaseSpec(
                 "Phase 1: Inception & Detailed Planning (Weeks 1-4)",
                 "Establish foundational understanding, detailed requirements, and initial design for key modules.",
-                start_date=project.start_date,
-                end_date=project.start_date + timedelta(weeks=4)
-            )
-            epic1_1: Epic = self.db_manager.add_epic(
-                phase1.id,
-                "Requirements Gathering & Reverse Engineering",
-                "Gather business & technical requirements, reverse engineer vendor product.",
-            )
-            self.db_manager.add_task(
-                epic1_1.id,
-                "Client Kick-off & Expectations Alignment",
-                "Formal kick-off with client to align on scope and communication.",
-                ssa1_name_str,
-                "High",
-                due_date=project.start_date + timedelta(days=3),
-            )
-            self.db_manager.add_task(
-                epic1_1.id,
-                "Vendor Product Architecture Deep Dive",
-                "Dissect existing on-prem MDM product for architecture, APIs, and customization points.",
-                f"{ssa1_name_str}, {sa2_name_str}",
-                "High",
-                due_date=project.start_date + timedelta(days=7),
-            )
-            self.db_manager.add_task(
-                epic1_1.id,
-                "Detailed MDM Customization Requirements",
-                "Workshops with client BAs for data quality, validations, UI, RBAC.",
-                ssa1_name_str,
-                "High",
-                due_date=project.start_date + timedelta(days=14),
-            )
-            self.db_manager.add_task(
-                epic1_1.id,
-                "Ingress Source System Data Mapping (Initial 5)",
-                "Detailed data mapping for the first 5 critical ingress sources.",
-                sa2_name_str,
-                "High",
-                due_date=project.start_date + timedelta(days=14),
-            )
-
-            epic1_2: Epic = self.db_manager.add_epic(phase1.id, "Technical Design & Initial POCs", "Develop overall architectural design and conduct critical proof of concepts.")
-            self.db_manager.add_task(epic1_2.id, "Overall ETL/MDM Solution Architecture", "Design the end-to-end architecture for Ingress, MDM, and Egress.", ssa1_name_str, 'High', due_date=project.start_date + timedelta(days=21))
-            self.db_manager.add_task(epic1_2.id, "MDM Customization Framework POC", "Prove out a customization approach for the vendor MDM product.", sa2_name_str, 'High', due_date=project.start_date + timedelta(days=21))
-            self.db_manager.add_task(epic1_2.id, "Ingress Data Pipeline POC (Connector)", "Validate connectivity and initial data extraction from a complex source.", sa2_name_str, 'Medium', due_date=project.start_date + timedelta(days=28))
-            self.db_manager.add_task(epic1_2.id, "Offshore Team Onboarding & Environment Setup", "Ensure offshore team has access, tools, and dev environments ready.", offshore_pm_name_str, 'High', due_date=project.start_date + timedelta(days=28))
-
-
+                start_date=start_date,
+                end_date=development_start,
+                epics=[
+                    EpicSpec(
+                        "Requirements Gathering & Reverse Engineering",
+                        "Gather business & technical requirements, reverse engineer vendor product.",
+                        tasks=[
+                            TaskSpec("Client Kick-off & Expectations Alignment", "Formal kick-off with client to align on scope and communication.", ssa1_name_str, 'High', due_date=us_due(2)),
+                            TaskSpec("Vendor Product Architecture Deep Dive", "Dissect existing on-prem MDM product for architecture, APIs, and customization points.", f"{ssa1_name_str}, {sa2_name_str}", 'High', due_date=us_due(5)),
+                            TaskSpec("Detailed MDM Customization Requirements", "Workshops with client BAs for data quality, validations, UI, RBAC.", ssa1_name_str, 'High', due_date=us_due(10)),
+                            TaskSpec("Ingress Source System Data Mapping (Initial 5)", "Detailed data mapping for the first 5 critical ingress sources.", sa2_name_str, 'High', due_date=us_due(10)),
+                        ],
+                    ),
+                    EpicSpec(
+                        "Technical Design & Initial POCs",
+                        "Develop overall architectural design and conduct critical proof of concepts.",
+                        tasks=[
+                            TaskSpec("Overall ETL/MDM Solution Architecture", "Design the end-to-end architecture for Ingress, MDM, and Egress.", ssa1_name_str, 'High', due_date=us_due(15)),
+                            TaskSpec("MDM Customization Framework POC", "Prove out a customization approach for the vendor MDM product.", sa2_name_str, 'High', due_date=us_due(15)),
+                            TaskSpec("Ingress Data Pipeline POC (Connector)", "Validate connectivity and initial data extraction from a complex source.", sa2_name_str, 'Medium', due_date=us_due(20)),
+                            TaskSpec("Offshore Team Onboarding & Environment Setup", "Ensure offshore team has access, tools, and dev environments ready.", offshore_pm_name_str, 'High', due_date=india_due(20)),
+                        ],
+                    ),
+                ],
+            ),
             # Phase 2: Iterative Development & Delivery (Months 2-6)
-            phase2: Phase = self.db_manager.add_phase(
-                project.id,
+            PhaseSpec(
                 "Phase 2: Iterative Development & Delivery (Months 2-6)",
                 "Develop, unit test, and deliver functional modules in iterations.",
-                start_date=project.start_date + timedelta(weeks=4),
-                end_date=project.start_date + timedelta(weeks=4 + 5*4) # 5 months
-            )
-            epic2_1: Epic = self.db_manager.add_epic(phase2.id, "Ingress Module Development", "Develop data pipelines for 20 source systems into MDM.")
-            self.db_manager.add_task(epic2_1.id, "Ingress Source 1-5 Development & Unit Test", "Develop and unit test pipelines for first 5 critical sources.", offshore_pm_name_str + ' (Offshore Team)', 'High')
-            self.db_manager.add_task(epic2_1.id, "Ingress Source 6-10 Development & Unit Test", "Develop and unit test pipelines for next 5 critical sources.", offshore_pm_name_str + ' (Offshore Team)', 'Medium')
-            self.db_manager.add_task(epic2_1.id, "Ingress Source 11-20 Development & Unit Test", "Develop and unit test pipelines for remaining sources.", offshore_pm_name_str + ' (Offshore Team)', 'Low')
-            self.db_manager.add_task(epic2_1.id, "Ingress Data Quality & Error Handling", "Implement robust data quality checks and error logging for all pipelines.", sa2_name_str, 'High')
-
-            epic2_2: Epic = self.db_manager.add_epic(phase2.id, "Egress Module Development", "Pull data from CRM, identify deltas, and write to CSV files.")
-            self.db_manager.add_task(epic2_2.id, "Egress CRM Data Extraction Design", "Design efficient extraction of CRM data.", sa2_name_str, 'High')
-            self.db_manager.add_task(epic2_2.id, "Egress Delta Logic Implementation", "Implement logic to identify and process data deltas.", offshore_pm_name_str + ' (Offshore Team)', 'High')
-            self.db_manager.add_task(epic2_2.id, "Egress CSV File Generation", "Develop module to generate formatted CSV files.", offshore_pm_name_str + ' (Offshore Team)', 'Medium')
-
-            epic2_3: Epic = self.db_manager.add_epic(phase2.id, "MDM Customization & Configuration", "Implement Data Quality, Validations, UI, RBAC based on requirements.")
-            self.db_manager.add_task(epic2_3.id, "MDM Data Quality Rules Implementation", "Implement core data quality rules within MDM.", offshore_pm_name_str + ' (Offshore Team)', 'High')
-            self.db_manager.add_task(epic2_3.id, "MDM Data Validation Logic", "Implement custom data validation rules.", offshore_pm_name_str + ' (Offshore Team)', 'High')
-            self.db_manager.add_task(epic2_3.id, "MDM UI Customization (Key Screens)", "Customize essential UI screens for data stewardship.", offshore_pm_name_str + ' (Offshore Team)', 'Medium')
-            self.db_manager.add_task(epic2_3.id, "MDM RBAC Configuration & Testing", "Configure Role-Based Access Control and test permissions.", sa2_name_str, 'High')
-            self.db_manager.add_task(epic2_3.id, "MDM Workflow Customization (if applicable)", "Customize data approval/stewardship workflows.", offshore_pm_name_str + ' (Offshore Team)', 'Medium')
-
+                start_date=development_start,
+                end_date=uat_start,
+                epics=[
+                    EpicSpec(
+                        "Ingress Module Development",
+                        "Develop data pipelines for 20 source systems into MDM.",
+                        tasks=[
+                            TaskSpec("Ingress Source 1-5 Development & Unit Test", "Develop and unit test pipelines for first 5 critical sources.", offshore_team_str, 'High'),
+                            TaskSpec("Ingress Source 6-10 Development & Unit Test", "Develop and unit test pipelines for next 5 critical sources.", offshore_team_str, 'Medium'),
+                            TaskSpec("Ingress Source 11-20 Development & Unit Test", "Develop and unit test pipelines for remaining sources.", offshore_team_str, 'Low'),
+                            TaskSpec("Ingress Data Quality & Error Handling", "Implement robust data quality checks and error logging for all pipelines.", sa2_name_str, 'High'),
+                        ],
+                    ),
+                    EpicSpec(
+                        "Egress Module Development",
+                        "Pull data from CRM, identify deltas, and write to CSV files.",
+                        tasks=[
+                            TaskSpec("Egress CRM Data Extraction Design", "Design efficient extraction of CRM data.", sa2_name_str, 'High'),
+                            TaskSpec("Egress Delta Logic Implementation", "Implement logic to identify and process data deltas.", offshore_team_str, 'High'),
+                            TaskSpec("Egress CSV File Generation", "Develop module to generate formatted CSV files.", offshore_team_str, 'Medium'),
+                        ],
+                    ),
+                    EpicSpec(
+                        "MDM Customization & Configuration",
+                        "Implement Data Quality, Validations, UI, RBAC based on requirements.",
+                        tasks=[
+                            TaskSpec("MDM Data Quality Rules Implementation", "Implement core data quality rules within MDM.", offshore_team_str, 'High'),
+                            TaskSpec("MDM Data Validation Logic", "Implement custom data validation rules.", offshore_team_str, 'High'),
+                            TaskSpec("MDM UI Customization (Key Screens)", "Customize essential UI screens for data stewardship.", offshore_team_str, 'Medium'),
+                            TaskSpec("MDM RBAC Configuration & Testing", "Configure Role-Based Access Control and test permissions.", sa2_name_str, 'High'),
+                            TaskSpec("MDM Workflow Customization (if applicable)", "Customize data approval/stewardship workflows.", offshore_team_str, 'Medium'),
+                        ],
+                    ),
+                ],
+            ),
             # Phase 3: UAT & Deployment Readiness (Month 7)
-            phase3: Phase = self.db_manager.add_phase(
-                project.id,
+            PhaseSpec(
                 "Phase 3: UAT & Deployment Readiness (Month 7)",
                 "Achieve client sign-off on functionality, prepare for production deployment.",
-                start_date=project.start_date + timedelta(weeks=4 + 5*4),
-                end_date=project.end_date_target
-            )
-            epic3_1: Epic = self.db_manager.add_epic(phase3.id, "User Acceptance Testing (UAT)", "Client-led testing and defect resolution.")
-            self.db_manager.add_task(epic3_1.id, "UAT Test Case Review & Preparation", "Work with client BAs to finalize UAT test cases.", ssa1_name_str, 'High')
-            self.db_manager.add_task(epic3_1.id, "UAT Environment Setup & Data Load", "Prepare and load data into UAT environment.", sa2_name_str, 'High')
-            self.db_manager.add_task(epic3_1.id, "UAT Defect Triage & Resolution Cycles", "Manage, prioritize, and resolve defects found during UAT.", f"{offshore_pm_name_str} (Offshore Team), {ssa1_name_str}", 'High')
-
-            epic3_2: Epic = self.db_manager.add_epic(phase3.id, "Deployment Readiness & Go-Live", "Final preparations for production deployment.")
-            self.db_manager.add_task(epic3_2.id, "Production Deployment Plan", "Develop detailed plan including rollback strategy.", ssa1_name_str, 'High')
-            self.db_manager.add_task(epic3_2.id, "Pre-Go-Live System Health Checks", "Perform final checks on performance, data integrity.", sa2_name_str, 'High')
-            self.db_manager.add_task(epic3_2.id, "Post-Go-Live Support Plan", "Define support structure for immediate post-deployment.", ssa1_name_str, 'High')
-
-            QMessageBox.information(self, "Success", "Initial project plan (Phases, Epics, Tasks) added successfully!")
-            self._load_project_plan_tree() # Refresh the tree view
-        except Exception as e:
-            QMessageBox.critical(self, "Error Adding Plan", f"Failed to add initial plan: {e}")
-            # Optionally, you might want to rollback changes if multiple DB operations fail
+                start_date=uat_start,
+                end_date=end_date_target,
+                epics=[
+                    EpicSpec(
+                        "User Acceptance Testing (UAT)",
+                        "Client-led testing and defect resolution.",
+                        tasks=[
+                            TaskSpec("UAT Test Case Review & Preparation", "Work with client BAs to finalize UAT test cases.", ssa1_name_str, 'High'),
+                            TaskSpec("UAT Environment Setup & Data Load", "Prepare and load data into UAT environment.", sa2_name_str, 'High'),
+                            TaskSpec("UAT Defect Triage & Resolution Cycles", "Manage, prioritize, and resolve defects found during UAT.", f"{offshore_team_str}, {ssa1_name_str}", 'High'),
+                        ],
+                    ),
+                    EpicSpec(
+                        "Deployment Readiness & Go-Live",
+                        "Final preparations for production deployment.",
+                        tasks=[
+                            TaskSpec("Production Deployment Plan", "Develop detailed plan including rollback strategy.", ssa1_name_str, 'High'),
+                            TaskSpec("Pre-Go-Live System Health Checks", "Perform final checks on performance, data integrity.", sa2_name_str, 'High'),
+                            TaskSpec("Post-Go-Live Support Plan", "Define support structure for immediate post-deployment.", ssa1_name_str, 'High'),
+                        ],
+                    ),
+                ],
+            ),
+        ]
 
     def _submit_daily_log(self) -> None:
         """Submits the daily log entry to the database."""
@@ -604,15 +1057,9 @@ class ProjectPlannerApp(QMainWindow):
             QMessageBox.warning(self, "Input Required", "Please enter at least some information for the daily log.")
             return
 
-        try:
-            self.db_manager.add_daily_log(
-                self._current_project_id,
-                activities_us, activities_india,
-                blockers_us, blockers_india,
-                decisions_made,
-                next_steps_us, next_steps_india,
-                log_date=log_date_py
-            )
+        project_id: int = self._current_project_id
+
+        def on_submitted(log: DailyLog) -> None:
             QMessageBox.information(self, "Success", f"Daily log for {log_date_py.strftime('%Y-%m-%d')} submitted successfully!")
             # Clear fields after submission
             self.activities_us_input.clear()
@@ -622,9 +1069,20 @@ class ProjectPlannerApp(QMainWindow):
             self.decisions_made_input.clear()
             self.next_steps_us_input.clear()
             self.next_steps_india_input.clear()
-            self._load_daily_logs_display() # Refresh logs display
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to submit daily log: {e}")
+            self.refresh_scheduler.mark_dirty("daily_logs") # Refresh logs display
+
+        self.db_worker.submit(
+            lambda db: db.add_daily_log(
+                project_id,
+                activities_us, activities_india,
+                blockers_us, blockers_india,
+                decisions_made,
+                next_steps_us, next_steps_india,
+                log_date=log_date_py
+            ),
+            on_result=on_submitted,
+            on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to submit daily log: {e}"),
+        )
 
     def _on_log_date_changed(self, new_date: QDate) -> None:
         """Updates the internal log date when the date edit changes."""
@@ -645,46 +1103,94 @@ class ProjectPlannerApp(QMainWindow):
         self.next_steps_india_input.clear()
 
     def _save_properties(self) -> None:
-        """Saves the updated properties from the UI to the config file."""
+        """
+        Saves the properties edited in the UI to the config file. Only edited fields are written,
+        so values another instance saved in the meantime are kept.
+        """
         try:
-            for (section, key), input_field in self.property_inputs.items():
-                self.config_manager.set_property(section, key, input_field.text())
-            QMessageBox.information(self, "Success", "Properties saved successfully!")
+            values: Dict[Tuple[str, str], str] = {
+                section_key: input_field.text() for section_key, input_field in self.property_inputs.items() if input_field.isModified()
+            }
+            saved: bool = self.config_manager.set_properties(values)  # One atomic write for all changed properties
+            for input_field in self.property_inputs.values():
+                input_field.setModified(False)
+            if saved:
+                self.refresh_scheduler.mark_dirty("capacity") # Team members and holidays may have changed
+                QMessageBox.information(self, "Success", "Properties saved successfully!")
+            else:
+                QMessageBox.information(self, "No Changes", "No properties were changed.")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save properties: {e}")
 
+    def _on_config_reloaded(self, changed: List[Tuple[str, str]]) -> None:
+        """Shows properties changed on disk (e.g. by another instance) in the fields that have no unsaved edits."""
+        self.refresh_scheduler.mark_dirty("capacity")  # Team members and holidays may have changed
+        if not self.properties_page.is_built():
+            return  # Built from the reloaded values when first shown
+        for section_key in changed:
+            input_field: Optional[QLineEdit] = self.property_inputs.get(section_key)
+            value: Optional[str] = self.config_manager.get_property(*section_key)
+            if input_field is not None and value is not None and not input_field.isModified():
+                input_field.setText(value)
+
+    def _on_theme_changed(self, theme: str) -> None:
+        """Switches the application theme at once and remembers it for the next start."""
+        try:
+            apply_theme(theme)
+            self.config_manager.set_property(*THEME_SETTING, theme)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to switch theme: {e}")
+
     def _load_daily_logs_display(self) -> None:
-        """Loads and displays daily logs for the selected project in the View Logs tab."""
+        """Starts paging the selected project's daily logs into the View Logs tab."""
+        project_id: Optional[int] = self.log_project_combo.currentData()
+        self.view_logs_tab.daily_logs_model.reset_project(project_id)
+        query: str = self.view_logs_tab.log_search_input.text().strip()
+        if query:
+            self._search_daily_logs(query) # Keep search results in step with the selected project
+
+    def _request_daily_log_page(self, project_id: int, before: Optional[Tuple[date, int]], limit: int) -> None:
+        """Loads one keyset page of daily logs in the background for the View Logs list."""
+        model = self.view_logs_tab.daily_logs_model
+
+        def on_error(error: Exception) -> None:
+            model.abort_fetch()
+            self._on_db_error(error)
+
+        self.db_worker.submit(
+            lambda db: db.get_daily_logs_page(project_id, before, limit),
+            on_result=lambda logs: model.append_page(project_id, logs),
+            on_error=on_error,
+            key="daily_logs",
+        )
+
+
+    def _search_daily_logs(self, query: str) -> None:
+        """Runs a full-text search over the selected project's logs in the background."""
+        project_id: Optional[int] = self.log_project_combo.currentData()
+        if not query or project_id is None:
+            self.view_logs_tab.show_search_results("", [])
+            if self.view_logs_tab.daily_logs_model.starts_at_cursor():
+                self.refresh_scheduler.mark_dirty("daily_logs") # Return to the newest logs
+            return
+        self.db_worker.submit(
+            lambda db: db.search_daily_logs(project_id, query),
+            on_result=lambda hits: self.view_logs_tab.show_search_results(query, hits),
+            key="log_search",
+        )
+
+    def _jump_to_log(self, hit: Optional[LogSearchHit]) -> None:
+        """Shows the log list starting at the chosen search match."""
         project_id: Optional[int] = self.log_project_combo.currentData()
-        self.daily_logs_display.clear()
-        if project_id is None:
-            self.daily_logs_display.setPlainText("No project selected or no logs available.")
-            return
-
-        logs: List[DailyLog] = self.db_manager.get_daily_logs_for_project(project_id)
-        if not logs:
-            self.daily_logs_display.setPlainText("No daily logs found for this project.")
-            return
-
-        log_text_parts: List[str] = []
-        for log in logs:
-            log_text_parts.append(f"--- Log for {log.log_date.strftime('%Y-%m-%d')} (Recorded: {log.timestamp.strftime('%H:%M')}) ---")
-            if log.activities_us:
-                log_text_parts.append(f"US Activities:\n{log.activities_us}")
-            if log.activities_india:
-                log_text_parts.append(f"India Activities:\n{log.activities_india}")
-            if log.blockers_us:
-                log_text_parts.append(f"US Blockers:\n{log.blockers_us}")
-            if log.blockers_india:
-                log_text_parts.append(f"India Blockers:\n{log.blockers_india}")
-            if log.decisions_made:
-                log_text_parts.append(f"Decisions Made:\n{log.decisions_made}")
-            if log.next_steps_us:
-                log_text_parts.append(f"US Next Steps:\n{log.next_steps_us}")
-            if log.next_steps_india:
-                log_text_parts.append(f"India Next Steps:\n{log.next_steps_india}")
-            log_text_parts.append("--------------------------------------------------\n")
-        self.daily_logs_display.setPlainText("\n".join(log_text_parts))
+        if hit is not None and project_id is not None:
+            self.view_logs_tab.show_logs_from(project_id, hit)
+
+    def _rebuild_log_search_index(self) -> None:
+        """Rebuilds the daily log full-text index from the stored logs."""
+        self.db_worker.submit(
+            lambda db: db.rebuild_log_search_index(),
+            on_result=lambda _: QMessageBox.information(self, "Success", "Daily log search index rebuilt."),
+        )
 
 
 class PhaseDialog(QDialog):
@@ -719,12 +1225,14 @@ class PhaseDialog(QDialog):
 class EpicDialog(QDialog):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        from database import WORK_STATUSES
         self.setWindowTitle("Add Epic")
         self.resize(600, 500)  # M
         layout = QFormLayout(self)
         self.name_input = QLineEdit()
         self.description_input = QLineEdit()
-        self.status_input = QLineEdit("Planned")
+        self.status_input = QComboBox()
+        self.status_input.addItems(WORK_STATUSES)
         layout.addRow("Name:", self.name_input)
         layout.addRow("Description:", self.description_input)
         layout.addRow("Status:", self.status_input)
@@ -737,20 +1245,24 @@ class EpicDialog(QDialog):
         return {
             "name": self.name_input.text(),
             "description": self.description_input.text(),
-            "status": self.status_input.text(),
+            "status": self.status_input.currentText(),
         }
 
 class TaskDialog(QDialog):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        from database import TASK_PRIORITIES, TASK_STATUSES
         self.setWindowTitle("Add Task")
         self.resize(600, 500)  # Make the dialog larger (width, height)
         layout = QFormLayout(self)
         self.name_input = QLineEdit()
         self.description_input = QLineEdit()
         self.assigned_to_input = QLineEdit()
-        self.priority_input = QLineEdit("Medium")
-        self.status_input = QLineEdit("To Do")
+        self.priority_input = QComboBox()
+        self.priority_input.addItems(TASK_PRIORITIES[::-1])  # High first
+        self.priority_input.setCurrentText("Medium")
+        self.status_input = QComboBox()
+        self.status_input.addItems(TASK_STATUSES)
         self.jira_link_input = QLineEdit()
         self.start_date_input = QDateEdit(QDate.currentDate())
         self.start_date_input.setCalendarPopup(True)
@@ -774,18 +1286,137 @@ class TaskDialog(QDialog):
             "name": self.name_input.text(),
             "description": self.description_input.text(),
             "assigned_to": self.assigned_to_input.text(),
-            "priority": self.priority_input.text(),
-            "status": self.status_input.text(),
+            "priority": self.priority_input.currentText(),
+            "status": self.status_input.currentText(),
             "jira_link": self.jira_link_input.text(),
             "start_date": self.start_date_input.date().toPython(),
             "due_date": self.due_date_input.date().toPython(),
         }
 
 
+class BulkEditDialog(QDialog):
+    """Collects the fields to set on several tasks; only ticked fields are changed."""
+
+    def __init__(self, task_count: int, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        from database import TASK_STATUSES
+        self.setWindowTitle(f"Bulk Edit {task_count} Task(s)")
+        layout = QFormLayout(self)
+        self.status_input = QComboBox()
+        self.status_input.addItems(TASK_STATUSES)
+        self.assigned_to_input = QLineEdit()
+        self.start_date_input = QDateEdit(QDate.currentDate())
+        self.start_date_input.setCalendarPopup(True)
+        self.due_date_input = QDateEdit(QDate.currentDate())
+        self.due_date_input.setCalendarPopup(True)
+        # field name -> (checkbox, editor)
+        self._fields: Dict[str, Tuple[QCheckBox, QWidget]] = {}
+        for field, label, editor in (
+            ("status", "Status:", self.status_input),
+            ("assigned_to", "Assigned To:", self.assigned_to_input),
+            ("start_date", "Start Date:", self.start_date_input),
+            ("due_date", "Due Date:", self.due_date_input),
+        ):
+            checkbox = QCheckBox(label)
+            editor.setEnabled(False)
+            checkbox.toggled.connect(editor.setEnabled)
+            layout.addRow(checkbox, editor)
+            self._fields[field] = (checkbox, editor)
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        layout.addRow(self.button_box)
+
+    def get_data(self) -> dict[str, Any]:
+        values: dict[str, Any] = {
+            "status": self.status_input.currentText(),
+            "assigned_to": self.assigned_to_input.text(),
+            "start_date": self.start_date_input.date().toPython(),
+            "due_date": self.due_date_input.date().toPython(),
+        }
+        return {field: values[field] for field, (checkbox, _editor) in self._fields.items() if checkbox.isChecked()}
+
+
+class DependencyDialog(QDialog):
+    """Picks a predecessor, a successor, the dependency type and a lag in working days."""
+
+    TYPE_LABELS = {
+        "FS": "Finish → Start: starts after the predecessor finishes",
+        "SS": "Start → Start: starts after the predecessor starts",
+        "FF": "Finish → Finish: finishes after the predecessor finishes",
+    }
+
+    def __init__(self, task_names: Dict[int, str], selected_task_ids: List[int], parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        from database import DEPENDENCY_TYPES
+        self.setWindowTitle("Add Dependency")
+        self.resize(600, 200)
+        layout = QFormLayout(self)
+        self.predecessor_input = QComboBox()
+        self.successor_input = QComboBox()
+        for task_id, name in sorted(task_names.items()):
+            self.predecessor_input.addItem(f"{name} (#{task_id})", userData=task_id)
+            self.successor_input.addItem(f"{name} (#{task_id})", userData=task_id)
+        for combo, task_id in zip((self.predecessor_input, self.successor_input), selected_task_ids):
+            combo.setCurrentIndex(max(combo.findData(task_id), 0))
+        if self.successor_input.currentIndex() == self.predecessor_input.currentIndex():
+            self.successor_input.setCurrentIndex((self.predecessor_input.currentIndex() + 1) % self.successor_input.count())
+        self.kind_input = QComboBox()
+        for kind in DEPENDENCY_TYPES:
+            self.kind_input.addItem(self.TYPE_LABELS[kind], userData=kind)
+        self.lag_input = QSpinBox()
+        self.lag_input.setRange(-250, 250)
+        self.lag_input.setSuffix(" working day(s)")
+        layout.addRow("Predecessor:", self.predecessor_input)
+        layout.addRow("Successor:", self.successor_input)
+        layout.addRow("Type:", self.kind_input)
+        layout.addRow("Lag (negative for lead):", self.lag_input)
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        layout.addRow(self.button_box)
+
+    def get_data(self) -> dict[str, Any]:
+        return {
+            "predecessor_id": self.predecessor_input.currentData(),
+            "successor_id": self.successor_input.currentData(),
+            "kind": self.kind_input.currentData(),
+            "lag_days": self.lag_input.value(),
+        }
+
+
+class ShiftDatesDialog(QDialog):
+    """Asks how many working days to move a plan item and its subtree by."""
+
+    def __init__(self, kind: str, name: str, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle(f"Shift {kind.capitalize()} Dates")
+        layout = QFormLayout(self)
+        layout.addRow(f"{kind.capitalize()}:", QLabel(name))
+        self.working_days_input = QSpinBox()
+        self.working_days_input.setRange(-250, 250)
+        self.working_days_input.setValue(1)
+        self.working_days_input.setSuffix(" working day(s)")
+        self.include_successors_input = QCheckBox("Also shift tasks that depend on these tasks")
+        self.include_successors_input.setChecked(True)
+        layout.addRow("Shift by (negative moves earlier):", self.working_days_input)
+        layout.addRow(self.include_successors_input)
+        layout.addRow(QLabel("Weekends and the configured US and India holidays are skipped."))
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        layout.addRow(self.button_box)
+
+    def get_data(self) -> dict[str, Any]:
+        return {
+            "working_days": self.working_days_input.value(),
+            "include_successors": self.include_successors_input.isChecked(),
+        }
+
+
 if __name__ == "__main__":
     # Ensure a QApplication instance exists before creating QWidgets
     app: QApplication = QApplication(sys.argv)
-    app.setStyleSheet(qdarktheme.load_stylesheet("light"))
     window: ProjectPlannerApp = ProjectPlannerApp()
     window.show()
     sys.exit(app.exec())
@@ -0,0 +1,62 @@
+# refresh_scheduler.py
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, QTimer
+
+
+@dataclass
+class _RefreshTarget:
+    refresh: Callable[[], None]
+    is_visible: Optional[Callable[[], bool]]
+    dirty: bool = False
+
+
+class RefreshScheduler(QObject):
+    """
+    Coalesces view refreshes. Code marks named targets (e.g. "plan_tree", "daily_logs") dirty
+    instead of reloading directly, and all dirty targets are refreshed once, in registration
+    order, on the next event-loop turn, so a chain of signals triggered by one user action
+    costs one load per view. Targets whose view is not visible stay dirty until
+    visibility_changed() is called while they are shown.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._targets: Dict[str, _RefreshTarget] = {}
+        self._flush_scheduled = False
+
+    def register(self, name: str, refresh: Callable[[], None], is_visible: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Adds a refresh target.
+
+        Args:
+            name: Key passed to mark_dirty.
+            refresh: Reloads the target's view.
+            is_visible: Returns whether the view is on screen; None for targets that always refresh.
+        """
+        self._targets[name] = _RefreshTarget(refresh, is_visible)
+
+    def mark_dirty(self, *names: str) -> None:
+        """Flags targets for a refresh on the next event-loop turn."""
+        for name in names:
+            self._targets[name].dirty = True
+        self._schedule_flush()
+
+    def visibility_changed(self) -> None:
+        """Refreshes deferred targets that have become visible; connect to e.g. QTabWidget.currentChanged."""
+        self._schedule_flush()
+
+    def flush(self) -> None:
+        """Refreshes every dirty, visible target now."""
+        self._flush_scheduled = False
+        for target in self._targets.values():
+            if target.dirty and (target.is_visible is None or target.is_visible()):
+                # Cleared first so a refresh that marks its own target dirty again is honoured
+                target.dirty = False
+                target.refresh()
+
+    def _schedule_flush(self) -> None:
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self.flush)
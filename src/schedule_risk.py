@@ -0,0 +1,368 @@
+# schedule_risk.py
+import logging
+import multiprocessing
+import re
+from calendar import monthrange
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+from config import ConfigManager
+from critical_path import CriticalPath, TaskNetwork
+
+logger = logging.getLogger(__name__)
+
+SIMULATION_SECTION = "SIMULATION"
+PERCENTILES = (50, 80, 95)
+# Stretch of the pessimistic estimate per PROJECT_CHALLENGES Scope_Change_Frequency
+SCOPE_CHANGE_FACTORS: Dict[str, float] = {
+    "none": 1.0,
+    "rare": 1.05,
+    "occasional": 1.15,
+    "regular": 1.25,
+    "frequent": 1.4,
+}
+# A chunk holds a few task x iteration arrays; this bounds each to a few MB in the worker
+_CHUNK_CELLS = 1_000_000
+_MIN_CHUNK_ITERATIONS = 50
+_MAX_CHUNK_ITERATIONS = 1000
+_TIME_CONSTRAINT = re.compile(r"^\s*(\d+)\s*(day|week|month|year)s?\s*$", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class RiskSettings:
+    """The [SIMULATION] and [PROJECT_CHALLENGES] settings a simulation run uses."""
+
+    iterations: int
+    workers: int  # 0 for one per CPU core
+    optimistic_percent: int
+    pessimistic_percent: int
+    scope_change_factor: float
+    time_constraint: Optional[str]  # e.g. "7 months", the fallback when a project has no target date
+
+
+def risk_settings(config_manager: ConfigManager) -> RiskSettings:
+    """Reads the simulation settings; call it on the GUI thread, as the config is not shared across threads."""
+    scope = (config_manager.get_property("PROJECT_CHALLENGES", "Scope_Change_Frequency") or "").strip().lower()
+    if scope and scope not in SCOPE_CHANGE_FACTORS:
+        logger.warning("Unknown Scope_Change_Frequency %r; expected one of %s", scope, ", ".join(SCOPE_CHANGE_FACTORS))
+    return RiskSettings(
+        iterations=max(config_manager.get_int(SIMULATION_SECTION, "Iterations", 10000), 1),
+        workers=max(config_manager.get_int(SIMULATION_SECTION, "Workers", 0), 0),
+        optimistic_percent=min(max(config_manager.get_int(SIMULATION_SECTION, "Optimistic_Percent", 80), 0), 100),
+        pessimistic_percent=max(config_manager.get_int(SIMULATION_SECTION, "Pessimistic_Percent", 150), 100),
+        scope_change_factor=SCOPE_CHANGE_FACTORS.get(scope, 1.0),
+        time_constraint=config_manager.get_property("PROJECT_CHALLENGES", "Time_Constraint"),
+    )
+
+
+def add_time_constraint(start: date, time_constraint: Optional[str]) -> Optional[date]:
+    """
+    Returns the last day of a time constraint such as "7 months", "30 weeks" or "1 year" that
+    begins on start, or None if the text is missing or not of that form.
+    """
+    match = _TIME_CONSTRAINT.match(time_constraint or "")
+    if match is None:
+        return None
+    amount, unit = int(match.group(1)), match.group(2).lower()
+    if unit in ("day", "week"):
+        return start + timedelta(days=amount * (7 if unit == "week" else 1) - 1)
+    months = start.month - 1 + amount * (12 if unit == "year" else 1)
+    year, month = start.year + months // 12, months % 12 + 1
+    return date(year, month, min(start.day, monthrange(year, month)[1])) - timedelta(days=1)
+
+
+class PassLevel(NamedTuple):
+    """
+    One step of a vectorized critical-path pass: tasks whose dependencies in the pass's direction
+    all lie in earlier steps, with those dependencies as flat arrays grouped by task.
+    """
+
+    nodes: np.ndarray
+    linked: np.ndarray  # the nodes that have dependencies, in the order of their groups
+    groups: np.ndarray  # index of each linked node's first dependency
+    link_nodes: np.ndarray  # per dependency: the node it constrains
+    others: np.ndarray  # per dependency: the predecessor (forward pass) or successor (backward pass)
+    reads_finish: np.ndarray  # per dependency: 1 to read the other node's finish, 0 for its start
+    offsets: np.ndarray  # per dependency: the lag, signed for the pass
+    duration_signs: np.ndarray  # per dependency: -1, 0 or +1 times the constrained node's duration
+    has_duration_terms: bool  # False when all duration_signs are 0, as with only FS dependencies
+
+
+def pass_levels(network: TaskNetwork, forward: bool) -> List[PassLevel]:
+    """
+    Groups the tasks by their depth in the graph, counted from the start (forward) or the end
+    (backward), so each pass needs a few NumPy operations per level instead of per task.
+    """
+    order = network.order if forward else network.order[::-1]
+    links = network.predecessors if forward else network.successors
+    depth = [0] * len(order)
+    for node in order:
+        for other, _, _ in links[node]:
+            depth[node] = max(depth[node], depth[other] + 1)
+    by_depth: List[List[int]] = [[] for _ in range(max(depth, default=-1) + 1)]
+    for node in order:
+        by_depth[depth[node]].append(node)
+    levels: List[PassLevel] = []
+    for nodes in by_depth:
+        linked = [node for node in nodes if links[node]]
+        node_links = [(node, other, kind, lag) for node in linked for other, kind, lag in links[node]]
+        if forward:  # FS and FF follow the predecessor's finish, SS its start; FF then takes off the duration
+            reads_finish = [kind != "SS" for _, _, kind, _ in node_links]
+            offsets = [lag for _, _, _, lag in node_links]
+            duration_signs = [-1 if kind == "FF" else 0 for _, _, kind, _ in node_links]
+        else:  # FF follows the successor's latest finish, FS and SS its latest start; SS then adds the duration
+            reads_finish = [kind == "FF" for _, _, kind, _ in node_links]
+            offsets = [-lag for _, _, _, lag in node_links]
+            duration_signs = [1 if kind == "SS" else 0 for _, _, kind, _ in node_links]
+        levels.append(
+            PassLevel(
+                nodes=np.array(nodes, dtype=np.intp),
+                linked=np.array(linked, dtype=np.intp),
+                groups=np.cumsum([0] + [len(links[node]) for node in linked[:-1]], dtype=np.intp) if linked else np.zeros(0, dtype=np.intp),
+                link_nodes=np.array([node for node, _, _, _ in node_links], dtype=np.intp),
+                others=np.array([other for _, other, _, _ in node_links], dtype=np.intp),
+                reads_finish=np.array(reads_finish, dtype=np.intp),
+                offsets=np.array(offsets, dtype=np.int32),
+                duration_signs=np.array(duration_signs, dtype=np.int32),
+                has_duration_terms=any(duration_signs),
+            )
+        )
+    return levels
+
+
+@dataclass(frozen=True)
+class RiskModel:
+    """The task graph with three-point duration estimates in working days; picklable for the worker processes."""
+
+    ids: List[int]
+    start_bounds: np.ndarray
+    optimistic: np.ndarray
+    most_likely: np.ndarray
+    pessimistic: np.ndarray
+    forward: List[PassLevel]
+    backward: List[PassLevel]
+
+
+def build_risk_model(network: TaskNetwork, done_task_ids: Iterable[int], settings: RiskSettings) -> RiskModel:
+    """
+    Derives three-point estimates from the planned durations: the most likely duration is the
+    planned one, the optimistic and pessimistic ones are percentages of it, and the pessimistic
+    one is stretched further by the scope-change allowance. Done tasks keep their duration.
+    """
+    most_likely = np.array(network.durations, dtype=np.float64)
+    optimistic = most_likely * settings.optimistic_percent / 100.0
+    pessimistic = most_likely * settings.pessimistic_percent / 100.0 * settings.scope_change_factor
+    done = np.isin(np.array(network.ids, dtype=np.int64), np.fromiter(done_task_ids, dtype=np.int64))
+    optimistic[done] = most_likely[done]
+    pessimistic[done] = most_likely[done]
+    return RiskModel(
+        ids=list(network.ids),
+        start_bounds=np.array(network.start_bounds, dtype=np.int32),
+        optimistic=optimistic,
+        most_likely=most_likely,
+        pessimistic=pessimistic,
+        forward=pass_levels(network, forward=True),
+        backward=pass_levels(network, forward=False),
+    )
+
+
+def chunk_sizes(iterations: int, task_count: int) -> List[int]:
+    """Splits the iterations into chunks small enough for steady progress and bounded worker memory."""
+    size = min(max(_CHUNK_CELLS // max(task_count, 1), _MIN_CHUNK_ITERATIONS), _MAX_CHUNK_ITERATIONS)
+    full, rest = divmod(iterations, size)
+    return [size] * full + ([rest] if rest else [])
+
+
+def sample_durations(model: RiskModel, iterations: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draws task durations from triangular distributions over the three-point estimates, rounded
+    to whole working days. Returns a (tasks, iterations) array.
+    """
+    low, mode, high = model.optimistic, model.most_likely, model.pessimistic
+    durations = np.repeat(np.rint(mode).astype(np.int32)[:, None], iterations, axis=1)
+    uncertain = high > low
+    if uncertain.any():
+        draws = rng.triangular(low[uncertain, None], mode[uncertain, None], high[uncertain, None], size=(int(uncertain.sum()), iterations))
+        durations[uncertain] = np.rint(draws).astype(np.int32)
+    return durations
+
+
+def simulate_chunk(model: RiskModel, iterations: int, seed: np.random.SeedSequence) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Runs the forward and backward passes of CriticalPath over a chunk of sampled durations at
+    once, level by level across all iterations. Runs in a worker process.
+
+    Returns:
+        The project finish (exclusive working-day number) of every iteration, and per task the
+        number of iterations in which it was critical.
+    """
+    durations = sample_durations(model, iterations, np.random.default_rng(seed))
+    early = np.empty((2,) + durations.shape, dtype=np.int32)  # earliest start, earliest finish
+    for level in model.forward:
+        early[0, level.nodes] = model.start_bounds[level.nodes, None]
+        if len(level.linked):
+            bounds = early[level.reads_finish, level.others]
+            bounds += level.offsets[:, None]
+            if level.has_duration_terms:
+                bounds += level.duration_signs[:, None] * durations[level.link_nodes]
+            early[0, level.linked] = np.maximum(early[0, level.linked], np.maximum.reduceat(bounds, level.groups, axis=0))
+        early[1, level.nodes] = early[0, level.nodes] + durations[level.nodes]
+    finish = early[1].max(axis=0)
+    late = np.empty_like(early)  # latest start, latest finish
+    for level in model.backward:
+        late[1, level.nodes] = finish
+        if len(level.linked):
+            bounds = late[level.reads_finish, level.others]
+            bounds += level.offsets[:, None]
+            if level.has_duration_terms:
+                bounds += level.duration_signs[:, None] * durations[level.link_nodes]
+            late[1, level.linked] = np.minimum(late[1, level.linked], np.minimum.reduceat(bounds, level.groups, axis=0))
+        late[0, level.nodes] = late[1, level.nodes] - durations[level.nodes]
+    return finish, (late[0] <= early[0]).sum(axis=1)
+
+
+@dataclass
+class ScheduleRiskResult:
+    """Outcome of a simulation: finish-date percentiles, the chance of meeting the target and per-task criticality."""
+
+    iterations: int
+    finish_percentiles: Dict[int, date]  # percentile -> finish date
+    planned_finish: Optional[date]
+    target: Optional[date]
+    on_time_probability: Optional[float]
+    criticality: Dict[int, float]  # task id -> share of iterations in which the task was critical
+    planned_critical: FrozenSet[int]
+
+
+def summarize(
+    critical_path: CriticalPath, task_ids: List[int], finishes: np.ndarray, critical_counts: np.ndarray, target: Optional[date]
+) -> ScheduleRiskResult:
+    """Turns the combined chunk results (counts in the order of task_ids) into dates and shares."""
+    iterations = len(finishes)
+    percentiles = {p: critical_path.to_date(int(np.percentile(finishes, p, method="higher")) - 1) for p in PERCENTILES}
+    on_time: Optional[float] = None
+    if target is not None:
+        # A finish (exclusive) up to the number of the day after the target ends on or before it
+        on_time = float(np.mean(finishes <= critical_path.to_working_day(target + timedelta(days=1))))
+    return ScheduleRiskResult(
+        iterations=iterations,
+        finish_percentiles=percentiles,
+        planned_finish=critical_path.finish_date,
+        target=target,
+        on_time_probability=on_time,
+        criticality={task_id: float(count) / iterations for task_id, count in zip(task_ids, critical_counts.tolist())},
+        planned_critical=frozenset(critical_path.critical_task_ids()),
+    )
+
+
+class ScheduleRiskRunner(QObject):
+    """
+    Runs schedule risk simulations in chunks on a process pool, so the Monte Carlo work neither
+    blocks the event loop nor is limited to one core. Progress, the result and failures are
+    delivered on the GUI thread through Qt signals. The pool is started on the first run and
+    kept for later ones; shutdown() stops it.
+    """
+
+    progress = Signal(int, int)  # iterations done, iterations in total
+    finished = Signal(object)  # ScheduleRiskResult
+    failed = Signal(object)  # exception
+    _chunk_done = Signal(int, object)  # run id, future; from the pool's callback thread
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._workers = 0
+        self._run_id = 0
+        self._futures: List["Future[Tuple[np.ndarray, np.ndarray]]"] = []
+        self._finishes: List[np.ndarray] = []
+        self._critical_counts: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._done = 0
+        self._total = 0
+        self._critical_path: Optional[CriticalPath] = None
+        self._task_ids: List[int] = []
+        self._target: Optional[date] = None
+        self._chunk_done.connect(self._on_chunk_done)
+
+    def is_running(self) -> bool:
+        return bool(self._futures)
+
+    def start(
+        self, critical_path: CriticalPath, model: RiskModel, settings: RiskSettings, target: Optional[date], seed: Optional[int] = None
+    ) -> None:
+        """
+        Starts a simulation of settings.iterations iterations, cancelling one that is still running.
+
+        Args:
+            critical_path: The planned schedule the model was built from; converts the results to dates.
+            model: The task graph and duration estimates to sample.
+            settings: Iterations and the worker count.
+            target: The date to report the chance of finishing by, if any.
+            seed: Makes the run reproducible; None draws fresh entropy.
+        """
+        self.cancel()
+        if not model.ids:
+            raise ValueError("The project has no tasks to simulate.")
+        executor = self._pool(settings.workers)
+        self._run_id += 1
+        run_id = self._run_id
+        sizes = chunk_sizes(settings.iterations, len(model.ids))
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        self._critical_path, self._task_ids, self._target = critical_path, model.ids, target
+        self._finishes, self._critical_counts = [], np.zeros(len(model.ids), dtype=np.int64)
+        self._done, self._total = 0, settings.iterations
+        for size, chunk_seed in zip(sizes, seeds):
+            future = executor.submit(simulate_chunk, model, size, chunk_seed)
+            self._futures.append(future)
+            future.add_done_callback(lambda future, run_id=run_id: self._chunk_done.emit(run_id, future))
+        self.progress.emit(0, self._total)
+
+    def cancel(self) -> None:
+        """Stops the running simulation; chunks already being computed finish in the background and are dropped."""
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
+        self._run_id += 1
+
+    def shutdown(self) -> None:
+        """Cancels any simulation and stops the worker processes; used on shutdown."""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self, workers: int) -> ProcessPoolExecutor:
+        if self._executor is None or workers != self._workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            # Spawned rather than forked: forking the threaded GUI process is unsafe
+            self._executor = ProcessPoolExecutor(max_workers=workers or None, mp_context=multiprocessing.get_context("spawn"))
+            self._workers = workers
+        return self._executor
+
+    def _on_chunk_done(self, run_id: int, future: "Future[Tuple[np.ndarray, np.ndarray]]") -> None:
+        if run_id != self._run_id or future.cancelled() or self._critical_path is None:
+            return
+        error = future.exception()
+        if error is not None:
+            self.cancel()
+            if isinstance(error, BrokenProcessPool):
+                self._executor = None  # A crashed worker breaks the pool; start a fresh one next time
+            self.failed.emit(error)
+            return
+        finishes, critical_counts = future.result()
+        self._finishes.append(finishes)
+        self._critical_counts += critical_counts
+        self._done += len(finishes)
+        self.progress.emit(self._done, self._total)
+        if self._done < self._total:
+            return
+        self._futures = []
+        self.finished.emit(
+            summarize(self._critical_path, self._task_ids, np.concatenate(self._finishes), self._critical_counts, self._target)
+        )
@@ -0,0 +1,58 @@
+# startup_timing.py
+import logging
+import time
+from datetime import datetime
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+STARTUP_TIMING_LOG = "startup_timing.log"
+
+
+class StartupTimer:
+    """
+    Records the milestones of one application start (imports done, window built, first paint,
+    database open, ...) as times since the timer was created, and appends them as one line to
+    the startup-timing log when the start is finished.
+    """
+
+    def __init__(self, log_file: str = STARTUP_TIMING_LOG) -> None:
+        """
+        Initializes the timer; create it as early as possible so the import time is included.
+
+        Args:
+            log_file: The file the summary line is appended to.
+        """
+        self.log_file: str = log_file
+        self._start: float = time.perf_counter()
+        self._marks: List[Tuple[str, float]] = []
+        self._finished: bool = False
+
+    def mark(self, milestone: str) -> None:
+        """Records a milestone at the current time; ignored once the start is finished."""
+        if not self._finished:
+            self._marks.append((milestone, time.perf_counter() - self._start))
+
+    def summary(self) -> str:
+        """Returns the milestones recorded so far, e.g. "imports 310 ms, window 420 ms"."""
+        return ", ".join(f"{milestone} {seconds * 1000:.0f} ms" for milestone, seconds in self._marks)
+
+    def finish(self, milestone: str) -> None:
+        """
+        Records the final milestone and appends the summary to the startup-timing log.
+        Later calls do nothing, so it can be called from a handler that runs more than once.
+
+        Args:
+            milestone: Name of the milestone that ends the start, e.g. "ready".
+        """
+        if self._finished:
+            return
+        self.mark(milestone)
+        self._finished = True
+        line = f"{datetime.now():%Y-%m-%d %H:%M:%S} {self.summary()}"
+        logger.info("Startup: %s", self.summary())
+        try:
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as exc:
+            logger.warning("Could not write startup timing to %s: %s", self.log_file, exc)
@@ -0,0 +1,32 @@
+from typing import Callable, Optional
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+
+
+class LazyTab(QWidget):
+    """
+    Tab page that stands in for a real tab until it is needed. The factory builds the tab
+    on the first call to widget() (e.g. when the page is first activated), and the tab is
+    then shown inside this page.
+    """
+
+    built = Signal()  # emitted once the real tab has been built and placed in the page
+
+    def __init__(self, factory: Callable[[], QWidget], parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._factory = factory
+        self._widget: Optional[QWidget] = None
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+    def is_built(self) -> bool:
+        """True once the real tab exists."""
+        return self._widget is not None
+
+    def widget(self) -> QWidget:
+        """Returns the real tab, building it on first use."""
+        if self._widget is None:
+            self._widget = self._factory()
+            self._layout.addWidget(self._widget)
+            self.built.emit()
+        return self._widget
@@ -0,0 +1,159 @@
+import math
+from typing import Any, Callable, List, Optional
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableView, QHeaderView
+import numpy as np
+from capacity import CapacityMatrix
+
+# Heatmap colours: idle, fully booked and overloaded (at OVERLOAD_SATURATION and above)
+_IDLE_COLOR = QColor(200, 230, 201)
+_FULL_COLOR = QColor(255, 236, 153)
+_OVERLOAD_COLOR = QColor(239, 119, 112)
+OVERLOAD_SATURATION = 1.5
+
+
+def _blend(low: QColor, high: QColor, fraction: float) -> QColor:
+    fraction = min(max(fraction, 0.0), 1.0)
+    return QColor(
+        round(low.red() + (high.red() - low.red()) * fraction),
+        round(low.green() + (high.green() - low.green()) * fraction),
+        round(low.blue() + (high.blue() - low.blue()) * fraction),
+    )
+
+
+def utilization_color(ratio: float) -> QColor:
+    """Maps load/capacity to the heatmap colour: green when idle, yellow when full, red when overloaded."""
+    if ratio <= 1.0:
+        return _blend(_IDLE_COLOR, _FULL_COLOR, ratio)
+    return _blend(_FULL_COLOR, _OVERLOAD_COLOR, (ratio - 1.0) / (OVERLOAD_SATURATION - 1.0))
+
+
+class CapacityTableModel(QAbstractTableModel):
+    """Team members (rows) by week (columns) of a CapacityMatrix, showing utilization as a heatmap."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._matrix: Optional[CapacityMatrix] = None
+        self._utilization: np.ndarray = np.zeros((0, 0))
+        self._weeks: List[Any] = []
+        self._shape = (0, 0)
+
+    def matrix(self) -> Optional[CapacityMatrix]:
+        return self._matrix
+
+    def set_matrix(self, matrix: Optional[CapacityMatrix]) -> None:
+        """Shows a newly built matrix."""
+        self.beginResetModel()
+        self._matrix = matrix
+        self._snapshot()
+        self.endResetModel()
+
+    def matrix_changed(self) -> None:
+        """Refreshes the view after the shown matrix was updated in place; resets only if rows or weeks were added."""
+        if self._matrix is None:
+            return
+        if (len(self._matrix.members), self._matrix.week_count) != self._shape:
+            self.set_matrix(self._matrix)
+            return
+        self._snapshot()
+        if self._shape[0] and self._shape[1]:
+            self.dataChanged.emit(self.index(0, 0), self.index(self._shape[0] - 1, self._shape[1] - 1))
+
+    def _snapshot(self) -> None:
+        if self._matrix is None:
+            self._utilization, self._weeks, self._shape = np.zeros((0, 0)), [], (0, 0)
+            return
+        self._utilization = self._matrix.utilization()
+        self._weeks = self._matrix.week_starts()
+        self._shape = (len(self._matrix.members), self._matrix.week_count)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._shape[0]
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._shape[1]
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or self._matrix is None:
+            return None
+        row, column = index.row(), index.column()
+        ratio = float(self._utilization[row, column])
+        load = float(self._matrix.load[row, column])
+        if role == Qt.ItemDataRole.DisplayRole:
+            return "" if math.isnan(ratio) or load <= 0 else f"{ratio:.0%}"
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if math.isnan(ratio):
+                return None
+            return utilization_color(ratio)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return QColor(Qt.GlobalColor.black) if not math.isnan(ratio) else None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.ToolTipRole:
+            member = self._matrix.members[row]
+            week = self._weeks[column]
+            lines = [
+                f"{member.name} — week of {week.strftime('%d %b %Y')}",
+                f"{load:g} of {float(self._matrix.capacity[row, column]):g} person-days booked",
+            ]
+            holidays = self._matrix.holidays_in_week(row, week)
+            if holidays:
+                lines.append("Holidays: " + ", ".join(day.strftime("%a %d %b") for day in holidays))
+            return "\n".join(lines)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole or self._matrix is None:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._weeks[section].strftime("%d %b")
+        member = self._matrix.members[section]
+        return f"{member.name} (×{member.headcount})" if member.headcount > 1 else member.name
+
+
+class CapacityTab(QWidget):
+    def __init__(self, parent: QWidget | None, refresh: Callable[[], None]):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        top_bar_layout = QHBoxLayout()
+        self.capacity_summary_label = QLabel(
+            "Booked working days per person and week across all projects, against their working days after weekends and holidays."
+        )
+        self.capacity_summary_label.setWordWrap(True)
+        self.refresh_capacity_btn = QPushButton("Refresh")
+        self.refresh_capacity_btn.clicked.connect(refresh)
+        top_bar_layout.addWidget(self.capacity_summary_label, stretch=1)
+        top_bar_layout.addWidget(self.refresh_capacity_btn)
+        layout.addLayout(top_bar_layout)
+        self.capacity_model = CapacityTableModel(self)
+        self.capacity_view = QTableView()
+        self.capacity_view.setModel(self.capacity_model)
+        self.capacity_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.capacity_view.horizontalHeader().setDefaultSectionSize(60)
+        self.capacity_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        layout.addWidget(self.capacity_view, stretch=1)
+        self.overload_label = QLabel()
+        layout.addWidget(self.overload_label)
+        self.capacity_model.modelReset.connect(self._update_overload_label)
+        self.capacity_model.dataChanged.connect(self._update_overload_label)
+
+    def show_matrix(self, matrix: CapacityMatrix) -> None:
+        """Shows a freshly built capacity matrix."""
+        self.capacity_model.set_matrix(matrix)
+
+    def matrix_changed(self) -> None:
+        """Refreshes the heatmap after the shown matrix was updated incrementally."""
+        self.capacity_model.matrix_changed()
+
+    def _update_overload_label(self) -> None:
+        matrix = self.capacity_model.matrix()
+        if matrix is None or not matrix.week_count:
+            self.overload_label.setText("No scheduled open tasks.")
+            return
+        overloaded = np.nan_to_num(matrix.utilization()) > 1.0
+        names = [member.name for member, weeks in zip(matrix.members, overloaded) if weeks.any()]
+        if not names:
+            self.overload_label.setText("Nobody is overloaded.")
+        else:
+            self.overload_label.setText(f"Overloaded in {int(overloaded.sum())} person-week(s): " + ", ".join(names))
@@ -0,0 +1,137 @@
+from typing import Any, Callable, List, Optional
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, QSignalBlocker, Qt
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QComboBox,
+    QCheckBox,
+    QPushButton,
+    QTableView,
+    QHeaderView,
+    QAbstractItemView,
+)
+from sqlalchemy import Row
+
+MY_WORK_COLUMNS = ("Project", "Phase", "Epic", "Task", "Status", "Priority", "Start", "Due", "Assigned To")
+
+
+def my_work_row_values(row: Row[Any]) -> List[str]:
+    """Formats a ProjectManagerDB.get_member_tasks row as the table's column values."""
+    return [
+        row.project_name,
+        row.phase_name,
+        row.epic_name,
+        row.name,
+        row.status,
+        row.priority,
+        row.start_date.strftime("%Y-%m-%d") if row.start_date else "",
+        row.due_date.strftime("%Y-%m-%d") if row.due_date else "N/A",
+        row.assigned_to or "",
+    ]
+
+
+class MyWorkTableModel(QAbstractTableModel):
+    """One team member's tasks across all projects, formatted once when they arrive."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._rows: List[Row[Any]] = []
+        self._values: List[List[str]] = []
+
+    def set_rows(self, rows: List[Row[Any]]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._values = [my_work_row_values(row) for row in rows]
+        self.endResetModel()
+
+    def row_at(self, index: QModelIndex | QPersistentModelIndex) -> Optional[Row[Any]]:
+        return self._rows[index.row()] if index.isValid() else None
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(MY_WORK_COLUMNS)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self._values[index.row()][index.column()]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return MY_WORK_COLUMNS[section]
+        return None
+
+
+class MyWorkTab(QWidget):
+    def __init__(
+        self,
+        parent: QWidget | None,
+        load_my_work_callback: Callable[[], None],
+        open_task: Callable[[Row[Any]], None],
+    ):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        top_bar_layout = QHBoxLayout()
+        top_bar_layout.addWidget(QLabel("Team Member:"))
+        self.member_combo = QComboBox()
+        self.member_combo.setMinimumWidth(250)
+        self.member_combo.currentIndexChanged.connect(load_my_work_callback)
+        top_bar_layout.addWidget(self.member_combo)
+        self.include_done_checkbox = QCheckBox("Include done tasks")
+        self.include_done_checkbox.toggled.connect(load_my_work_callback)
+        top_bar_layout.addWidget(self.include_done_checkbox)
+        top_bar_layout.addStretch()
+        self.refresh_my_work_btn = QPushButton("Refresh")
+        self.refresh_my_work_btn.clicked.connect(load_my_work_callback)
+        top_bar_layout.addWidget(self.refresh_my_work_btn)
+        layout.addLayout(top_bar_layout)
+
+        self.my_work_model = MyWorkTableModel(self)
+        self.my_work_view = QTableView()
+        self.my_work_view.setModel(self.my_work_model)
+        self.my_work_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.my_work_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.my_work_view.verticalHeader().setVisible(False)
+        self.my_work_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.my_work_view.horizontalHeader().setStretchLastSection(True)
+        self.my_work_view.doubleClicked.connect(lambda index: self._open_row(index, open_task))
+        layout.addWidget(self.my_work_view, stretch=1)
+        self.my_work_summary_label = QLabel("Double-click a task to open its project plan.")
+        layout.addWidget(self.my_work_summary_label)
+
+    def selected_member_id(self) -> Optional[int]:
+        return self.member_combo.currentData()
+
+    def include_done(self) -> bool:
+        return self.include_done_checkbox.isChecked()
+
+    def show_members(self, members: List[Row[Any]], selected_member_id: Optional[int]) -> None:
+        """Refills the member dropdown without triggering a reload, keeping the given member selected."""
+        with QSignalBlocker(self.member_combo):
+            self.member_combo.clear()
+            if not members:
+                self.member_combo.addItem("No assigned team members yet")
+            for member in members:
+                self.member_combo.addItem(member.name, userData=member.id)
+            index = self.member_combo.findData(selected_member_id) if selected_member_id is not None else 0
+            self.member_combo.setCurrentIndex(max(index, 0))
+        self.member_combo.setEnabled(bool(members))
+
+    def show_tasks(self, rows: List[Row[Any]]) -> None:
+        self.my_work_model.set_rows(rows)
+        self.my_work_view.resizeColumnsToContents()
+        project_count = len({row.project_id for row in rows})
+        self.my_work_summary_label.setText(
+            f"{len(rows)} task(s) in {project_count} project(s). Double-click a task to open its project plan."
+        )
+
+    def _open_row(self, index: QModelIndex, open_task: Callable[[Row[Any]], None]) -> None:
+        row = self.my_work_model.row_at(index)
+        if row is not None:
+            open_task(row)
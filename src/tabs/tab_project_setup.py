@@ -1,5 +1,380 @@
-from typing import Callable
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QGroupBox, QTreeWidget, QHeaderView, QHBoxLayout, QPushButton, QSizePolicy
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QGroupBox,
+    QTreeView,
+    QHeaderView,
+    QHBoxLayout,
+    QPushButton,
+    QSizePolicy,
+    QLabel,
+    QAbstractItemView,
+)
+from sqlalchemy import Row
+from database import DONE_TASK_STATUS, PlanRollups, PlanSnapshot
+
+PLAN_ITEM_KINDS = ("phase", "epic", "task", "subtask")
+PlanItemKey = Tuple[str, int]
+PLAN_COLUMNS = ("Item", "Description", "Assigned To", "Status", "Due Date")
+STATUS_COLUMN = 3
+# Every plan index returns its (entity kind, primary key) for this role
+PLAN_ITEM_ROLE = Qt.ItemDataRole.UserRole
+# Task indexes return True for this role when the task is on the critical path
+CRITICAL_TASK_ROLE = Qt.ItemDataRole.UserRole + 1
+CRITICAL_TASK_COLOR = QColor(220, 53, 69, 70)  # Translucent, so it reads on the light and the dark theme
+# Plans up to this many rows open fully expanded; larger ones show phases and load deeper levels on expand
+EXPAND_ALL_LIMIT = 2000
+# Refreshes of plans larger than this are applied with view updates disabled and repainted once
+BATCH_REFRESH_ROWS = 500
+ChildRows = Dict[PlanItemKey, List[Tuple[str, Row[Any]]]]
+
+
+def format_rollup(counts: Dict[str, int]) -> str:
+    """Summarises task counts by status as e.g. '3/8 done (38%)'."""
+    total = sum(counts.values())
+    if total == 0:
+        return "No tasks"
+    done = counts.get(DONE_TASK_STATUS, 0)
+    return f"{done}/{total} done ({done * 100 // total}%)"
+
+
+def format_rollup_breakdown(counts: Dict[str, int]) -> str:
+    """Lists task counts per status, largest first, e.g. 'To Do 5 · In Progress 2 · Done 1'."""
+    return " · ".join(f"{status} {task_count}" for status, task_count in sorted(counts.items(), key=lambda entry: -entry[1]))
+
+
+def plan_row_values(kind: str, row: Row[Any]) -> List[str]:
+    """Formats a PlanSnapshot row as the tree's column values."""
+    if kind == "phase":
+        return [row.name, row.description or "", "", "", ""]
+    if kind == "epic":
+        return [row.name, row.description or "", "", row.status, ""]
+    if kind == "task":
+        return [row.name, row.description or "", row.assigned_to or "", row.status, row.due_date.strftime("%Y-%m-%d") if row.due_date else "N/A"]
+    return [row.name, row.description or "", row.assigned_to or "", row.status, ""]
+
+
+class PlanNode:
+    """One materialised plan tree row; slots keep large plans compact."""
+
+    __slots__ = ("kind", "id", "parent", "row", "values", "children", "fetched")
+
+    def __init__(self, kind: str, item_id: int, parent: Optional["PlanNode"], values: List[str]) -> None:
+        self.kind = kind
+        self.id = item_id
+        self.parent = parent
+        self.row = 0  # Position among the parent's children, kept current on insert/remove
+        self.values = values
+        self.children: List["PlanNode"] = []
+        self.fetched = False  # True once the parked child rows have been turned into child nodes
+
+    @property
+    def key(self) -> PlanItemKey:
+        return (self.kind, self.id)
+
+
+class PlanTreeModel(QAbstractItemModel):
+    """
+    Phase -> Epic -> Task -> SubTask model over a PlanSnapshot.
+    Only phases are materialised up front; the snapshot rows for everything else are parked per
+    parent and turned into nodes when the view expands that parent (canFetchMore/fetchMore).
+    Phase and epic status cells combine the entity's own status with the task rollups.
+    A newer snapshot of the same plan is merged in place by apply_snapshot.
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._root = PlanNode("root", 0, None, [])
+        self._root.fetched = True
+        # (kind, id) -> node for materialised nodes
+        self._nodes: Dict[PlanItemKey, PlanNode] = {}
+        # parent (kind, id) -> (kind, row) children of nodes that have not been fetched yet
+        self._unfetched: ChildRows = {}
+        self._rollups = PlanRollups(epics={}, phases={})
+        self._critical_tasks: Set[int] = set()
+        self._merging = False  # Fetches are refused while apply_snapshot moves nodes around
+
+    def reset_plan(self, snapshot: Optional[PlanSnapshot]) -> None:
+        """Replaces the model contents with a snapshot (or clears it for None)."""
+        self.beginResetModel()
+        self._root.children = []
+        self._nodes = {}
+        self._unfetched = {}
+        self._rollups = PlanRollups(epics={}, phases={})
+        self._critical_tasks = set()
+        if snapshot is not None:
+            self._unfetched = self._children_by_parent(snapshot)
+            for kind, row in self._unfetched.pop(self._root.key, []):
+                self._append_node(self._root, PlanNode(kind, row.id, self._root, plan_row_values(kind, row)))
+        self.endResetModel()
+
+    def apply_snapshot(self, snapshot: PlanSnapshot) -> None:
+        """
+        Merges a newer snapshot of the same plan by primary key: rows are inserted, removed,
+        moved and updated in place, so the view keeps its selection, expansion and scroll
+        position. Parents that were never expanded just get their parked rows replaced.
+        """
+        new_children = self._children_by_parent(snapshot)
+        new_parents = {(kind, row.id): parent_key for parent_key, rows in new_children.items() for kind, row in rows}
+        self._unfetched = dict(new_children)
+        deferred: List[PlanNode] = []
+        self._merging = True
+        try:
+            self._sync_children(self._root, new_children, new_parents, deferred)
+            # Deferred moves whose new parent was never visited (removed, or itself moved out of view) are dropped
+            for node in deferred:
+                if self._nodes.get(node.key) is node and node.parent is not None and node.parent.key != new_parents.get(node.key):
+                    self._remove_child(node)
+        finally:
+            self._merging = False
+        for key in list(self._unfetched):
+            node = self._root if key == self._root.key else self._nodes.get(key)
+            if node is not None and node.fetched:
+                del self._unfetched[key]
+
+    def _children_by_parent(self, snapshot: PlanSnapshot) -> ChildRows:
+        """Groups snapshot rows as parent (kind, id) -> ordered (kind, row) children; phases sit under the root."""
+        children: ChildRows = {self._root.key: [("phase", phase) for phase in snapshot.phases]}
+        for parent_kind, kind, rows, parent_key in (
+            ("phase", "epic", snapshot.epics, "phase_id"),
+            ("epic", "task", snapshot.tasks, "epic_id"),
+            ("task", "subtask", snapshot.subtasks, "task_id"),
+        ):
+            for row in rows:
+                children.setdefault((parent_kind, getattr(row, parent_key)), []).append((kind, row))
+        return children
+
+    def _sync_children(
+        self, parent_node: PlanNode, new_children: ChildRows, new_parents: Dict[PlanItemKey, PlanItemKey], deferred: List[PlanNode]
+    ) -> None:
+        """Makes an expanded node's children match its new child rows, then recurses into expanded children."""
+        wanted = new_children.get(parent_node.key, [])
+        wanted_keys = {(kind, row.id) for kind, row in wanted}
+        for child in reversed(parent_node.children):
+            if child.key in wanted_keys:
+                continue
+            new_parent = self._nodes.get(new_parents.get(child.key, self._root.key))
+            if new_parent is not None and new_parent.fetched:
+                deferred.append(child)  # Moved under another expanded parent, which picks it up with its subtree
+                continue
+            self._remove_child(child)
+        parent_index = self._parent_index(parent_node)
+        for position, (kind, row) in enumerate(wanted):
+            values = plan_row_values(kind, row)
+            node = self._nodes.get((kind, row.id))
+            if node is None:
+                self.beginInsertRows(parent_index, position, position)
+                self._insert_child(parent_node, position, PlanNode(kind, row.id, parent_node, values))
+                self.endInsertRows()
+                continue
+            if node.parent is not parent_node or node.row != position:
+                self._move_child(node, parent_node, position)
+            if node.values != values:
+                node.values = values
+                self.dataChanged.emit(self.createIndex(position, 0, node), self.createIndex(position, len(PLAN_COLUMNS) - 1, node))
+        for child in parent_node.children[: len(wanted)]:
+            if child.fetched:
+                self._sync_children(child, new_children, new_parents, deferred)
+
+    def set_rollups(self, rollups: PlanRollups) -> None:
+        """Updates the progress shown in phase and epic status cells."""
+        self._rollups = rollups
+        for node in self._nodes.values():
+            if node.kind in ("phase", "epic"):
+                index = self.createIndex(node.row, STATUS_COLUMN, node)
+                self.dataChanged.emit(index, index)
+
+    def set_critical_tasks(self, task_ids: Set[int], changed: Optional[Iterable[int]] = None) -> None:
+        """Highlights the critical tasks, repainting only the rows in changed (all task rows when None)."""
+        self._critical_tasks = set(task_ids)
+        keys = (("task", task_id) for task_id in changed) if changed is not None else (node.key for node in self._nodes.values() if node.kind == "task")
+        for key in list(keys):
+            node = self._nodes.get(key)
+            if node is not None:
+                self.dataChanged.emit(self.createIndex(node.row, 0, node), self.createIndex(node.row, len(PLAN_COLUMNS) - 1, node))
+
+    def task_names(self) -> Dict[int, str]:
+        """Returns id -> name of every task in the plan, including rows not materialised yet."""
+        names = {node.id: node.values[0] for node in self._nodes.values() if node.kind == "task"}
+        for rows in self._unfetched.values():
+            for kind, row in rows:
+                if kind == "task":
+                    names.setdefault(row.id, row.name)
+        return names
+
+    def node(self, key: Optional[PlanItemKey]) -> Optional[PlanNode]:
+        """Returns the materialised node for (kind, id), or None."""
+        return self._nodes.get(key) if key is not None else None
+
+    def node_from_index(self, index: QModelIndex | QPersistentModelIndex) -> Optional[PlanNode]:
+        return index.internalPointer() if index.isValid() else None
+
+    def index_of(self, key: Optional[PlanItemKey]) -> QModelIndex:
+        node = self.node(key)
+        return self.createIndex(node.row, 0, node) if node is not None else QModelIndex()
+
+    def children_of(self, key: Optional[PlanItemKey]) -> List[PlanNode]:
+        """Returns a node's children (top-level phases for None), materialising them if needed."""
+        parent_node = self._root if key is None else self.node(key)
+        if parent_node is None:
+            return []
+        self._materialise_children(parent_node)
+        return parent_node.children
+
+    def add_node(self, kind: str, item_id: int, parent_key: Optional[PlanItemKey], values: List[str]) -> Optional[PlanNode]:
+        """Appends a node under its parent; returns None if the parent is not in the tree."""
+        parent_node = self._root if parent_key is None else self.node(parent_key)
+        if parent_node is None:
+            return None
+        self._materialise_children(parent_node)
+        position = len(parent_node.children)
+        self.beginInsertRows(self._parent_index(parent_node), position, position)
+        node = self._append_node(parent_node, PlanNode(kind, item_id, parent_node, values))
+        self.endInsertRows()
+        return node
+
+    def _remove_child(self, node: PlanNode) -> None:
+        parent_node = node.parent
+        assert parent_node is not None
+        self.beginRemoveRows(self._parent_index(parent_node), node.row, node.row)
+        self._detach(node)
+        pending = [node]
+        while pending:
+            current = pending.pop()
+            self._nodes.pop(current.key, None)
+            pending.extend(current.children)
+        self.endRemoveRows()
+
+    def set_values(self, key: PlanItemKey, values: Dict[int, str]) -> None:
+        """Updates some column values of a node in place."""
+        node = self.node(key)
+        if node is None:
+            return
+        for column, value in values.items():
+            node.values[column] = value
+        self.dataChanged.emit(self.createIndex(node.row, min(values), node), self.createIndex(node.row, max(values), node))
+
+    def _append_node(self, parent_node: PlanNode, node: PlanNode) -> PlanNode:
+        node.row = len(parent_node.children)
+        parent_node.children.append(node)
+        self._nodes[node.key] = node
+        return node
+
+    def _insert_child(self, parent_node: PlanNode, position: int, node: PlanNode) -> PlanNode:
+        parent_node.children.insert(position, node)
+        self._renumber(parent_node, position)
+        self._nodes[node.key] = node
+        return node
+
+    def _move_child(self, node: PlanNode, new_parent: PlanNode, position: int) -> None:
+        """Moves a node (with its subtree) to position under new_parent."""
+        old_parent = node.parent
+        assert old_parent is not None
+        # Qt expects the destination row as counted before the source row is removed
+        destination = position + 1 if old_parent is new_parent and position > node.row else position
+        self.beginMoveRows(self._parent_index(old_parent), node.row, node.row, self._parent_index(new_parent), destination)
+        self._detach(node)
+        new_parent.children.insert(position, node)
+        node.parent = new_parent
+        self._renumber(new_parent, position)
+        self.endMoveRows()
+
+    def _detach(self, node: PlanNode) -> None:
+        parent_node = node.parent
+        assert parent_node is not None
+        del parent_node.children[node.row]
+        self._renumber(parent_node, node.row)
+
+    @staticmethod
+    def _renumber(parent_node: PlanNode, start: int) -> None:
+        for position in range(start, len(parent_node.children)):
+            parent_node.children[position].row = position
+
+    def _materialise_children(self, parent_node: PlanNode) -> None:
+        """Turns a node's parked snapshot rows into child nodes (used when code, not the view, needs them)."""
+        if not parent_node.fetched:
+            self.fetchMore(self._parent_index(parent_node))
+
+    def _parent_index(self, node: PlanNode) -> QModelIndex:
+        return QModelIndex() if node is self._root else self.createIndex(node.row, 0, node)
+
+    def index(self, row: int, column: int, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> QModelIndex:
+        parent_node = self.node_from_index(parent) or self._root
+        if 0 <= row < len(parent_node.children) and 0 <= column < len(PLAN_COLUMNS):
+            return self.createIndex(row, column, parent_node.children[row])
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex | QPersistentModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        node = self.node_from_index(index)
+        if node is None or node.parent is None or node.parent is self._root:
+            return QModelIndex()
+        return self.createIndex(node.parent.row, 0, node.parent)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        return len((self.node_from_index(parent) or self._root).children)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return len(PLAN_COLUMNS)
+
+    def hasChildren(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> bool:
+        node = self.node_from_index(parent) or self._root
+        return bool(node.children) or (not node.fetched and node.key in self._unfetched)
+
+    def canFetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> bool:
+        node = self.node_from_index(parent)
+        return node is not None and not node.fetched and not self._merging and node.key in self._unfetched
+
+    def fetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> None:
+        parent_node = self.node_from_index(parent)
+        if parent_node is None or parent_node.fetched or self._merging:
+            return
+        parent_node.fetched = True
+        rows = self._unfetched.pop(parent_node.key, None)
+        if not rows:
+            return
+        start = len(parent_node.children)
+        self.beginInsertRows(parent, start, start + len(rows) - 1)
+        for kind, row in rows:
+            self._append_node(parent_node, PlanNode(kind, row.id, parent_node, plan_row_values(kind, row)))
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        node = self.node_from_index(index)
+        if node is None:
+            return None
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == STATUS_COLUMN and node.kind in ("phase", "epic"):
+                progress = format_rollup(self._rollup_counts(node))
+                return f"{node.values[column]} · {progress}" if node.values[column] else progress
+            return node.values[column]
+        if role == Qt.ItemDataRole.ToolTipRole and column == STATUS_COLUMN and node.kind in ("phase", "epic"):
+            return format_rollup_breakdown(self._rollup_counts(node))
+        critical = node.kind == "task" and node.id in self._critical_tasks
+        if role == Qt.ItemDataRole.BackgroundRole and critical:
+            return CRITICAL_TASK_COLOR
+        if role == Qt.ItemDataRole.ToolTipRole and column == 0 and critical:
+            return "On the critical path: any delay to this task moves the project finish."
+        if role == CRITICAL_TASK_ROLE:
+            return critical
+        if role == PLAN_ITEM_ROLE:
+            return node.key
+        return None
+
+    def _rollup_counts(self, node: PlanNode) -> Dict[str, int]:
+        return (self._rollups.phases if node.kind == "phase" else self._rollups.epics).get(node.id, {})
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return PLAN_COLUMNS[section]
+        return None
+
 
 class ProjectSetupTab(QWidget):
     def __init__(
@@ -9,6 +384,9 @@ class ProjectSetupTab(QWidget):
         show_add_epic: Callable[[], None],
         show_add_task: Callable[[], None],
         add_initial_plan: Callable[[], None],
+        show_bulk_edit: Callable[[], None],
+        show_add_dependency: Callable[[], None],
+        show_shift_dates: Callable[[], None],
     ):
         super().__init__(parent)
         layout = QVBoxLayout(self)
@@ -20,11 +398,22 @@ class ProjectSetupTab(QWidget):
         plan_layout = QVBoxLayout()
         plan_layout.setContentsMargins(0, 0, 0, 0)
         plan_layout.setSpacing(0)
-        self.project_plan_tree = QTreeWidget()
-        self.project_plan_tree.setHeaderLabels(["Item", "Description", "Assigned To", "Status", "Due Date"])  # type: ignore
+        self.project_summary_label = QLabel()
+        self.project_summary_label.setContentsMargins(4, 4, 4, 4)
+        plan_layout.addWidget(self.project_summary_label)
+        self.critical_path_label = QLabel()
+        self.critical_path_label.setContentsMargins(4, 0, 4, 4)
+        plan_layout.addWidget(self.critical_path_label)
+        self.plan_model = PlanTreeModel(self)
+        self.project_plan_tree = QTreeView()
+        self.project_plan_tree.setModel(self.plan_model)
+        self.project_plan_tree.setUniformRowHeights(True)
         self.project_plan_tree.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.project_plan_tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        self.project_plan_tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.project_plan_tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
         self.project_plan_tree.header().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.project_plan_tree.header().resizeSection(0, 320)
+        self._plan_project_id: Optional[int] = None  # Project whose plan the model currently shows
         plan_layout.addWidget(self.project_plan_tree, stretch=1)
         plan_buttons_layout = QHBoxLayout()
         self.add_phase_btn = QPushButton("Add Phase")
@@ -33,13 +422,140 @@ class ProjectSetupTab(QWidget):
         self.add_epic_btn.clicked.connect(show_add_epic)
         self.add_task_btn = QPushButton("Add Task")
         self.add_task_btn.clicked.connect(show_add_task)
+        self.bulk_edit_btn = QPushButton("Bulk Edit Tasks")
+        self.bulk_edit_btn.clicked.connect(show_bulk_edit)
+        self.add_dependency_btn = QPushButton("Add Dependency")
+        self.add_dependency_btn.clicked.connect(show_add_dependency)
+        self.shift_dates_btn = QPushButton("Shift Dates")
+        self.shift_dates_btn.clicked.connect(show_shift_dates)
         self.add_initial_plan_btn = QPushButton("Auto-Populate Project Plan")
         self.add_initial_plan_btn.clicked.connect(add_initial_plan)
         plan_buttons_layout.addWidget(self.add_phase_btn)
         plan_buttons_layout.addWidget(self.add_epic_btn)
         plan_buttons_layout.addWidget(self.add_task_btn)
+        plan_buttons_layout.addWidget(self.bulk_edit_btn)
+        plan_buttons_layout.addWidget(self.add_dependency_btn)
+        plan_buttons_layout.addWidget(self.shift_dates_btn)
         plan_buttons_layout.addStretch()
         plan_buttons_layout.addWidget(self.add_initial_plan_btn)
         plan_layout.addLayout(plan_buttons_layout)
         plan_group.setLayout(plan_layout)
         layout.addWidget(plan_group, stretch=1)
+
+    def show_plan(self, project_id: int, snapshot: PlanSnapshot) -> None:
+        """
+        Shows a project's plan. A refresh of the plan already shown is merged in place, keeping
+        selection, expansion and scroll position; another project's plan replaces the tree and
+        opens fully expanded, or for large plans with only the phases expanded.
+        """
+        row_count = len(snapshot.phases) + len(snapshot.epics) + len(snapshot.tasks) + len(snapshot.subtasks)
+        if project_id == self._plan_project_id:
+            batched = row_count > BATCH_REFRESH_ROWS
+            if batched:
+                self.project_plan_tree.setUpdatesEnabled(False)
+            try:
+                self.plan_model.apply_snapshot(snapshot)
+            finally:
+                if batched:
+                    self.project_plan_tree.setUpdatesEnabled(True)
+            return
+        self._plan_project_id = project_id
+        self.plan_model.reset_plan(snapshot)
+        self.project_summary_label.clear()
+        self.critical_path_label.clear()
+        if row_count <= EXPAND_ALL_LIMIT:
+            self.project_plan_tree.expandAll()
+            return
+        for phase in self.plan_model.children_of(None):
+            self.project_plan_tree.expand(self.plan_model.index_of(phase.key))
+
+    def clear_plan_items(self) -> None:
+        """Clears the tree and the project summary."""
+        self._plan_project_id = None
+        self.plan_model.reset_plan(None)
+        self.project_summary_label.clear()
+        self.critical_path_label.clear()
+
+    def shown_project_id(self) -> Optional[int]:
+        """Returns the project whose plan the tree shows, or None when it is empty."""
+        return self._plan_project_id
+
+    def current_plan_key(self) -> Optional[PlanItemKey]:
+        """Returns the (kind, id) of the tree's current item, or None."""
+        node = self.plan_model.node_from_index(self.project_plan_tree.currentIndex())
+        return node.key if node is not None else None
+
+    def ancestor_key(self, key: Optional[PlanItemKey], kind: str) -> Optional[PlanItemKey]:
+        """Walks up from key (inclusive) to the nearest item of the given kind."""
+        node = self.plan_model.node(key)
+        while node is not None and node.kind != "root":
+            if node.kind == kind:
+                return node.key
+            node = node.parent
+        return None
+
+    def item_name(self, key: Optional[PlanItemKey]) -> str:
+        """Returns the shown name of a plan item, or an empty string if it is not in the tree."""
+        node = self.plan_model.node(key)
+        return node.values[0] if node is not None else ""
+
+    def child_keys(self, key: Optional[PlanItemKey]) -> List[PlanItemKey]:
+        """Returns the keys of an item's children, or of the top-level phases for None."""
+        return [child.key for child in self.plan_model.children_of(key)]
+
+    def select_plan_item(self, key: PlanItemKey) -> None:
+        """Makes an item current and scrolls it into view."""
+        index = self.plan_model.index_of(key)
+        if index.isValid():
+            self.project_plan_tree.setCurrentIndex(index)
+            self.project_plan_tree.scrollTo(index)
+
+    def add_plan_item(self, kind: str, item_id: int, parent_key: Optional[PlanItemKey], values: List[str]) -> bool:
+        """Adds an entity under its parent (or at the top level) and expands the parent; False if the parent is not shown."""
+        if self.plan_model.add_node(kind, item_id, parent_key, values) is None:
+            return False
+        if parent_key is not None:
+            self.project_plan_tree.expand(self.plan_model.index_of(parent_key))
+        return True
+
+    def selected_plan_ids(self, kind: str) -> List[int]:
+        """Returns the ids of the selected tree items of the given kind."""
+        nodes = (self.plan_model.node_from_index(index) for index in self.project_plan_tree.selectionModel().selectedRows())
+        return [node.id for node in nodes if node is not None and node.kind == kind]
+
+    def patch_task_items(self, rows: List[Row[Any]]) -> None:
+        """Updates the Assigned To, Status and Due Date cells of tasks in place from (id, ..., assigned_to, status, ..., due_date) rows."""
+        for row in rows:
+            self.plan_model.set_values(
+                ("task", row.id),
+                {2: row.assigned_to or "", STATUS_COLUMN: row.status, 4: row.due_date.strftime("%Y-%m-%d") if row.due_date else "N/A"},
+            )
+
+    def show_rollups(self, rollups: PlanRollups) -> None:
+        """Shows task progress in the Status column of phases and epics and in the project summary."""
+        self.plan_model.set_rollups(rollups)
+        project_counts = rollups.project_counts()
+        if project_counts:
+            self.project_summary_label.setText(
+                f"Project progress: {format_rollup(project_counts)} — {format_rollup_breakdown(project_counts)}"
+            )
+        else:
+            self.project_summary_label.setText("Project progress: no tasks yet")
+
+    def show_critical_path(
+        self,
+        critical_task_ids: Set[int],
+        finish_date: Optional[date],
+        target_date: Optional[date],
+        working_days_late: int = 0,
+        changed: Optional[Iterable[int]] = None,
+    ) -> None:
+        """Highlights the critical tasks (only the changed ones are repainted if given) and summarises the scheduled finish."""
+        self.plan_model.set_critical_tasks(critical_task_ids, changed)
+        if finish_date is None:
+            self.critical_path_label.clear()
+            return
+        text = f"Scheduled finish: {finish_date.strftime('%Y-%m-%d')} · {len(critical_task_ids)} critical task(s) highlighted"
+        if target_date is not None and working_days_late > 0:
+            text += f" · {working_days_late} working day(s) after the target {target_date.strftime('%Y-%m-%d')}"
+        self.critical_path_label.setText(text)
@@ -1,6 +1,7 @@
 from typing import Callable
 from config import ConfigManager
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QFormLayout, QGroupBox, QLabel, QLineEdit, QPushButton
+from theme import THEMES, THEME_SETTING
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QFormLayout, QGroupBox, QLabel, QLineEdit, QPushButton, QComboBox
 
 class PropertiesTab(QWidget):
     def __init__(
@@ -8,15 +9,32 @@ class PropertiesTab(QWidget):
         parent: QWidget | None,
         config_manager: ConfigManager,
         save_properties_callback: Callable[[], None],
+        current_theme: str,
+        on_theme_changed: Callable[[str], None],
     ):
         super().__init__(parent)
         layout = QVBoxLayout(self)
         self.properties_form_layout = QFormLayout()
+        # The theme applies as soon as it is picked, so it has its own control instead of a text field
+        appearance_group = QGroupBox("Appearance")
+        appearance_layout = QFormLayout()
+        self.theme_combo = QComboBox()
+        for theme in THEMES:
+            self.theme_combo.addItem(theme.title(), userData=theme)
+        self.theme_combo.setCurrentIndex(max(self.theme_combo.findData(current_theme), 0))
+        self.theme_combo.currentIndexChanged.connect(lambda: on_theme_changed(self.theme_combo.currentData()))
+        appearance_layout.addRow("Theme:", self.theme_combo)
+        appearance_group.setLayout(appearance_layout)
+        self.properties_form_layout.addRow(appearance_group)
         self.property_inputs: dict[tuple[str, str], QLineEdit] = {}
+        theme_setting = (THEME_SETTING[0], THEME_SETTING[1].lower())
         for section in config_manager.config.sections():
+            items = [(key, value) for key, value in config_manager.config.items(section) if (section, key) != theme_setting]
+            if not items:
+                continue
             group_box = QGroupBox(section.replace('_', ' ').title())
             group_layout = QFormLayout()
-            for key, value in config_manager.config.items(section):
+            for key, value in items:
                 label = QLabel(key.replace('_', ' ').title() + ":")
                 input_field = QLineEdit(value)
                 group_layout.addRow(label, input_field)
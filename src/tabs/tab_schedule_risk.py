@@ -0,0 +1,147 @@
+from typing import Any, Callable, List, Optional, Tuple
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QSpinBox,
+    QPushButton,
+    QProgressBar,
+    QTableView,
+    QHeaderView,
+    QAbstractItemView,
+)
+from sqlalchemy import Row
+from schedule_risk import ScheduleRiskResult
+
+CRITICALITY_COLUMNS = ("Task", "Phase", "Criticality Index", "On Planned Critical Path")
+
+
+class CriticalityTableModel(QAbstractTableModel):
+    """Tasks of a simulated project, most often critical first, with their criticality index."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._rows: List[Tuple[str, str, float, bool]] = []  # name, phase, criticality, planned critical
+
+    def set_result(self, result: Optional[ScheduleRiskResult], tasks: List[Row[Any]]) -> None:
+        self.beginResetModel()
+        if result is None:
+            self._rows = []
+        else:
+            self._rows = sorted(
+                ((task.name, task.phase_name, result.criticality.get(task.id, 0.0), task.id in result.planned_critical) for task in tasks),
+                key=lambda row: (-row[2], not row[3], row[0]),
+            )
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(CRITICALITY_COLUMNS)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        name, phase_name, criticality, planned_critical = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return (name, phase_name, f"{criticality:.1%}", "Yes" if planned_critical else "")[column]
+        if role == Qt.ItemDataRole.TextAlignmentRole and column >= 2:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return CRITICALITY_COLUMNS[section]
+        return None
+
+
+class ScheduleRiskTab(QWidget):
+    def __init__(
+        self,
+        parent: QWidget | None,
+        run_simulation: Callable[[], None],
+        cancel_simulation: Callable[[], None],
+        default_iterations: int,
+    ):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        top_bar_layout = QHBoxLayout()
+        top_bar_layout.addWidget(QLabel("Iterations:"))
+        self.iterations_input = QSpinBox()
+        self.iterations_input.setRange(1000, 1_000_000)
+        self.iterations_input.setSingleStep(1000)
+        self.iterations_input.setGroupSeparatorShown(True)
+        self.iterations_input.setValue(default_iterations)
+        top_bar_layout.addWidget(self.iterations_input)
+        self.run_simulation_btn = QPushButton("Run Simulation")
+        self.run_simulation_btn.clicked.connect(run_simulation)
+        top_bar_layout.addWidget(self.run_simulation_btn)
+        self.cancel_simulation_btn = QPushButton("Cancel")
+        self.cancel_simulation_btn.setEnabled(False)
+        self.cancel_simulation_btn.clicked.connect(cancel_simulation)
+        top_bar_layout.addWidget(self.cancel_simulation_btn)
+        self.simulation_progress_bar = QProgressBar()
+        self.simulation_progress_bar.setFormat("%v of %m iterations")
+        self.simulation_progress_bar.setValue(0)
+        top_bar_layout.addWidget(self.simulation_progress_bar, stretch=1)
+        layout.addLayout(top_bar_layout)
+
+        self.risk_summary_label = QLabel(
+            "Samples every task's duration between its optimistic and pessimistic estimate many times over "
+            "to estimate the current project's finish date and how often each task ends up on the critical path."
+        )
+        self.risk_summary_label.setWordWrap(True)
+        layout.addWidget(self.risk_summary_label)
+        self.criticality_model = CriticalityTableModel(self)
+        self.criticality_view = QTableView()
+        self.criticality_view.setModel(self.criticality_model)
+        self.criticality_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.criticality_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.criticality_view.verticalHeader().setVisible(False)
+        self.criticality_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.criticality_view.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.criticality_view, stretch=1)
+
+    def iterations(self) -> int:
+        return self.iterations_input.value()
+
+    def simulation_started(self, project_name: str) -> None:
+        """Switches to the running state while the project's schedule is loaded and simulated."""
+        self.run_simulation_btn.setEnabled(False)
+        self.cancel_simulation_btn.setEnabled(True)
+        self.simulation_progress_bar.setRange(0, 0)  # Busy until the first progress report
+        self.risk_summary_label.setText(f"Simulating {project_name}...")
+
+    def show_progress(self, done: int, total: int) -> None:
+        self.simulation_progress_bar.setRange(0, total)
+        self.simulation_progress_bar.setValue(done)
+
+    def show_result(self, project_name: str, result: ScheduleRiskResult, tasks: List[Row[Any]], target_note: str) -> None:
+        """Shows the finish-date percentiles, the chance of meeting the target and the tasks by criticality."""
+        self._stopped()
+        percentiles = " · ".join(f"P{p}: {day.strftime('%Y-%m-%d')}" for p, day in result.finish_percentiles.items())
+        lines = [f"{project_name}, {result.iterations:,} iterations. Finish {percentiles}"]
+        if result.planned_finish is not None:
+            lines[0] += f" (as planned: {result.planned_finish.strftime('%Y-%m-%d')})"
+        if result.target is not None and result.on_time_probability is not None:
+            lines.append(f"Chance of finishing by {result.target.strftime('%Y-%m-%d')}{target_note}: {result.on_time_probability:.0%}")
+        else:
+            lines.append("No target date: set one on the project or a Time_Constraint under [PROJECT_CHALLENGES].")
+        self.risk_summary_label.setText("\n".join(lines))
+        self.criticality_model.set_result(result, tasks)
+        self.criticality_view.resizeColumnsToContents()
+
+    def simulation_stopped(self, message: str) -> None:
+        """Returns to the idle state after a cancelled or failed run, keeping the last result's table."""
+        self._stopped()
+        self.simulation_progress_bar.setRange(0, 1)
+        self.simulation_progress_bar.setValue(0)
+        self.risk_summary_label.setText(message)
+
+    def _stopped(self) -> None:
+        self.run_simulation_btn.setEnabled(True)
+        self.cancel_simulation_btn.setEnabled(False)
@@ -1,11 +1,169 @@
-from typing import Callable
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPlainTextEdit, QSizePolicy
+from datetime import date
+from typing import Any, Callable, List, Optional, Tuple
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QPersistentModelIndex, QSize, Qt, QTimer
+from PySide6.QtGui import QPainter, QTextDocument
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QComboBox,
+    QListView,
+    QListWidget,
+    QListWidgetItem,
+    QLineEdit,
+    QPushButton,
+    QSizePolicy,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QApplication,
+)
+from database import DailyLog, LogSearchHit
+
+LogCursor = Tuple[date, int]
+# (project_id, before, limit) -> None; the page is delivered later through DailyLogListModel.append_page
+PageRequest = Callable[[int, Optional[LogCursor], int], None]
+
+_LOG_SECTIONS = (
+    ("US Activities", "activities_us"),
+    ("India Activities", "activities_india"),
+    ("US Blockers", "blockers_us"),
+    ("India Blockers", "blockers_india"),
+    ("Decisions Made", "decisions_made"),
+    ("US Next Steps", "next_steps_us"),
+    ("India Next Steps", "next_steps_india"),
+)
+
+
+def format_daily_log(log: DailyLog) -> str:
+    """Renders one daily log as the plain-text block shown in the log list."""
+    parts: List[str] = [f"--- Log for {log.log_date.strftime('%Y-%m-%d')} (Recorded: {log.timestamp.strftime('%H:%M')}) ---"]
+    for label, attribute in _LOG_SECTIONS:
+        text = getattr(log, attribute)
+        if text:
+            parts.append(f"{label}:\n{text}")
+    return "\n".join(parts)
+
+
+class DailyLogListModel(QAbstractListModel):
+    """
+    Keyset-paginated list of one project's daily logs, newest first.
+    The view asks for more rows as it scrolls (canFetchMore/fetchMore); pages are requested
+    through request_page and arrive asynchronously via append_page. Text is only formatted
+    for the rows the view actually paints.
+    """
+
+    PAGE_SIZE = 50
+
+    def __init__(self, request_page: PageRequest, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._request_page = request_page
+        self._project_id: Optional[int] = None
+        self._logs: List[DailyLog] = []
+        self._cursor: Optional[LogCursor] = None
+        self._start: Optional[LogCursor] = None
+        self._has_more = False
+        self._fetching = False
+
+    def reset_project(self, project_id: Optional[int], start: Optional[LogCursor] = None) -> None:
+        """Clears the list and starts paging the given project's logs, optionally from a keyset cursor."""
+        self.beginResetModel()
+        self._project_id = project_id
+        self._logs = []
+        self._cursor = start
+        self._start = start
+        self._has_more = project_id is not None
+        self._fetching = False
+        self.endResetModel()
+        if self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def starts_at_cursor(self) -> bool:
+        """True when the list was started from a keyset cursor rather than the newest log."""
+        return self._start is not None
+
+    def is_empty(self) -> bool:
+        """True once a project's first page has arrived and contained no logs."""
+        return not self._logs and not self._has_more
+
+    def append_page(self, project_id: int, logs: List[DailyLog]) -> None:
+        """Appends a page delivered for request_page; pages for another project are ignored."""
+        if project_id != self._project_id:
+            return
+        self._fetching = False
+        self._has_more = len(logs) == self.PAGE_SIZE
+        if logs:
+            self.beginInsertRows(QModelIndex(), len(self._logs), len(self._logs) + len(logs) - 1)
+            self._logs.extend(logs)
+            self.endInsertRows()
+            self._cursor = (logs[-1].log_date, logs[-1].id)
+        else:
+            # Lets listeners (e.g. the empty-state label) see that paging finished
+            self.layoutChanged.emit()
+
+    def abort_fetch(self) -> None:
+        """Stops paging after a failed page request."""
+        self._fetching = False
+        self._has_more = False
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._logs)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return format_daily_log(self._logs[index.row()])
+        if role == Qt.ItemDataRole.UserRole:
+            return self._logs[index.row()].id
+        return None
+
+    def canFetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> bool:
+        return not parent.isValid() and self._project_id is not None and self._has_more and not self._fetching
+
+    def fetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> None:
+        if not self.canFetchMore(parent) or self._project_id is None:
+            return
+        self._fetching = True
+        self._request_page(self._project_id, self._cursor, self.PAGE_SIZE)
+
+
+class HtmlItemDelegate(QStyledItemDelegate):
+    """Paints an item's display text as rich text, used for search snippets with <b> highlights."""
+
+    def _document(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> QTextDocument:
+        document = QTextDocument()
+        document.setHtml(index.data(Qt.ItemDataRole.DisplayRole) or "")
+        document.setTextWidth(option.rect.width() if option.rect.width() > 0 else 400)
+        return document
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> None:
+        options = QStyleOptionViewItem(option)
+        self.initStyleOption(options, index)
+        document = self._document(options, index)
+        options.text = ""
+        style = options.widget.style() if options.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, options, painter, options.widget)
+        painter.save()
+        painter.translate(options.rect.topLeft())
+        document.drawContents(painter)
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> QSize:
+        document = self._document(option, index)
+        return QSize(int(document.idealWidth()), int(document.size().height()))
+
 
 class ViewLogsTab(QWidget):
     def __init__(
         self,
         parent: QWidget | None,
         load_daily_logs_display_callback: Callable[[], None],
+        request_log_page: PageRequest,
+        search_logs: Callable[[str], None],
+        jump_to_log: Callable[[LogSearchHit], None],
+        rebuild_search_index: Callable[[], None],
     ):
         super().__init__(parent)
         layout = QVBoxLayout(self)
@@ -16,7 +174,86 @@ class ViewLogsTab(QWidget):
         log_selection_layout.addWidget(self.log_project_combo)
         log_selection_layout.addStretch()
         layout.addLayout(log_selection_layout)
-        self.daily_logs_display = QPlainTextEdit()
-        self.daily_logs_display.setReadOnly(True)
-        self.daily_logs_display.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        layout.addWidget(self.daily_logs_display)
+        search_layout = QHBoxLayout()
+        self.log_search_input = QLineEdit()
+        self.log_search_input.setPlaceholderText("Search this project's logs (e.g. egress delta blocker)...")
+        self.log_search_input.setClearButtonEnabled(True)
+        # Search as the user types, but only once typing pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(lambda: search_logs(self.log_search_input.text().strip()))
+        self.log_search_input.textChanged.connect(lambda _text: self._search_timer.start())
+        self.log_search_input.returnPressed.connect(lambda: search_logs(self.log_search_input.text().strip()))
+        self.rebuild_search_index_btn = QPushButton("Rebuild Search Index")
+        self.rebuild_search_index_btn.clicked.connect(rebuild_search_index)
+        search_layout.addWidget(self.log_search_input, stretch=1)
+        search_layout.addWidget(self.rebuild_search_index_btn)
+        layout.addLayout(search_layout)
+        self.log_search_results = QListWidget()
+        self.log_search_results.setItemDelegate(HtmlItemDelegate(self.log_search_results))
+        self.log_search_results.setWordWrap(True)
+        self.log_search_results.setMaximumHeight(220)
+        self.log_search_results.hide()
+        self.log_search_results.itemActivated.connect(lambda item: jump_to_log(item.data(Qt.ItemDataRole.UserRole)))
+        self.log_search_results.itemClicked.connect(lambda item: jump_to_log(item.data(Qt.ItemDataRole.UserRole)))
+        layout.addWidget(self.log_search_results)
+        self.daily_logs_status_label = QLabel("No project selected or no logs available.")
+        layout.addWidget(self.daily_logs_status_label)
+        self.daily_logs_model = DailyLogListModel(request_log_page, self)
+        self.daily_logs_view = QListView()
+        self.daily_logs_view.setModel(self.daily_logs_model)
+        self.daily_logs_view.setWordWrap(True)
+        self.daily_logs_view.setAlternatingRowColors(True)
+        self.daily_logs_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.daily_logs_view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        layout.addWidget(self.daily_logs_view)
+        self.daily_logs_model.modelReset.connect(self._update_status_label)
+        self.daily_logs_model.rowsInserted.connect(self._update_status_label)
+        self.daily_logs_model.layoutChanged.connect(self._update_status_label)
+        self.daily_logs_model.rowsInserted.connect(self._select_focus_log)
+        self._focus_log_id: Optional[int] = None
+
+    def show_logs_from(self, project_id: int, hit: LogSearchHit) -> None:
+        """Restarts the log list at a search hit (the hit and older logs) and selects the hit when it arrives."""
+        self._focus_log_id = hit.log_id
+        # Keyset order is (log_date, id) descending, so (date, id + 1) is the position just before the hit
+        self.daily_logs_model.reset_project(project_id, start=(hit.log_date, hit.log_id + 1))
+
+    def _select_focus_log(self) -> None:
+        if self._focus_log_id is None:
+            return
+        for row in range(self.daily_logs_model.rowCount()):
+            index = self.daily_logs_model.index(row)
+            if index.data(Qt.ItemDataRole.UserRole) == self._focus_log_id:
+                self.daily_logs_view.setCurrentIndex(index)
+                self.daily_logs_view.scrollTo(index, QListView.ScrollHint.PositionAtTop)
+                self._focus_log_id = None
+                return
+
+    def show_search_results(self, query: str, hits: List[LogSearchHit]) -> None:
+        """Lists ranked search hits; an empty query hides the results list."""
+        self.log_search_results.clear()
+        if not query:
+            self.log_search_results.hide()
+            return
+        if not hits:
+            self.log_search_results.addItem(QListWidgetItem("No matching logs."))
+        for hit in hits:
+            item = QListWidgetItem(f"<b>{hit.log_date.strftime('%Y-%m-%d')}</b> &mdash; {hit.snippet_html}")
+            item.setData(Qt.ItemDataRole.UserRole, hit)
+            self.log_search_results.addItem(item)
+        self.log_search_results.show()
+
+    def _update_status_label(self) -> None:
+        if self.log_project_combo.currentData() is None:
+            self.daily_logs_status_label.setText("No project selected or no logs available.")
+            self.daily_logs_status_label.show()
+        elif self.daily_logs_model.is_empty():
+            self.daily_logs_status_label.setText("No daily logs found for this project.")
+            self.daily_logs_status_label.show()
+        elif self.daily_logs_model.starts_at_cursor():
+            self.daily_logs_status_label.setText("Showing logs from the selected search match; clear the search to return to the latest.")
+            self.daily_logs_status_label.show()
+        else:
+            self.daily_logs_status_label.hide()
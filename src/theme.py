@@ -0,0 +1,125 @@
+# theme.py
+import logging
+import os
+import re
+from importlib import metadata
+from typing import Dict, Optional
+
+import PySide6
+from PySide6.QtWidgets import QApplication
+
+from config import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+THEMES = ("light", "dark")
+DEFAULT_THEME = "light"
+THEME_SETTING = ("APPEARANCE", "Theme")  # config section and key of the selected theme
+STYLESHEET_CACHE_DIR = "stylesheet_cache"
+
+_URL_PATTERN = re.compile(r"url\(\s*['\"]?([^'\")]+)['\"]?\s*\)")
+_loaded: Dict[str, str] = {}  # theme -> stylesheet already read or generated in this process
+
+
+def configured_theme(config_manager: ConfigManager) -> str:
+    """
+    Returns the theme selected in the config, falling back to DEFAULT_THEME.
+
+    Args:
+        config_manager: The application's config manager.
+
+    Returns:
+        One of THEMES.
+    """
+    theme = (config_manager.get_property(*THEME_SETTING) or DEFAULT_THEME).strip().lower()
+    return theme if theme in THEMES else DEFAULT_THEME
+
+
+def stylesheet_cache_path(theme: str, cache_dir: str = STYLESHEET_CACHE_DIR) -> Optional[str]:
+    """
+    Returns the cache file for a theme's stylesheet. The name carries the qdarktheme and PySide6
+    versions, so an upgrade of either regenerates the stylesheet instead of reusing a stale one.
+
+    Args:
+        theme: One of THEMES.
+        cache_dir: Directory holding the cached stylesheets.
+
+    Returns:
+        The file path, or None when the installed qdarktheme version cannot be determined.
+    """
+    try:
+        version = metadata.version("pyqtdarktheme")
+    except metadata.PackageNotFoundError:
+        return None
+    return os.path.join(cache_dir, f"qdarktheme-{version}-pyside{PySide6.__version__}-{theme}.qss")
+
+
+def load_stylesheet(theme: str, cache_dir: str = STYLESHEET_CACHE_DIR) -> str:
+    """
+    Returns qdarktheme's stylesheet for a theme. qdarktheme renders it from templates, which is
+    slow, so a generated sheet is kept on disk and in memory, and qdarktheme itself is only
+    imported when neither copy is usable.
+
+    Args:
+        theme: One of THEMES.
+        cache_dir: Directory holding the cached stylesheets.
+
+    Returns:
+        The stylesheet text.
+
+    Raises:
+        ValueError: If theme is not one of THEMES.
+    """
+    if theme not in THEMES:
+        raise ValueError(f"Unknown theme {theme!r}; expected one of {', '.join(THEMES)}")
+    if theme in _loaded:
+        return _loaded[theme]
+    path = stylesheet_cache_path(theme, cache_dir)
+    stylesheet = _read_cached_stylesheet(path) if path is not None else None
+    if stylesheet is None:
+        import qdarktheme  # type: ignore
+
+        stylesheet = qdarktheme.load_stylesheet(theme)
+        if path is not None:
+            _write_cached_stylesheet(path, stylesheet)
+    _loaded[theme] = stylesheet
+    return stylesheet
+
+
+def apply_theme(theme: str) -> None:
+    """
+    Styles the running application with a theme's stylesheet.
+
+    Args:
+        theme: One of THEMES.
+    """
+    app = QApplication.instance()
+    if isinstance(app, QApplication):
+        app.setStyleSheet(load_stylesheet(theme))
+
+
+def _read_cached_stylesheet(path: str) -> Optional[str]:
+    """
+    Reads a cached stylesheet. The sheet refers to SVG icons that qdarktheme writes to its own
+    cache directory, so it is only used while all of those files still exist.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            stylesheet = f.read()
+    except OSError:
+        return None
+    if not stylesheet or not all(os.path.exists(icon) for icon in set(_URL_PATTERN.findall(stylesheet))):
+        return None
+    return stylesheet
+
+
+def _write_cached_stylesheet(path: str, stylesheet: str) -> None:
+    """Writes a stylesheet to the cache through a temporary file, so a crash never leaves a truncated sheet behind."""
+    temp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(stylesheet)
+        os.replace(temp_path, path)
+    except OSError as exc:
+        logger.warning("Could not cache the stylesheet at %s: %s", path, exc)
@@ -0,0 +1,108 @@
+# work_calendar.py
+from datetime import date
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from config import ConfigManager
+
+REGIONS = ("US", "India")
+WORKING_WEEKDAYS = "1111100"  # Monday..Sunday, as NumPy weekmasks spell it
+REGION_HOLIDAY_KEYS: Dict[str, str] = {
+    "US": "US_Holidays_YYYY-MM-DD",
+    "India": "India_Holidays_YYYY-MM-DD",
+}
+
+DateArray = np.ndarray  # datetime64[D] array
+DayOffsets = Union[int, Sequence[int], np.ndarray]
+
+
+def to_datetime64(dates: Iterable[date]) -> DateArray:
+    """Converts dates to a datetime64[D] array for the vectorized calendar methods."""
+    return np.array(list(dates), dtype="datetime64[D]")
+
+
+def to_dates(days: DateArray) -> List[date]:
+    """Converts a datetime64[D] array back to Python dates."""
+    return list(days.astype(object))
+
+
+class WorkCalendar:
+    """
+    Working-day arithmetic for one region (or several regions sharing work): weekends and the
+    regions' holidays are non-working days. The array methods take and return datetime64[D]
+    arrays and run in NumPy, so shifting a whole plan's dates is a single call.
+    """
+
+    def __init__(self, regions: Tuple[str, ...], holidays: FrozenSet[date], weekmask: str = WORKING_WEEKDAYS) -> None:
+        self.regions: Tuple[str, ...] = regions
+        self.holidays: FrozenSet[date] = holidays
+        self._busdaycal = np.busdaycalendar(weekmask=weekmask, holidays=to_datetime64(sorted(holidays)))
+
+    def __repr__(self) -> str:
+        return f"WorkCalendar(regions={self.regions!r}, holidays={len(self.holidays)})"
+
+    def is_working_day(self, day: date) -> bool:
+        """True if the day is neither a weekend nor one of the calendar's holidays."""
+        return bool(np.is_busday(np.datetime64(day, "D"), busdaycal=self._busdaycal))
+
+    def add_working_days(self, day: date, days: int) -> date:
+        """
+        Moves a date by a number of working days. A start on a non-working day first rolls forward
+        to the next working day, so add_working_days(saturday, 0) is the following Monday.
+        """
+        result: date = np.busday_offset(np.datetime64(day, "D"), days, roll="forward", busdaycal=self._busdaycal).astype(object)
+        return result
+
+    def working_days_between(self, start: date, end: date) -> int:
+        """Counts the working days in [start, end); negative when end is before start."""
+        return int(np.busday_count(np.datetime64(start, "D"), np.datetime64(end, "D"), busdaycal=self._busdaycal))
+
+    def offset(self, days: DateArray, offsets: DayOffsets) -> DateArray:
+        """
+        Vectorized add_working_days: moves each date in a datetime64[D] array by the matching
+        (or a single) number of working days.
+        """
+        return np.busday_offset(days, offsets, roll="forward", busdaycal=self._busdaycal)
+
+    def count(self, starts: DateArray, ends: DateArray) -> np.ndarray:
+        """Vectorized working_days_between over datetime64[D] arrays."""
+        return np.busday_count(starts, ends, busdaycal=self._busdaycal)
+
+    def working_day_mask(self, days: DateArray) -> np.ndarray:
+        """Vectorized is_working_day: a boolean array marking the working days."""
+        return np.is_busday(days, busdaycal=self._busdaycal)
+
+
+_calendars: Dict[Tuple[Tuple[str, ...], FrozenSet[date]], WorkCalendar] = {}
+
+
+def calendar_for(config_manager: ConfigManager, *regions: str) -> WorkCalendar:
+    """
+    Returns the working-day calendar for one or more regions, with the union of their [HOLIDAYS]
+    from the config; no region means all REGIONS (work shared by the US and India teams).
+    Calendars are reused until the config's holidays change.
+
+    Args:
+        config_manager: Supplies the holiday lists.
+        *regions: Region names from REGIONS.
+
+    Returns:
+        The calendar.
+
+    Raises:
+        ValueError: If a region is not one of REGIONS.
+    """
+    unknown = [region for region in regions if region not in REGION_HOLIDAY_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown region(s) {', '.join(unknown)}; expected one of {', '.join(REGIONS)}")
+    key_regions = tuple(sorted(set(regions or REGIONS), key=REGIONS.index))
+    holidays = frozenset().union(*(config_manager.get_date_set("HOLIDAYS", REGION_HOLIDAY_KEYS[region]) for region in key_regions))
+    cache_key = (key_regions, holidays)
+    calendar = _calendars.get(cache_key)
+    if calendar is None:
+        # Drop the calendar built from these regions' previous holidays
+        for stale_key in [stale_key for stale_key in _calendars if stale_key[0] == key_regions]:
+            del _calendars[stale_key]
+        calendar = _calendars[cache_key] = WorkCalendar(key_regions, holidays)
+    return calendar
@@ -0,0 +1,52 @@
+import os
+import time
+from pathlib import Path
+
+from PySide6.QtCore import QCoreApplication
+
+from config import ConfigManager
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    app = QCoreApplication.instance()
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+def test_reload_notifies_listeners_of_changed_properties(tmp_path: Path) -> None:
+    config_file = str(tmp_path / "project_config.ini")
+    reader = ConfigManager(config_file)
+    writer = ConfigManager(config_file)
+    notified = []
+    reader.add_reload_listener(notified.append)
+
+    assert reader.reload() == []
+    assert notified == []
+    writer.set_property("SIMULATION", "Iterations", "20000")
+    assert reader.reload() == [("SIMULATION", "iterations")]
+    assert notified == [[("SIMULATION", "iterations")]]
+    assert reader.get_property("SIMULATION", "Iterations") == "20000"
+
+
+def test_watch_survives_file_briefly_missing(tmp_path: Path) -> None:
+    if QCoreApplication.instance() is None:
+        QCoreApplication([])
+    config_file = str(tmp_path / "project_config.ini")
+    watched = ConfigManager(config_file, watch=True)
+    writer = ConfigManager(config_file)
+    notified = []
+    watched.add_reload_listener(notified.append)
+
+    os.rename(config_file, config_file + ".bak")
+    wait_for(lambda: False, timeout=0.3)  # The watcher drops the file while it is missing
+    os.rename(config_file + ".bak", config_file)
+    writer.set_property("SIMULATION", "Iterations", "20000")
+    assert wait_for(lambda: watched.get_property("SIMULATION", "Iterations") == "20000")
+    assert notified
+    notified.clear()
+    writer.set_property("SIMULATION", "Iterations", "30000")
+    assert wait_for(lambda: watched.get_property("SIMULATION", "Iterations") == "30000")
+    assert notified
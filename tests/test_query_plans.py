@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+
+from database import ProjectManagerDB, Task
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> ProjectManagerDB:
+    return ProjectManagerDB(f"sqlite:///{tmp_path / 'project_plan.db'}")
+
+
+def test_keyed_queries_use_indexes(db: ProjectManagerDB) -> None:
+    assert db.find_table_scans() == {}
+
+
+def test_every_keyed_query_is_explained(db: ProjectManagerDB) -> None:
+    plans = db.explain_query_plans()
+    assert plans.keys() == db._query_plan_statements().keys()
+    assert all(plans.values())
+
+
+def test_table_scan_is_reported(db: ProjectManagerDB, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Task.description has no index, so filtering on it must read the whole table
+    monkeypatch.setattr(db, "_query_plan_statements", lambda: {"unindexed": [select(Task.id).where(Task.description == "")]})
+    assert db.find_table_scans() == {"unindexed": ["SCAN tasks"]}
@@ -0,0 +1,42 @@
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import bindparam, text
+
+from database import ProjectManagerDB
+
+ROLLUP_OBJECTS = ("epic_task_rollups", "tasks_rollup_ad", "tasks_rollup_ai", "tasks_rollup_au")
+
+
+def rollup_objects(db: ProjectManagerDB) -> list[str]:
+    with db.engine.connect() as connection:
+        names = text("SELECT name FROM sqlite_master WHERE name IN :names").bindparams(bindparam("names", expanding=True))
+        return sorted(connection.scalars(names, {"names": ROLLUP_OBJECTS}))
+
+
+def build_project(db: ProjectManagerDB) -> int:
+    project = db.create_project("Alpha", date(2026, 1, 5), date(2026, 8, 31))
+    phase = db.add_phase(project.id, "Phase 1", "")
+    epic = db.add_epic(phase.id, "Epic 1", "")
+    db.add_task(epic.id, "Design", "", "")
+    db.add_task(epic.id, "Build", "", "", status="In Progress")
+    return project.id
+
+
+def test_rollups_are_maintained_by_default(tmp_path: Path) -> None:
+    db = ProjectManagerDB(f"sqlite:///{tmp_path / 'project_plan.db'}")
+    project_id = build_project(db)
+    assert db.rollups_maintained
+    assert rollup_objects(db) == sorted(ROLLUP_OBJECTS)
+    assert db.get_status_rollups(project_id).project_counts() == {"To Do": 1, "In Progress": 1}
+
+
+def test_opting_out_drops_the_rollup_table_and_triggers(tmp_path: Path) -> None:
+    url = f"sqlite:///{tmp_path / 'project_plan.db'}"
+    project_id = build_project(ProjectManagerDB(url))
+
+    db = ProjectManagerDB(url, maintain_rollups=False)
+
+    assert not db.rollups_maintained
+    assert rollup_objects(db) == []
+    assert db.get_status_rollups(project_id).project_counts() == {"To Do": 1, "In Progress": 1}